@@ -0,0 +1,147 @@
+"""Benchmark tree build and dispatch with trace points off, unguarded and on.
+
+Usage::
+
+    python benchmarks/bench_build.py [--groups 10] [--leaves 99] [--args 3]
+        [--root-flags 0] [--dispatches 200] [--repeat 3]
+
+A tree of ``1 + groups * (1 + leaves)`` nodes (1,000 by default), each
+leaf with ``--args`` options and the root with ``--root-flags`` global
+options (propagated to every node), is built, then one leaf is dispatched
+``--dispatches`` times. Each case is timed with clak debug records
+disabled (the default), with the trace guards forced on while records are
+still dropped (the cost every build paid before trace points: message
+arguments such as full parser names computed for nothing), and with
+records enabled into a :class:`logging.NullHandler`.
+"""
+
+import argparse
+import contextlib
+import logging
+import time
+from unittest import mock
+
+from clak import Argument, Command, Parser
+from clak.runtime.tracing import TracePoint
+
+
+def make_app(groups, leaves, args, root_flags=0):
+    """Root parser class of a tree with *groups* groups of *leaves* leaves.
+
+    The root gets *root_flags* global options, propagated to every node.
+    """
+
+    def leaf_cls(name):
+        attrs = {"__doc__": f"Leaf {name}", "cli_run": lambda self, **_: None}
+        for idx in range(args):
+            attrs[f"opt{idx}"] = Argument(f"--opt{idx}", help=f"Option {idx}")
+        return type(f"Leaf_{name}", (Parser,), attrs)
+
+    def group_cls(name):
+        attrs = {"__doc__": f"Group {name}"}
+        for idx in range(leaves):
+            key = f"cmd{idx}"
+            attrs[key] = Command(leaf_cls(f"{name}_{key}"), help=f"Command {key}")
+        return type(f"Group_{name}", (Parser,), attrs)
+
+    attrs = {"__doc__": "Benchmark app"}
+    for idx in range(root_flags):
+        attrs[f"global{idx}"] = Argument(f"--global{idx}", help=f"Global {idx}")
+    for idx in range(groups):
+        key = f"group{idx}"
+        attrs[key] = Command(group_cls(key), help=f"Group {key}")
+    return type("App", (Parser,), attrs)
+
+
+@contextlib.contextmanager
+def clak_logging(level):
+    "Set the clak loggers to *level*, records going nowhere"
+    clak_logger = logging.getLogger("clak")
+    saved = clak_logger.level, clak_logger.propagate, list(clak_logger.handlers)
+    clak_logger.setLevel(level)
+    clak_logger.propagate = False
+    clak_logger.handlers = [logging.NullHandler()]
+    try:
+        yield
+    finally:
+        clak_logger.setLevel(saved[0])
+        clak_logger.propagate = saved[1]
+        clak_logger.handlers = saved[2]
+
+
+@contextlib.contextmanager
+def unguarded():
+    "Evaluate trace arguments whatever the level, as plain logger calls did"
+    with mock.patch.object(TracePoint, "__bool__", lambda self: True):
+        with mock.patch.object(TracePoint, "enabled", True):
+            yield
+
+
+def best_time(func, repeat):
+    """Best wall time (seconds) of *repeat* calls of *func*."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def run_case(app_cls, argv, repeat, dispatches):
+    """Best (build, dispatch) times in seconds."""
+    apps = []
+
+    def build():
+        apps.append(app_cls(parse=False))
+
+    build_time = best_time(build, repeat)
+    app = apps[-1]
+
+    def dispatch():
+        for _ in range(dispatches):
+            app.dispatch(argv)
+
+    dispatch_time = best_time(dispatch, repeat) / dispatches
+    return build_time, dispatch_time
+
+
+def main(argv=None):
+    "Run the benchmark and print one line per case"
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--groups", type=int, default=10)
+    parser.add_argument("--leaves", type=int, default=99)
+    parser.add_argument("--args", type=int, default=3, help="options per leaf")
+    parser.add_argument("--root-flags", type=int, default=0)
+    parser.add_argument("--dispatches", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    app_cls = make_app(args.groups, args.leaves, args.args, args.root_flags)
+    nodes = 1 + args.groups * (1 + args.leaves)
+    app_argv = ["group0", "cmd0", "--opt0", "value"]
+
+    cases = {}
+    with clak_logging(logging.WARNING):
+        cases["off"] = run_case(app_cls, app_argv, args.repeat, args.dispatches)
+        with unguarded():
+            cases["unguarded"] = run_case(
+                app_cls, app_argv, args.repeat, args.dispatches
+            )
+    with clak_logging(logging.DEBUG):
+        cases["on"] = run_case(app_cls, app_argv, args.repeat, args.dispatches)
+
+    print(
+        f"{nodes} nodes, {args.args} options per leaf, "
+        f"{args.root_flags} global options"
+    )
+    print(f"{'trace':>10} {'build ms':>10} {'dispatch us':>12}")
+    for name, (build, dispatch) in cases.items():
+        print(f"{name:>10} {build * 1e3:10.1f} {dispatch * 1e6:12.1f}")
+    for idx, label in enumerate(("build", "dispatch")):
+        off, old = cases["off"][idx], cases["unguarded"][idx]
+        print(f"{label}: {(old - off) / old:.1%} less time than unguarded")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Benchmark config file loading, parsed versus read from the config cache.
+
+Usage::
+
+    python benchmarks/bench_config.py [--sizes 100,1000,5000] [--repeat 3]
+        [--backends python,libyaml]
+
+Each case writes a YAML config of about *size* KiB (nested mappings and
+lists of services), then times a plain :func:`load_config_file`, a cold
+:func:`load_config_cached` (parse and write the cache entry) and a warm
+one (``stat`` and unpickle), per YAML backend.
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from clak.comp.config import load_config_cached, load_config_file
+from clak.views.serializers import (
+    CLAK_SERIALIZER_BACKEND_ENV,
+    get_serializer,
+    serializer_backends,
+)
+
+
+def _services(count):
+    return {
+        f"service-{idx:06d}": {
+            "image": f"registry.local/app-{idx % 97}:1.{idx % 13}",
+            "replicas": idx % 5 + 1,
+            "enabled": idx % 3 != 0,
+            "ports": [8000 + idx % 100, 9000 + idx % 50],
+            "env": {"LOG_LEVEL": "info", "REGION": f"zone-{idx % 4}"},
+        }
+        for idx in range(count)
+    }
+
+
+def make_config(size_kib):
+    """YAML text of about *size_kib* KiB."""
+    dump = get_serializer("yaml").dump
+    sample = len(dump({"services": _services(100)})) / 100
+    count = max(int(size_kib * 1024 / sample), 1)
+    return dump({"version": 3, "services": _services(count)})
+
+
+def best_time(func, repeat, setup=None):
+    """Best wall time (seconds) of *repeat* calls of *func*."""
+    best = None
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def bench(path, cache_dir, repeat):
+    """Seconds for parse, cold cache and warm cache loads of *path*."""
+
+    def clear():
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+    parse_s = best_time(lambda: load_config_file(path), repeat)
+    cold_s = best_time(lambda: load_config_cached(path, cache_dir), repeat, clear)
+    load_config_cached(path, cache_dir)
+    warm_s = best_time(lambda: load_config_cached(path, cache_dir), repeat)
+    return parse_s, cold_s, warm_s
+
+
+def main():
+    "Run the benchmark matrix and print one line per case"
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="100,1000,5000")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--backends", default=",".join(serializer_backends("yaml")))
+    args = parser.parse_args()
+
+    sizes = [int(part) for part in args.sizes.split(",") if part]
+    backends = [part for part in args.backends.split(",") if part]
+    unknown = set(backends) - set(serializer_backends("yaml"))
+    if unknown:
+        parser.error(f"unknown or missing backends: {sorted(unknown)}")
+
+    print(
+        f"{'KiB':>6}  {'backend':<8} {'parse':>9} {'cold':>9} {'warm':>9} "
+        f"{'speedup':>8}"
+    )
+    workdir = tempfile.mkdtemp(prefix="clak-bench-config-")
+    previous = os.environ.get(CLAK_SERIALIZER_BACKEND_ENV)
+    try:
+        for size in sizes:
+            path = os.path.join(workdir, f"config-{size}.yaml")
+            with open(path, "w", encoding="utf-8") as handle:
+                handle.write(make_config(size))
+            # Files modified in the last seconds are not cached
+            past = time.time_ns() - 60 * 1_000_000_000
+            os.utime(path, ns=(past, past))
+            for backend in backends:
+                os.environ[CLAK_SERIALIZER_BACKEND_ENV] = (
+                    "python" if backend == "python" else "auto"
+                )
+                cache_dir = os.path.join(workdir, f"cache-{backend}")
+                parse_s, cold_s, warm_s = bench(path, cache_dir, args.repeat)
+                print(
+                    f"{os.path.getsize(path) // 1024:>6}  {backend:<8} "
+                    f"{parse_s:>9.4f} {cold_s:>9.4f} {warm_s:>9.4f} "
+                    f"{parse_s / warm_s if warm_s else 0:>7.1f}x"
+                )
+    finally:
+        if previous is None:
+            os.environ.pop(CLAK_SERIALIZER_BACKEND_ENV, None)
+        else:
+            os.environ[CLAK_SERIALIZER_BACKEND_ENV] = previous
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+"""Benchmark repeated dispatch with logging options, incremental vs dictConfig.
+
+Usage::
+
+    python benchmarks/bench_logging.py [--dispatches 2000] [--repeat 3]
+        [--argv="-vv run"] [--colors] [--records 20000] [--sample 10/s]
+
+A small app (``LoggingOptMixin`` root and one subcommand) is dispatched
+``--dispatches`` times in a row, as batch jobs, REPLs or test suites do.
+Each run reports the time per dispatch when :func:`get_app_logger`
+reconfigures logging incrementally (the default) and when it runs
+``logging.config.dictConfig`` on every call, then the time of the
+:func:`get_app_logger` call alone. With ``-vv`` most of the remaining
+dispatch time is spent emitting clak's own debug records.
+
+The last lines time a chatty command logging ``--records`` debug records
+in a loop with ``-vvv`` to ``/dev/null``, without and with
+``--log-sample``.
+"""
+
+import argparse
+import contextlib
+import functools
+import io
+import logging
+import os
+import shlex
+import time
+
+from clak import Argument, Command, Parser
+from clak.comp import logging as logging_plugin
+from clak.comp.logging import LoggingOptMixin
+
+
+class Run(Parser):
+    "Do nothing"
+
+    def cli_run(self, **_):
+        self.logger.debug("run")
+
+
+class Chatty(Parser):
+    "Log one debug record per item"
+
+    records = Argument("--records", type=int, default=1000)
+
+    def cli_run(self, records=1000, **_):
+        for idx in range(records):
+            self.logger.debug("Processed item %d", idx)
+
+
+class App(LoggingOptMixin, Parser):
+    "Benchmark app"
+
+    class Meta:
+        log_prefix = "bench"
+
+    run = Command(Run, help="Do nothing")
+    chatty = Command(Chatty, help="Log one debug record per item")
+
+
+@contextlib.contextmanager
+def dictconfig_each_call():
+    "Make the logging hook rebuild everything, as before incremental updates"
+    original = logging_plugin.get_app_logger
+    logging_plugin.get_app_logger = functools.partial(original, incremental=False)
+    try:
+        yield
+    finally:
+        logging_plugin.get_app_logger = original
+
+
+def bench(argv, dispatches, repeat):
+    """Best time per dispatch (seconds) of *dispatches* dispatches of *argv*."""
+    app = App(parse=False)
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(dispatches):
+            app.dispatch(argv)
+        elapsed = (time.perf_counter() - start) / dispatches
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def bench_reconfigure(colors, calls, repeat, incremental):
+    """Best time (seconds) of one :func:`get_app_logger` call, as ``-vv`` does."""
+    loggers = {
+        "": {"level": logging.WARNING},
+        "clak": {"level": logging.DEBUG},
+        "bench": {"level": logging.DEBUG},
+    }
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            logging_plugin.get_app_logger(
+                loggers=loggers,
+                level=logging.NOTSET,
+                colors=colors,
+                incremental=incremental,
+            )
+        elapsed = (time.perf_counter() - start) / calls
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def bench_chatty(records, sample, repeat):
+    """Best time (seconds) of a command logging *records* debug records."""
+    argv = ["--no-log-colors", "-vvv"]
+    if sample:
+        argv += ["--log-sample", sample]
+    argv += ["chatty", "--records", str(records)]
+    app = App(parse=False)
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        app.dispatch(argv)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    logging_plugin.summarize_log_rate_limits()
+    return best
+
+
+def _line(label, old, new):
+    print(
+        f"{label:>24}: {old * 1e6:10.1f} -> {new * 1e6:8.1f} us"
+        f"  ({old / new:.1f}x faster)"
+    )
+
+
+def main(argv=None):
+    "Run the benchmark and print one line per mode"
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dispatches", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--argv", default="-vv run", help="dispatched arguments")
+    parser.add_argument("--colors", action="store_true", help="colored log format")
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--sample", default="10/s", help="--log-sample rate")
+    args = parser.parse_args(argv)
+
+    app_argv = shlex.split(args.argv)
+    app_argv.insert(0, "--log-colors" if args.colors else "--no-log-colors")
+    # Keep debug records off the terminal: they would dominate the timings
+    with contextlib.redirect_stderr(io.StringIO()):
+        incremental = bench(app_argv, args.dispatches, args.repeat)
+        with dictconfig_each_call():
+            full = bench(app_argv, args.dispatches, args.repeat)
+        config_times = [
+            bench_reconfigure(args.colors, args.dispatches, args.repeat, mode)
+            for mode in (False, True)
+        ]
+    # A real file: the cost of each write is part of what sampling saves
+    with open(os.devnull, "w", encoding="utf-8") as devnull:
+        with contextlib.redirect_stderr(devnull):
+            chatty = [
+                bench_chatty(args.records, sample, args.repeat)
+                for sample in (None, args.sample)
+            ]
+    logging.shutdown()
+
+    print(f"argv: {shlex.join(app_argv)}, {args.dispatches} dispatches")
+    print("dictConfig -> incremental")
+    _line("dispatch", full, incremental)
+    _line("get_app_logger", *config_times)
+    print(f"{args.records} debug records, unlimited -> --log-sample {args.sample}")
+    _line("chatty command", *chatty)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Benchmark memory per node and ctx attribute access.
+
+Usage::
+
+    python benchmarks/bench_memory.py [--groups 10] [--leaves 99] [--args 3]
+        [--root-flags 0] [--number 200000]
+
+Builds the tree of ``bench_build.py`` (1,000 nodes by default) under
+:mod:`tracemalloc` and reports the bytes allocated per node, with the
+share of the per-node objects clak creates (``HelpArg`` records, the
+dispatcher and terminator) and the argparse actions of all parsers, with
+``--root-flags`` global options propagated from the root. Then times attribute reads and writes on the
+``ctx`` and ``ctx.args`` of one dispatch, as hooks and commands do.
+"""
+
+import argparse
+import sys
+import time
+import timeit
+import tracemalloc
+
+from bench_build import make_app
+
+
+def deep_size(obj):
+    """Size of *obj* and its ``__dict__``, if any."""
+    size = sys.getsizeof(obj)
+    attrs = getattr(obj, "__dict__", None)
+    if attrs is not None:
+        size += sys.getsizeof(attrs)
+    return size
+
+
+def measure_build(app_cls):
+    """(app, bytes allocated while building it)"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    app = app_cls(parse=False)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    used = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return app, used
+
+
+def per_node_objects(app):
+    """Bytes held by clak per-node records, by kind (shared ones once)."""
+    sizes = {"HelpArg": 0, "Dispatcher": 0, "Terminator": 0}
+    help_args = {
+        id(arg): arg for node in app.registry.values() for arg in node.help_args
+    }
+    sizes["HelpArg"] = sum(deep_size(arg) for arg in help_args.values())
+    for node in app.registry.values():
+        sizes["Dispatcher"] += deep_size(node.dispatcher)
+        sizes["Terminator"] += deep_size(node.terminator)
+    return sizes
+
+
+def time_ctx(app, argv, number):
+    """Nanoseconds per ctx attribute operation."""
+    app.dispatch(argv)
+    ctx = app.dispatcher.ctx
+    stmts = {
+        "ctx.cli_index": "ctx.cli_index",
+        "ctx.cli_index = 1": "ctx.cli_index = 1",
+        "ctx.args.opt0": "ctx.args.opt0",
+        "ctx.args.missing": "ctx.args.missing",
+    }
+    return {
+        label: min(timeit.repeat(stmt, globals={"ctx": ctx}, number=number, repeat=5))
+        / number
+        for label, stmt in stmts.items()
+    }
+
+
+def main(argv=None):
+    "Run the benchmark and print the results"
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--groups", type=int, default=10)
+    parser.add_argument("--leaves", type=int, default=99)
+    parser.add_argument("--args", type=int, default=3, help="options per leaf")
+    parser.add_argument("--root-flags", type=int, default=0)
+    parser.add_argument("--number", type=int, default=200000)
+    args = parser.parse_args(argv)
+
+    app_cls = make_app(args.groups, args.leaves, args.args, args.root_flags)
+    start = time.perf_counter()
+    app, used = measure_build(app_cls)
+    elapsed = time.perf_counter() - start
+    nodes = len(app.registry)
+    help_args = [arg for node in app.registry.values() for arg in node.help_args]
+    actions = [act for node in app.registry.values() for act in node.parser._actions]
+
+    print(f"{nodes} nodes, built in {elapsed * 1e3:.0f} ms (traced)")
+    print(f"{len(help_args)} HelpArg records, {len(set(map(id, help_args)))} distinct")
+    print(f"{len(actions)} argparse actions, {len(set(map(id, actions)))} distinct")
+    print(f"{'built tree':>20}: {used / nodes:10.0f} bytes per node")
+    for kind, size in per_node_objects(app).items():
+        print(f"{kind:>20}: {size / nodes:10.0f} bytes per node")
+
+    timings = time_ctx(app, ["group0", "cmd0", "--opt0", "value"], args.number)
+    for label, seconds in timings.items():
+        print(f"{label:>20}: {seconds * 1e9:10.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Benchmark structured dump/load time versus payload size, per backend.
+
+Usage::
+
+    python benchmarks/bench_serializers.py [--rows 1000,10000,100000]
+        [--formats json,yaml] [--repeat 3]
+
+Each case dumps a list of records (indented, then one compact line per
+record for json, like ndjson output) and loads the indented text back,
+with every installed backend of the format (see
+``clak.views.serializers.serializer_backends``).
+"""
+
+import argparse
+import time
+
+from clak.views.serializers import (
+    BUILTIN_SERIALIZERS,
+    get_serializer,
+    serializer_backends,
+)
+
+
+def make_records(count):
+    """Synthetic records: ints, short strings, a float, a nested list."""
+    return [
+        {
+            "id": idx,
+            "name": f"service-{idx % 97:02d}",
+            "state": ("running", "stopped", "failed")[idx % 3],
+            "load": idx / 7,
+            "tags": ["web", f"zone-{idx % 5}"],
+        }
+        for idx in range(count)
+    ]
+
+
+def best_time(func, repeat):
+    """Best wall time (seconds) of *repeat* calls; also return the last result."""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def bench(records, fmt, backend, repeat):
+    """Seconds for dump, per-record dump (json only) and load."""
+    serializer = get_serializer(fmt, backend=backend)
+    dump_s, text = best_time(lambda: serializer.dump(records, indent=2), repeat)
+    lines_s = None
+    if fmt == "json":
+        lines_s, _ = best_time(
+            lambda: [
+                serializer.dump(record, indent=None, compact=True) for record in records
+            ],
+            repeat,
+        )
+    load_s, _ = best_time(lambda: serializer.load(text), repeat)
+    return dump_s, lines_s, load_s
+
+
+def main():
+    "Run the benchmark matrix and print one line per case"
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", default="1000,10000,100000")
+    parser.add_argument("--formats", default="json,yaml")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    counts = [int(part) for part in args.rows.split(",") if part]
+    formats = [part for part in args.formats.split(",") if part]
+    unknown = set(formats) - BUILTIN_SERIALIZERS
+    if unknown:
+        parser.error(f"unknown formats: {sorted(unknown)}")
+
+    print(
+        f"{'rows':>8}  {'format':<6} {'backend':<8} "
+        f"{'dump':>9} {'lines':>9} {'load':>9}"
+    )
+    for count in counts:
+        records = make_records(count)
+        for fmt in formats:
+            for backend in serializer_backends(fmt):
+                dump_s, lines_s, load_s = bench(records, fmt, backend, args.repeat)
+                lines = "-" if lines_s is None else f"{lines_s:.4f}"
+                print(
+                    f"{count:>8}  {fmt:<6} {backend:<8} "
+                    f"{dump_s:>9.4f} {lines:>9} {load_s:>9.4f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark table rendering time versus row count, per table backend.
+
+Usage::
+
+    python benchmarks/bench_table_render.py [--rows 1000,10000,100000]
+        [--backends native,prettytable] [--repeat 3] [--term-width 100]
+
+Each case renders a ListView-shaped payload through ``TableListFormatter``
+with ``width=fit`` on a virtual terminal, so the wrap path is exercised.
+"""
+
+import argparse
+import time
+
+from clak.views.table_formatter import TABLE_BACKENDS, TableListFormatter
+
+
+def make_rows(count):
+    """Synthetic rows: short ids, medium names, one long free-text column."""
+    return [
+        {
+            "id": idx,
+            "name": f"service-{idx % 97:02d}",
+            "state": ("running", "stopped", "failed")[idx % 3],
+            "note": "lorem ipsum dolor sit amet " * (1 + idx % 4),
+        }
+        for idx in range(count)
+    ]
+
+
+def bench(rows, backend, repeat, term_width):
+    """Best wall time (seconds) of *repeat* renders."""
+    formatter = TableListFormatter()
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        formatter.render(
+            rows,
+            table_backend=backend,
+            sort_columns=["id"],
+            width="fit",
+            term_width=term_width,
+            stdout_tty=True,
+        )
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    "Run the benchmark matrix and print one line per case"
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", default="1000,10000,100000")
+    parser.add_argument("--backends", default="native,prettytable")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--term-width", type=int, default=100)
+    args = parser.parse_args()
+
+    counts = [int(part) for part in args.rows.split(",") if part]
+    backends = [part for part in args.backends.split(",") if part]
+    unknown = set(backends) - TABLE_BACKENDS
+    if unknown:
+        parser.error(f"unknown backends: {sorted(unknown)}")
+
+    print(f"{'rows':>8}  {'backend':<12} {'seconds':>9}  {'rows/s':>10}")
+    for count in counts:
+        rows = make_rows(count)
+        for backend in backends:
+            seconds = bench(rows, backend, args.repeat, args.term_width)
+            print(
+                f"{count:>8}  {backend:<12} {seconds:>9.4f}  "
+                f"{count / seconds if seconds else 0:>10.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,373 @@
+"""Benchmark every view of ``clak.views`` and write the results as JSON.
+
+Usage::
+
+    python benchmarks/bench_views.py [--rows 10,1000,100000] [--columns 1,10,200]
+        [--views list,show,data,...] [--formats view,csv,json,...]
+        [--widths content,fit,terminal] [--wraps last,all,first]
+        [--colors plain,color] [--repeat 3] [--max-cells 1000000]
+        [--no-memory] [--output results.json]
+        [--baseline previous.json] [--fail-over 1.25]
+
+Synthetic payloads of *rows* x *columns* cells (ints, repeated states,
+floats, booleans and a free-text column that wraps) are rendered by each
+view, for each output format, table ``width`` / ``wrap`` mode and colored
+vs plain output, on a virtual 120-column terminal. Options that do not
+apply to a view are not multiplied out: text views have no width modes,
+machine formats are never colored. Cases larger than ``--max-cells`` are
+skipped (``--rows 1000000`` needs a higher limit).
+
+Each result records the best wall time of ``--repeat`` renders, the time
+to the first byte written to the output sink (close to the total time for
+views that render before writing), the output size and the peak Python
+memory traced by :mod:`tracemalloc` during one more render.
+
+With ``--baseline``, results of a previous run are matched case by case and
+each result gets the baseline time and ``ratio`` (new / old); ``--fail-over``
+makes the script exit with status 1 when a ratio exceeds it, so a slower
+wrap fitting (``_apply_column_wrap``) or YAML dump shows up in CI.
+"""
+
+import argparse
+import contextlib
+import itertools
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from importlib import metadata
+
+from clak.exception import ClakUserError
+from clak.views import (
+    CompositeView,
+    DataView,
+    ListView,
+    MarkdownView,
+    PprintView,
+    RawView,
+    RstView,
+    ShowView,
+)
+from clak.views.base import OUTPUT_FORMATS, TEXT_FORMATS, WIDTH_MODES, WRAP_MODES
+from clak.views.data import DATA_FORMATS
+from clak.views.sink import OutputSink, output_to
+
+TERM_WIDTH = 120
+CASE_KEYS = ("view", "payload", "rows", "columns", "format", "width", "wrap", "colors")
+COLOR_MODES = ("plain", "color")
+
+
+def make_records(rows, columns):
+    """Synthetic records of *columns* fields, cycling through cell kinds."""
+    kinds = [
+        lambda idx: idx,
+        lambda idx: ("running", "stopped", "failed")[idx % 3],
+        lambda idx: idx / 7,
+        lambda idx: idx % 2 == 0,
+        lambda idx: "lorem ipsum dolor sit amet " * (1 + idx % 4),
+    ]
+    fields = [(f"c{col:03d}", kinds[col % len(kinds)]) for col in range(columns)]
+    return [{name: kind(idx) for name, kind in fields} for idx in range(rows)]
+
+
+def _text_lines(records):
+    return [" | ".join(str(value) for value in record.values()) for record in records]
+
+
+def _markdown_table(records):
+    header = list(records[0]) if records else ["empty"]
+    lines = ["| " + " | ".join(header) + " |", "|" + "---|" * len(header)]
+    lines.extend(f"| {line} |" for line in _text_lines(records))
+    return "\n".join(lines)
+
+
+# View name -> payload built from the synthetic records
+PAYLOADS = {
+    "list": lambda records: records,
+    "show": lambda records: {
+        f"field{idx:07d}": line for idx, line in enumerate(_text_lines(records))
+    },
+    "data": lambda records: records,
+    "pprint": lambda records: records,
+    "raw": lambda records: "\n".join(_text_lines(records)),
+    "markdown": _markdown_table,
+    "rst": lambda records: "\n".join(f"- {line}" for line in _text_lines(records)),
+    "composite": lambda records: [
+        ("summary", ShowView({"rows": len(records)})),
+        ("items", ListView(records)),
+    ],
+}
+
+VIEWS = {
+    "list": ListView,
+    "show": ShowView,
+    "data": DataView,
+    "pprint": PprintView,
+    "raw": RawView,
+    "markdown": MarkdownView,
+    "rst": RstView,
+    "composite": CompositeView,
+}
+TABLE_VIEWS = frozenset({"list", "show", "composite"})
+
+
+def view_formats(view):
+    """Output formats of *view*; None for views without a format setting."""
+    if view in TABLE_VIEWS:
+        return sorted(OUTPUT_FORMATS)
+    if view == "data":
+        return sorted(DATA_FORMATS)
+    if view in ("markdown", "rst"):
+        return sorted(TEXT_FORMATS)
+    return [None]
+
+
+def _colorable(view, fmt):
+    if view in TABLE_VIEWS:
+        return fmt == "view"
+    if view == "data":
+        return fmt in ("json", "yaml")
+    return view == "markdown" and fmt == "view"
+
+
+def iter_cases(args):
+    """Yield one dict per benchmark case (see ``CASE_KEYS``)."""
+    sizes = itertools.product(args.rows, args.columns, args.views)
+    for rows, columns, view in sizes:
+        payloads = ["list", "stream"] if view == "list" else ["list"]
+        for fmt, payload in itertools.product(view_formats(view), payloads):
+            if args.formats and fmt is not None and fmt not in args.formats:
+                continue
+            widths = [None]
+            if view in TABLE_VIEWS and fmt == "view":
+                widths = args.widths
+            colors = args.colors if _colorable(view, fmt) else ["plain"]
+            for width, color in itertools.product(widths, colors):
+                wraps = [None] if width in (None, "content") else args.wraps
+                for wrap in wraps:
+                    yield {
+                        "view": view,
+                        "payload": payload,
+                        "rows": rows,
+                        "columns": columns,
+                        "format": fmt,
+                        "width": width,
+                        "wrap": wrap,
+                        "colors": color,
+                    }
+
+
+def case_settings(case):
+    """View render settings of *case*."""
+    settings = {"term_width": TERM_WIDTH, "stdout_tty": True}
+    if case["format"] is not None:
+        settings["format"] = case["format"]
+    if case["width"] is not None:
+        settings["width"] = case["width"]
+    if case["wrap"] is not None:
+        settings["wrap"] = case["wrap"]
+    colored = case["colors"] == "color"
+    if case["view"] in TABLE_VIEWS:
+        settings["clak_colors"] = colored
+    elif case["view"] == "data":
+        settings["color"] = colored
+    return settings
+
+
+@contextlib.contextmanager
+def color_backend(case):
+    """Markdown picks rich or plain text from ``CLAK_COLOR_BACKEND``."""
+    if case["view"] != "markdown":
+        yield
+        return
+    previous = os.environ.get("CLAK_COLOR_BACKEND")
+    os.environ["CLAK_COLOR_BACKEND"] = "rich" if case["colors"] == "color" else "none"
+    try:
+        yield
+    finally:
+        if previous is None:
+            os.environ.pop("CLAK_COLOR_BACKEND", None)
+        else:
+            os.environ["CLAK_COLOR_BACKEND"] = previous
+
+
+class MeasureSink(OutputSink):
+    """Discard output, keeping its size and the time of the first write."""
+
+    def __init__(self, start):
+        super().__init__()
+        self.start = start
+        self.first_byte = None
+        self.size = 0
+
+    def writelines(self, chunks) -> None:
+        for chunk in chunks:
+            if chunk and self.first_byte is None:
+                self.first_byte = time.perf_counter() - self.start
+            self.size += len(chunk)
+
+
+def render_once(case, records):
+    """Render *case* once into a :class:`MeasureSink`; return it and the time."""
+    payload = PAYLOADS[case["view"]](records)
+    if case["payload"] == "stream":
+        payload = iter(payload)
+    view = VIEWS[case["view"]](payload)
+    start = time.perf_counter()
+    sink = MeasureSink(start)
+    with output_to(sink):
+        view.render(**case_settings(case))
+    return sink, time.perf_counter() - start
+
+
+def bench(case, records, repeat, memory):
+    """Measurements of *case*: best time, first byte, size, peak memory."""
+    best = None
+    for _ in range(repeat):
+        sink, seconds = render_once(case, records)
+        if best is None or seconds < best[1]:
+            best = (sink, seconds)
+    sink, seconds = best
+    result = {
+        "seconds": round(seconds, 6),
+        "first_byte_seconds": (
+            None if sink.first_byte is None else round(sink.first_byte, 6)
+        ),
+        "output_chars": sink.size,
+        "peak_memory_bytes": None,
+    }
+    if memory:
+        tracemalloc.start()
+        try:
+            render_once(case, records)
+            result["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def case_id(case):
+    "Hashable identity of a case, to match results across runs"
+    return tuple(case.get(key) for key in CASE_KEYS)
+
+
+def compare(results, baseline_path):
+    """Add ``baseline_seconds`` and ``ratio`` from a previous JSON report."""
+    with open(baseline_path, encoding="utf-8") as handle:
+        baseline = {case_id(result): result for result in json.load(handle)["results"]}
+    ratios = []
+    for result in results:
+        old = baseline.get(case_id(result), {}).get("seconds")
+        if not old or result.get("seconds") is None:
+            continue
+        result["baseline_seconds"] = old
+        result["ratio"] = round(result["seconds"] / old, 3)
+        ratios.append(result["ratio"])
+    return ratios
+
+
+def environment():
+    "Interpreter and library versions the results were measured with"
+    versions = {}
+    for name in ("prettytable", "wcwidth", "PyYAML", "orjson", "rich", "docutils"):
+        try:
+            versions[name] = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            continue
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "packages": versions,
+        "term_width": TERM_WIDTH,
+    }
+
+
+def _split(value, choices=None, convert=str):
+    items = [convert(part) for part in value.split(",") if part]
+    if choices is not None:
+        unknown = set(items) - set(choices)
+        if unknown:
+            raise argparse.ArgumentTypeError(
+                f"unknown values {sorted(unknown)}, choose from {sorted(choices)}"
+            )
+    return items
+
+
+def parse_args(argv=None):
+    "Command line options"
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add = parser.add_argument
+    add("--rows", default="10,1000,100000", type=lambda v: _split(v, convert=int))
+    add("--columns", default="1,10,200", type=lambda v: _split(v, convert=int))
+    add("--views", default=",".join(VIEWS), type=lambda v: _split(v, VIEWS))
+    all_formats = OUTPUT_FORMATS | DATA_FORMATS | TEXT_FORMATS
+    add("--formats", default="", type=lambda v: _split(v, all_formats))
+    add(
+        "--widths",
+        default="content,fit,terminal",
+        type=lambda v: _split(v, WIDTH_MODES),
+    )
+    add("--wraps", default="last,all,first", type=lambda v: _split(v, WRAP_MODES))
+    add("--colors", default="plain,color", type=lambda v: _split(v, COLOR_MODES))
+    add("--repeat", type=int, default=3)
+    add("--max-cells", type=int, default=1_000_000)
+    add("--no-memory", action="store_true", help="skip the tracemalloc render")
+    add("--output", help="write the JSON report here instead of stdout")
+    add("--baseline", help="JSON report of a previous run to compare with")
+    add("--fail-over", type=float, help="exit 1 if a time ratio exceeds this")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    "Run the benchmark matrix and write the JSON report"
+    args = parse_args(argv)
+    results = []
+    skipped = 0
+    records_cache = {}
+    for case in iter_cases(args):
+        if case["rows"] * case["columns"] > args.max_cells:
+            skipped += 1
+            continue
+        size = (case["rows"], case["columns"])
+        if size not in records_cache:
+            # Cases are grouped by size: keep one payload alive at a time
+            records_cache.clear()
+            records_cache[size] = make_records(*size)
+        with color_backend(case):
+            try:
+                case.update(
+                    bench(case, records_cache[size], args.repeat, not args.no_memory)
+                )
+            except ClakUserError as err:
+                case["error"] = str(err)
+        results.append(case)
+        print(
+            " ".join(f"{key}={case[key]}" for key in CASE_KEYS),
+            f"-> {case.get('seconds', case.get('error'))}",
+            file=sys.stderr,
+        )
+
+    ratios = compare(results, args.baseline) if args.baseline else []
+    report = {
+        "environment": environment(),
+        "skipped_cases": skipped,
+        "results": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(text + "\n")
+    else:
+        print(text)
+    if args.fail_over is not None and any(r > args.fail_over for r in ratios):
+        worst = max(ratios)
+        print(f"Regression: time ratio {worst} > {args.fail_over}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
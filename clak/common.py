@@ -143,12 +143,11 @@ class ObjectNamespace:
         "Update the dictionary with the key-value pairs from kwargs."
         self.__dict__.update(kwargs)
 
+    # Only called for missing names: present ones are plain __dict__ reads,
+    # and writes keep the default (C level) object.__setattr__
     def __getattr__(self, key):
         return self.__dict__.get(key, None)
 
-    def __setattr__(self, key, value):
-        self.__dict__[key] = value
-
     def __iter__(self):
         return iter(self.__dict__)
 
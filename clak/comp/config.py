@@ -3,21 +3,37 @@
 Provides ``XDGConfigMixin`` so apps can expose standard config/data/cache/log
 path flags with defaults from ``Meta.app_name`` / ``$XDG_*``, and load
 ``--conf-file`` once via ``cli_hook__config``.
+
+Parsed config files are cached under ``--cache-dir`` (see
+:func:`load_config_cached`): a large YAML file is parsed once, then read
+back with ``pickle`` as long as its path, mtime, size and inode match.
 """
 
 from __future__ import annotations
 
 import argparse
-import json
+import hashlib
 import logging
 import os
+import pickle
 import re
+import tempfile
+import time
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Any, Mapping
-
-from clak.common import ObjectNamespace
+from typing import Any
+
+from clak.comp.config_layers import (  # noqa: F401  # pylint: disable=unused-import
+    ConfigSection,
+    LayeredConfig,
+    LazyConfig,
+    env_layer,
+    file_layer,
+)
+from clak.comp.config_watch import DEFAULT_WATCH_INTERVAL, ConfigWatcher
 from clak.core.descriptors import Argument, MetaSetting
 from clak.exception import ClakUserError
+from clak.views.serializers import serializer_for_suffix
 
 logger = logging.getLogger(__name__)
 
@@ -36,9 +52,24 @@ _DEFAULT_XDG = {
 _UNSAFE_APP_NAME = re.compile(r"[^\w.-]+")
 
 _YAML_SUFFIXES = {".yaml", ".yml"}
-_JSON_SUFFIXES = {".json"}
 _YAML_INSTALL_HINT = "pip install 'mrjk.clak[config]'"
 
+# Config layers, lowest priority first (Meta.config_layers)
+CONFIG_LAYERS = ("system", "user", "project", "env")
+DEFAULT_CONFIG_LAYERS = ("user",)
+SYSTEM_CONFIG_DIR = "/etc"
+CONFIG_FILE_NAMES = ("config.yaml", "config.yml", "config.json")
+PROJECT_CONFIG_SUFFIXES = (".yaml", ".yml", ".json")
+
+# Parsed config cache: bump the version when the entry layout changes
+CONFIG_CACHE_SUBDIR = "config"
+CONFIG_CACHE_VERSION = 1
+# Smaller files parse faster than a cache round trip is worth
+CONFIG_CACHE_MIN_BYTES = 16 * 1024
+# Files modified more recently may change again within the mtime
+# granularity without changing size: do not cache them yet
+_CONFIG_CACHE_SETTLE_NS = 2 * 1_000_000_000
+
 
 def xdg_dir(env_var: str, default: str | None = None) -> str:
     """Resolve an XDG base directory from the environment.
@@ -77,8 +108,11 @@ def resolve_xdg_paths(app_name: str) -> dict[str, str]:
 def load_config_file(path: str | Path) -> dict[str, Any]:
     """Load a mapping from a JSON or YAML config file.
 
-    Format is detected from the file suffix (``.json``, ``.yaml``, ``.yml``).
-    YAML requires the optional ``config`` extra (PyYAML).
+    Format is detected from the file suffix (``.json``, ``.yaml``, ``.yml``,
+    or a suffix of a format added with
+    :func:`~clak.views.serializers.register_serializer`). Parsing uses the
+    fastest installed backend (orjson, libyaml). YAML requires the optional
+    ``config`` extra (PyYAML).
 
     Raises:
         ClakUserError: Unknown suffix, missing PyYAML, I/O/parse error, or
@@ -87,45 +121,32 @@ def load_config_file(path: str | Path) -> dict[str, Any]:
     conf_path = Path(path)
     suffix = conf_path.suffix.lower()
 
-    if suffix in _JSON_SUFFIXES:
-        try:
-            with conf_path.open(encoding="utf-8") as handle:
-                data = json.load(handle)
-        except OSError as err:
-            raise ClakUserError(
-                f"Could not read config file: {conf_path}",
-                advice=str(err),
-            ) from err
-        except json.JSONDecodeError as err:
-            raise ClakUserError(
-                f"Invalid JSON in config file: {conf_path}",
-                advice=str(err),
-            ) from err
-    elif suffix in _YAML_SUFFIXES:
-        if _yaml is None:
-            raise ClakUserError(
-                f"YAML config requires PyYAML ({conf_path})",
-                advice=f"Install with: {_YAML_INSTALL_HINT}",
-            )
-        try:
-            with conf_path.open(encoding="utf-8") as handle:
-                data = _yaml.safe_load(handle)
-        except OSError as err:
-            raise ClakUserError(
-                f"Could not read config file: {conf_path}",
-                advice=str(err),
-            ) from err
-        except _yaml.YAMLError as err:
-            raise ClakUserError(
-                f"Invalid YAML in config file: {conf_path}",
-                advice=str(err),
-            ) from err
-    else:
+    if suffix in _YAML_SUFFIXES and _yaml is None:
+        raise ClakUserError(
+            f"YAML config requires PyYAML ({conf_path})",
+            advice=f"Install with: {_YAML_INSTALL_HINT}",
+        )
+    serializer = serializer_for_suffix(suffix) if suffix else None
+    if serializer is None:
         raise ClakUserError(
             f"Unsupported config format: {conf_path}",
             advice="Use a .json, .yaml, or .yml file",
         )
 
+    try:
+        with conf_path.open(encoding="utf-8") as handle:
+            data = serializer.load(handle.read())
+    except OSError as err:
+        raise ClakUserError(
+            f"Could not read config file: {conf_path}",
+            advice=str(err),
+        ) from err
+    except ValueError as err:
+        raise ClakUserError(
+            f"Invalid {serializer.name.upper()} in config file: {conf_path}",
+            advice=str(err),
+        ) from err
+
     if data is None:
         return {}
     if not isinstance(data, Mapping):
@@ -136,6 +157,107 @@ def load_config_file(path: str | Path) -> dict[str, Any]:
     return dict(data)
 
 
+def _file_identity(stat_result, path) -> tuple:
+    return (
+        path,
+        stat_result.st_mtime_ns,
+        stat_result.st_size,
+        stat_result.st_ino,
+        stat_result.st_dev,
+    )
+
+
+def config_cache_path(path: str | Path, cache_dir: str | Path) -> str:
+    """Cache entry of config file *path* under *cache_dir*."""
+    digest = hashlib.sha256(os.fsencode(os.path.abspath(path))).hexdigest()
+    return os.path.join(cache_dir, CONFIG_CACHE_SUBDIR, f"{digest[:32]}.pickle")
+
+
+def _read_config_cache(entry: str, identity: tuple):
+    """Cached mapping for *identity*, or None (missing, stale or unreadable)."""
+    try:
+        with open(entry, "rb") as handle:
+            version, cached_identity, data = pickle.load(handle)
+    except FileNotFoundError:
+        return None
+    except Exception as err:  # pylint: disable=broad-exception-caught
+        # Truncated or foreign file: parse again and overwrite it
+        logger.debug("Ignoring unreadable config cache %s: %s", entry, err)
+        return None
+    if version != CONFIG_CACHE_VERSION or cached_identity != identity:
+        return None
+    return data
+
+
+def _write_config_cache(entry: str, identity: tuple, data) -> None:
+    """Write a cache entry atomically; failures only disable the cache."""
+    directory = os.path.dirname(entry)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(
+            prefix=".config-", suffix=".tmp", dir=directory
+        )
+    except OSError as err:
+        logger.debug("Cannot write config cache in %s: %s", directory, err)
+        return
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            pickle.dump(
+                (CONFIG_CACHE_VERSION, identity, data),
+                handle,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(temp_path, entry)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError) as err:
+        logger.debug("Cannot write config cache %s: %s", entry, err)
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+
+
+def load_config_cached(
+    path: str | Path, cache_dir: str | Path | None, min_size=None
+) -> dict[str, Any]:
+    """Like :func:`load_config_file`, through a parsed-data cache.
+
+    The entry for *path* under ``<cache_dir>/config`` stores the mapping
+    with the file identity (absolute path, ``mtime_ns``, size, inode,
+    device); one ``stat`` tells whether it is still valid. A stale or
+    unreadable entry is replaced, written to a temporary file and renamed.
+    Files smaller than *min_size* (default :data:`CONFIG_CACHE_MIN_BYTES`)
+    or modified in the last two seconds are parsed without the cache, and
+    any cache I/O error falls back to parsing.
+    """
+    if min_size is None:
+        min_size = CONFIG_CACHE_MIN_BYTES
+    conf_path = os.path.abspath(path)
+    try:
+        before = os.stat(conf_path)
+    except OSError:
+        before = None
+    if not cache_dir or before is None or before.st_size < min_size:
+        return load_config_file(path)
+
+    identity = _file_identity(before, conf_path)
+    entry = config_cache_path(conf_path, cache_dir)
+    data = _read_config_cache(entry, identity)
+    if data is not None:
+        logger.debug("Config loaded from cache %s", entry)
+        return data
+
+    data = load_config_file(path)
+    try:
+        after = os.stat(conf_path)
+    except OSError:
+        return data
+    settled = time.time_ns() - after.st_mtime_ns >= _CONFIG_CACHE_SETTLE_NS
+    # Only cache what was parsed from the file as it is now
+    if settled and _file_identity(after, conf_path) == identity:
+        _write_config_cache(entry, identity, data)
+    return data
+
+
 # Configuration and workdir support
 # ============================
 
@@ -153,10 +275,27 @@ class XDGConfigMixin:  # pylint: disable=too-few-public-methods
     Defaults respect ``$XDG_CONFIG_HOME``, ``$XDG_DATA_HOME``, and
     ``$XDG_CACHE_HOME`` when set.
 
-    On dispatch, ``cli_hook__config`` loads ``--conf-file`` (JSON always;
-    YAML with the ``config`` extra). Missing file yields ``{}`` unless
-    ``Meta.config_required`` is true. Loaded data is available as
-    ``ctx.config`` (dict) and ``cli_root.config`` (attribute namespace).
+    On dispatch, ``cli_hook__config`` exposes ``--conf-file`` (JSON always;
+    YAML with the ``config`` extra) as ``ctx.config`` and
+    ``cli_root.config``: one :class:`LazyConfig` with dict and attribute
+    access, read and parsed on first access only. Missing file yields
+    ``{}`` unless ``Meta.config_required`` is true; that check runs on
+    dispatch.
+
+    ``Meta.config_layers`` merges more sources, lowest priority first (see
+    :class:`~clak.comp.config_layers.LayeredConfig`):
+
+    - ``system``: ``/etc/<app>/config.yaml`` (``.yml``, ``.json``)
+    - ``user``: ``--conf-file`` (the default, alone)
+    - ``project``: ``.<app>.yaml`` (``.yml``, ``.json``) in the current
+      directory or its closest parent holding one
+    - ``env``: ``<APP>_CONFIG__<KEY>`` variables (``Meta.config_env_prefix``)
+
+    Parsed files are cached under ``--cache-dir`` (see
+    :func:`load_config_cached`); ``--no-config-cache`` or
+    ``Meta.config_cache = False`` always parse the file.
+
+    Long-running commands pick up edits with :meth:`watch_config`.
     """
 
     xdg_config = Argument(
@@ -176,9 +315,27 @@ class XDGConfigMixin:  # pylint: disable=too-few-public-methods
         help=argparse.SUPPRESS,
     )
 
+    xdg_no_config_cache = Argument(
+        "--no-config-cache",
+        action="store_true",
+        help="Parse the configuration file without the parsed-config cache",
+    )
+
     meta__config__config_required = MetaSetting(
         help="If true, missing --conf-file raises ClakUserError",
     )
+    meta__config__config_cache = MetaSetting(
+        help="If false, --conf-file is parsed without the --cache-dir cache",
+    )
+    meta__config_cache = True
+    meta__config__config_layers = MetaSetting(
+        help=f"Config sources merged, lowest priority first: {CONFIG_LAYERS}",
+    )
+    meta__config_layers = DEFAULT_CONFIG_LAYERS
+    meta__config__config_env_prefix = MetaSetting(
+        help="Environment variable prefix of the env config layer",
+    )
+    meta__config_env_prefix = None
 
     _XDG_ARG_DEFAULTS = (
         ("xdg_config", "conf_file"),
@@ -215,8 +372,93 @@ class XDGConfigMixin:  # pylint: disable=too-few-public-methods
 
         return super().add_arguments(arguments)
 
+    def _config_cache_dir(self, args):
+        """Cache directory for parsed config files, or None when disabled."""
+        if getattr(args, "xdg_no_config_cache", False):
+            return None
+        enabled = self.query_cfg_parents(
+            "config_cache", default=True, include_self=True
+        )
+        if enabled is False:
+            return None
+        return getattr(args, "xdg_cache_dir", None)
+
+    def _config_loader(self, instance, path, cache_dir):
+        """Return a function loading ``--conf-file`` for :class:`LazyConfig`."""
+
+        def load():
+            conf_path = Path(path)
+            if not conf_path.is_file():
+                logger.debug("Config file missing, using empty config: %s", conf_path)
+                return {}
+            data = load_config_cached(conf_path, cache_dir)
+            logger.debug(
+                "Config loaded for %s from %s (%d keys)", instance, path, len(data)
+            )
+            return data
+
+        return load
+
+    def _config_layer_names(self) -> tuple:
+        names = self.query_cfg_parents(
+            "config_layers", default=DEFAULT_CONFIG_LAYERS, include_self=True
+        )
+        names = tuple(names or ())
+        unknown = [name for name in names if name not in CONFIG_LAYERS]
+        if unknown:
+            raise ValueError(
+                f"Unknown config layers {unknown}, choose from: {CONFIG_LAYERS}"
+            )
+        return names
+
+    def _build_config_layers(self, names, path, cache_dir) -> list:
+        """Build the :class:`ConfigLayer` list for layer *names*."""
+        app_name = self._xdg_app_name()
+
+        def load(source):
+            return load_config_cached(source, cache_dir)
+
+        def system_files():
+            base = os.path.join(SYSTEM_CONFIG_DIR, app_name)
+            return [os.path.join(base, name) for name in CONFIG_FILE_NAMES]
+
+        def project_files():
+            directory = Path.cwd()
+            for parent in (directory, *directory.parents):
+                for suffix in PROJECT_CONFIG_SUFFIXES:
+                    yield parent / f".{app_name}{suffix}"
+
+        prefix = self.query_cfg_parents(
+            "config_env_prefix", default=None, include_self=True
+        )
+        if not prefix:
+            prefix = re.sub(r"\W", "_", app_name).upper() + "_CONFIG__"
+        factories = {
+            "system": lambda: file_layer("system", system_files, load),
+            "user": lambda: file_layer("user", lambda: [path] if path else [], load),
+            "project": lambda: file_layer("project", project_files, load),
+            "env": lambda: env_layer(prefix),
+        }
+        return [factories[name]() for name in names]
+
+    def watch_config(
+        self, *callbacks, interval=DEFAULT_WATCH_INTERVAL, backend="auto"
+    ) -> ConfigWatcher:
+        """Watch the files of ``self.config`` for long-running commands.
+
+        Returns a :class:`~clak.comp.config_watch.ConfigWatcher` calling
+        ``callback(config, keys)`` with the dotted keys changed by an edit.
+        """
+        config = getattr(self, "config", None)
+        if not hasattr(config, "watch_paths"):
+            raise ClakUserError(
+                "No config file to watch",
+                advice="Call watch_config() from cli_run, with --conf-file set",
+            )
+        return ConfigWatcher(config, *callbacks, interval=interval, backend=backend)
+
     def cli_hook__config(self, instance, ctx, **_):
-        """Load ``--conf-file`` once and expose it on ctx / root."""
+        """Expose ``--conf-file`` on ctx / root, loaded on first access."""
         if ctx.cli_first:
             path = getattr(ctx.args, "xdg_config", None)
             required = bool(
@@ -224,38 +466,36 @@ class XDGConfigMixin:  # pylint: disable=too-few-public-methods
                     "config_required", default=False, include_self=True
                 )
             )
+            layer_names = self._config_layer_names()
+
+            if required and not path:
+                raise ClakUserError(
+                    "Configuration file path is required",
+                    advice="Pass --conf-file PATH",
+                )
+            # A required file must exist before the command runs; it is
+            # still parsed only when read
+            if required and not Path(path).is_file():
+                raise ClakUserError(
+                    f"Configuration file not found: {path}",
+                    advice="Create the file or pass --conf-file PATH",
+                )
 
-            if not path:
-                data: dict[str, Any] = {}
-                if required:
-                    raise ClakUserError(
-                        "Configuration file path is required",
-                        advice="Pass --conf-file PATH",
-                    )
+            cache_dir = self._config_cache_dir(ctx.args)
+            if layer_names != DEFAULT_CONFIG_LAYERS:
+                config = LayeredConfig(
+                    self._build_config_layers(layer_names, path, cache_dir)
+                )
+            elif path:
+                config = LazyConfig(
+                    self._config_loader(instance, path, cache_dir), source=str(path)
+                )
             else:
-                conf_path = Path(path)
-                if not conf_path.is_file():
-                    if required:
-                        raise ClakUserError(
-                            f"Configuration file not found: {conf_path}",
-                            advice="Create the file or pass --conf-file PATH",
-                        )
-                    logger.debug(
-                        "Config file missing, using empty config: %s", conf_path
-                    )
-                    data = {}
-                else:
-                    data = load_config_file(conf_path)
-
-            ctx.plugins["config"] = data
+                config = ConfigSection({})
+
+            ctx.plugins["config"] = config
             ctx.plugins["config_path"] = str(path) if path else None
-            ctx.cli_root.config = ObjectNamespace(**data)
-            logger.debug(
-                "Config loaded for %s from %s (%d keys)",
-                instance,
-                path,
-                len(data),
-            )
+            ctx.cli_root.config = config
 
-        # Re-attach each hierarchy step (fresh ObjectNamespace per node)
+        # Re-attach each hierarchy step
         ctx.config = ctx.plugins.get("config", {})
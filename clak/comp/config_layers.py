@@ -0,0 +1,458 @@
+"""Config mappings: attribute access, lazy loading and layered sources.
+
+:class:`ConfigSection` is the mapping apps read as ``ctx.config``;
+:class:`LazyConfig` loads it on first access. :class:`LayeredConfig`
+merges several :class:`ConfigLayer` sources (system, user, project,
+environment): a layer is located and parsed only when a key lookup
+reaches it, each top-level key is merged once, and
+:meth:`LayeredConfig.provenance` tells which sources set a key.
+
+Both lazy mappings can parse a file again (``reload_source``) and report
+the dotted keys whose value changed (:func:`diff_config`); see
+:mod:`clak.comp.config_watch`.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Mapping, MutableMapping
+
+_MISSING = object()
+
+
+def merge_config(base, override):
+    """Deep-merge two config values: *override* wins, mappings are merged."""
+    if not (isinstance(base, Mapping) and isinstance(override, Mapping)):
+        return override
+    merged = dict(base)
+    for key, value in override.items():
+        merged[key] = merge_config(merged[key], value) if key in merged else value
+    return merged
+
+
+def file_stamp(path):
+    """``(mtime_ns, size, inode, device)`` of *path*, or None when missing.
+
+    Taken before a file is parsed: a write during the parse still changes
+    the stamp seen by the next check.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino, stat.st_dev)
+
+
+def diff_config(old, new, prefix=()) -> list:
+    """Dotted keys whose value differs between two config mappings.
+
+    Nested mappings are compared key by key: changing ``db.port`` reports
+    ``db.port``, not ``db``. Added and removed keys are reported too.
+    """
+    if isinstance(old, Mapping) and isinstance(new, Mapping):
+        changed = []
+        for key in dict.fromkeys([*old, *new]):
+            changed.extend(
+                diff_config(
+                    old.get(key, _MISSING), new.get(key, _MISSING), (*prefix, key)
+                )
+            )
+        return changed
+    if old is new or old == new:
+        return []
+    return [".".join(str(part) for part in prefix)]
+
+
+class ConfigSection(MutableMapping):
+    """Config mapping with item and attribute access.
+
+    Item access returns stored values (``section["db"]`` is the nested
+    dict). Attribute access returns None for missing keys, like
+    :class:`~clak.common.ObjectNamespace`, and wraps nested mappings in a
+    ``ConfigSection`` when they are read: ``config.db.host``. Keys named
+    like mapping methods (``items``, ``get``...) need item access.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data=None):
+        object.__setattr__(self, "_data", {} if data is None else data)
+
+    def _mapping(self):
+        return self._data
+
+    def __getitem__(self, key):
+        return self._mapping()[key]
+
+    def __setitem__(self, key, value):
+        self._mapping()[key] = value
+
+    def __delitem__(self, key):
+        del self._mapping()[key]
+
+    def __iter__(self):
+        return iter(self._mapping())
+
+    def __len__(self):
+        return len(self._mapping())
+
+    def __getattr__(self, key):
+        # Only called for names that are not slots or methods
+        if key.startswith("_"):
+            raise AttributeError(key)
+        try:
+            value = self[key]
+        except KeyError:
+            return None
+        if isinstance(value, Mapping) and not isinstance(value, ConfigSection):
+            return ConfigSection(value)
+        return value
+
+    def __setattr__(self, key, value):
+        if key.startswith("_"):
+            object.__setattr__(self, key, value)
+        else:
+            self[key] = value
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._mapping()!r})"
+
+
+class LazyConfig(ConfigSection):
+    """:class:`ConfigSection` whose data is loaded on first access.
+
+    *loader* is called when a key, attribute, length or iteration is first
+    needed; commands that never read the config (``--help``, ``version``,
+    ``completion``) never stat or parse the file. Errors raised by *loader*
+    (:class:`~clak.exception.ClakUserError` for an invalid file) surface at
+    that first access, and again on the next one. *source* is the file
+    *loader* reads, watched once loaded.
+    """
+
+    __slots__ = ("_loader", "_stamp", "source")
+
+    def __init__(self, loader, source=None):
+        super().__init__()
+        object.__setattr__(self, "_data", None)
+        object.__setattr__(self, "_loader", loader)
+        object.__setattr__(self, "_stamp", None)
+        object.__setattr__(self, "source", source)
+
+    @property
+    def loaded(self) -> bool:
+        """True once the data has been loaded."""
+        return self._data is not None
+
+    def _mapping(self):
+        data = self._data
+        if data is None:
+            data = self._load()
+            object.__setattr__(self, "_data", data)
+        return data
+
+    def _load(self):
+        if self.source:
+            object.__setattr__(self, "_stamp", file_stamp(self.source))
+        return self._loader()
+
+    def watch_paths(self) -> dict:
+        """Files to watch: *source* once loaded, with its :func:`file_stamp`."""
+        if self.source and self.loaded:
+            return {self.source: self._stamp}
+        return {}
+
+    def reload_source(self, source) -> list:
+        """Load *source* again; return the dotted keys that changed.
+
+        A config not loaded yet has nothing to refresh. On a loader error
+        the current data is kept.
+        """
+        if source != self.source or not self.loaded:
+            return []
+        old = self._data
+        new = self._load()
+        object.__setattr__(self, "_data", new)
+        return diff_config(old, new)
+
+    def __repr__(self):
+        if not self.loaded:
+            return f"{type(self).__name__}(<not loaded>)"
+        return super().__repr__()
+
+
+# Layers
+# ============================
+
+
+class ConfigLayer:
+    """One config source, located and parsed on first use.
+
+    *find* returns the source (a file path, an environment label) or None
+    when the layer does not exist; *load* turns that source into a mapping.
+    Both run at most once.
+    """
+
+    __slots__ = ("name", "is_file", "stamp", "_find", "_load", "_source", "_data")
+
+    def __init__(self, name, find, load, is_file=False):
+        self.name = name
+        self.is_file = is_file
+        self.stamp = None
+        self._find = find
+        self._load = load
+        self._source = _MISSING
+        self._data = None
+
+    def __repr__(self):
+        state = "not located" if self._source is _MISSING else repr(self._source)
+        return f"ConfigLayer({self.name!r}, {state})"
+
+    @property
+    def source(self):
+        """Where the layer comes from, or None when it does not exist."""
+        if self._source is _MISSING:
+            self._source = self._find()
+        return self._source
+
+    @property
+    def data(self) -> Mapping:
+        """The layer mapping (empty when the layer does not exist)."""
+        if self._data is None:
+            self._data = self._parse(self.source)
+        return self._data
+
+    def _parse(self, source):
+        if source is None:
+            return {}
+        if self.is_file:
+            self.stamp = file_stamp(source)
+        return self._load(source)
+
+    @property
+    def loaded(self) -> bool:
+        """True once the layer has been parsed."""
+        return self._data is not None
+
+    def read(self) -> tuple:
+        """Locate and parse the layer again: ``(source, data)``, not stored."""
+        source = self._find()
+        return source, self._parse(source)
+
+    def replace(self, source, data) -> None:
+        """Use *source* and *data* from now on (see :meth:`read`)."""
+        self._source = source
+        self._data = data
+
+
+def file_layer(name, candidates, load) -> ConfigLayer:
+    """Layer read from the first existing file of *candidates*.
+
+    *candidates* is a callable returning paths to try, so directory walks
+    only happen when the layer is reached; *load* parses the chosen file.
+    """
+
+    def find():
+        for path in candidates():
+            if os.path.isfile(path):
+                return str(path)
+        return None
+
+    return ConfigLayer(name, find, load, is_file=True)
+
+
+def _env_value(text):
+    """Environment value: JSON scalars and lists (``8080``, ``true``), else text."""
+    try:
+        return json.loads(text)
+    except ValueError:
+        return text
+
+
+def env_layer(prefix, environ=None, name="env") -> ConfigLayer:
+    """Layer built from ``<prefix><KEY>`` environment variables.
+
+    ``__`` separates nested keys and keys are lowercased:
+    ``APP_CONFIG__DB__PORT=5432`` gives ``{"db": {"port": 5432}}``.
+    """
+
+    def variables():
+        env = os.environ if environ is None else environ
+        return {
+            key[len(prefix) :]: value
+            for key, value in env.items()
+            if key.startswith(prefix) and len(key) > len(prefix)
+        }
+
+    def find():
+        return f"${prefix}*" if variables() else None
+
+    def load(_source):
+        data = {}
+        for key, value in sorted(variables().items()):
+            parts = [part.lower() for part in key.split("__") if part]
+            if not parts:
+                continue
+            node = data
+            for part in parts[:-1]:
+                child = node.get(part)
+                if not isinstance(child, dict):
+                    child = node[part] = {}
+                node = child
+            node[parts[-1]] = _env_value(value)
+        return data
+
+    return ConfigLayer(name, find, load)
+
+
+class LayeredConfig(ConfigSection):
+    """:class:`ConfigSection` merged from *layers*, lowest priority first.
+
+    Looking up a key walks the layers from the highest priority down and
+    stops at the first one holding a non-mapping value; lower layers are
+    neither located nor parsed. Mapping values are deep-merged across the
+    layers that define them (:func:`merge_config`). Each key is resolved
+    once; its sources are kept for :meth:`provenance`. Iteration and
+    ``len`` need every layer.
+
+    Assignments land in a top override layer (``"runtime"``); deleting a
+    key hides it whatever the layers hold.
+    """
+
+    __slots__ = ("layers", "_overrides", "_resolved", "_sources")
+
+    def __init__(self, layers):
+        super().__init__()
+        object.__setattr__(self, "layers", list(layers))
+        object.__setattr__(self, "_overrides", {})
+        object.__setattr__(self, "_resolved", {})
+        object.__setattr__(self, "_sources", {})
+        object.__setattr__(self, "_data", None)
+
+    def _resolve(self, key):
+        """Merged value of top-level *key* (``_MISSING`` if unset)."""
+        resolved = self._resolved
+        if key in resolved:
+            return resolved[key]
+        values = []
+        sources = []
+        override = self._overrides.get(key, _MISSING)
+        if override is not _MISSING:
+            values.append(override)
+            sources.append(("runtime", None))
+        if override is _MISSING or isinstance(override, Mapping):
+            for layer in reversed(self.layers):
+                value = layer.data.get(key, _MISSING)
+                if value is _MISSING:
+                    continue
+                values.append(value)
+                sources.append((layer.name, layer.source))
+                if not isinstance(value, Mapping):
+                    break
+        value = _MISSING
+        for layer_value in reversed(values):
+            value = (
+                layer_value if value is _MISSING else merge_config(value, layer_value)
+            )
+        if value is _DELETED:
+            value = _MISSING
+            sources = []
+        resolved[key] = value
+        self._sources[key] = sources
+        return value
+
+    def __getitem__(self, key):
+        value = self._resolve(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self._resolve(key) is not _MISSING
+
+    def _mapping(self):
+        data = self._data
+        if data is None:
+            keys = dict.fromkeys(key for layer in self.layers for key in layer.data)
+            keys.update(dict.fromkeys(self._overrides))
+            data = {}
+            for key in keys:
+                value = self._resolve(key)
+                if value is not _MISSING:
+                    data[key] = value
+            object.__setattr__(self, "_data", data)
+        return data
+
+    def _changed(self, key):
+        self._resolved.pop(key, None)
+        self._sources.pop(key, None)
+        object.__setattr__(self, "_data", None)
+
+    def __setitem__(self, key, value):
+        self._overrides[key] = value
+        self._changed(key)
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self._overrides[key] = _DELETED
+        self._changed(key)
+
+    def provenance(self, key) -> list:
+        """``(layer name, source)`` pairs that set *key*, highest priority first.
+
+        *source* is the file path, the environment label, or None for
+        runtime assignments. Empty when *key* is not set.
+        """
+        self._resolve(key)
+        return list(self._sources.get(key, ()))
+
+    def watch_paths(self) -> dict:
+        """Files of the file layers parsed so far, with their :func:`file_stamp`."""
+        return {
+            layer.source: layer.stamp
+            for layer in self.layers
+            if layer.is_file and layer.loaded and layer.source
+        }
+
+    def reload_source(self, source) -> list:
+        """Parse the layers read from *source* again; return the changed keys.
+
+        Other layers are kept as they are. Only top-level keys whose value
+        changed in the reparsed layer are resolved again, and reported as
+        the dotted keys whose merged value changed. A parse error leaves
+        the config untouched.
+        """
+        updates = []
+        for layer in self.layers:
+            if layer.loaded and layer.source == source:
+                updates.append((layer, *layer.read()))
+        keys = {}
+        for layer, _, data in updates:
+            old = layer.data
+            for key in dict.fromkeys([*old, *data]):
+                if old.get(key, _MISSING) != data.get(key, _MISSING):
+                    keys[key] = None
+        # Merged values before the change, to diff against
+        before = {key: self._resolve(key) for key in keys}
+        for layer, new_source, data in updates:
+            layer.replace(new_source, data)
+        changed = []
+        for key, old in before.items():
+            self._changed(key)
+            changed.extend(diff_config(old, self._resolve(key), (key,)))
+        return changed
+
+    def __repr__(self):
+        names = ", ".join(layer.name for layer in self.layers)
+        return f"LayeredConfig([{names}])"
+
+
+class _Deleted:  # pylint: disable=too-few-public-methods
+    """Override marker hiding a key set by lower layers."""
+
+    def __repr__(self):
+        return "<deleted>"
+
+
+_DELETED = _Deleted()
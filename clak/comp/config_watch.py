@@ -0,0 +1,321 @@
+"""Reload config files of long-running commands when they change.
+
+A :class:`ConfigWatcher` follows the files a config mapping has parsed so
+far (:class:`~clak.comp.config_layers.LazyConfig` or
+:class:`~clak.comp.config_layers.LayeredConfig`). When one changes, only
+that file is parsed again, the merged values are diffed and callbacks get
+the dotted keys that changed::
+
+    def cli_run(self, ctx, **_):
+        watcher = self.watch_config(lambda config, keys: print(keys))
+        while True:
+            watcher.check(timeout=5)  # also the loop sleep
+            do_work(ctx.config)
+
+Changes are detected with inotify (Linux, through :mod:`ctypes`) on the
+directories holding the files, so editors replacing a file are seen too;
+elsewhere, or for files in directories that cannot be watched, file
+``stat`` results are polled every ``interval`` seconds. Files not parsed
+yet (a layer no lookup reached) are not watched: they are read fresh when
+first needed. An invalid file is logged and skipped; the previous values
+stay until the next change.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+
+from clak.comp.config_layers import file_stamp
+from clak.exception import ClakUserError
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WATCH_INTERVAL = 1.0
+WATCH_BACKENDS = ("auto", "inotify", "poll")
+
+# <sys/inotify.h>
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_IN_MASK = (
+    _IN_ATTRIB
+    | _IN_CLOSE_WRITE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_CREATE
+    | _IN_DELETE
+)
+_IN_EVENT = struct.Struct("iIII")
+_IN_READ_BYTES = 64 * 1024
+
+
+def _inotify_libc():
+    """The C library when it provides inotify, else None."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [
+            ctypes.c_int,
+            ctypes.c_char_p,
+            ctypes.c_uint32,
+        ]
+    except (OSError, AttributeError):
+        return None
+    return libc
+
+
+class _Inotify:
+    """Directory watches on one inotify file descriptor."""
+
+    def __init__(self, libc):
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_init1: {os.strerror(err)}")
+        self.libc = libc
+        self.fd = fd
+        self.directories = {}  # watch descriptor -> directory
+
+    def add(self, directory) -> None:
+        """Watch *directory* (no-op when already watched)."""
+        if directory in self.directories.values():
+            return
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory), _IN_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, f"inotify_add_watch {directory}: {os.strerror(err)}")
+        self.directories[wd] = directory
+
+    def wait(self, timeout):
+        """Paths touched within *timeout* seconds; None when events were lost."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        paths = set()
+        while True:
+            try:
+                buffer = os.read(self.fd, _IN_READ_BYTES)
+            except BlockingIOError:
+                return paths
+            offset = 0
+            while offset < len(buffer):
+                wd, mask, _, length = _IN_EVENT.unpack_from(buffer, offset)
+                offset += _IN_EVENT.size
+                name = buffer[offset : offset + length].rstrip(b"\0")
+                offset += length
+                if mask & _IN_Q_OVERFLOW:
+                    return None
+                directory = self.directories.get(wd)
+                if directory is not None and name:
+                    paths.add(os.path.join(directory, os.fsdecode(name)))
+
+    def close(self) -> None:
+        """Release the file descriptor."""
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class _WatchedFiles:
+    """Stamps of the watched config files, their aliases, the polled ones."""
+
+    def __init__(self):
+        self.stamps = {}  # watched path -> file stamp
+        self.aliases = {}  # absolute or resolved path -> watched path
+        self.polled = set()
+
+    def add(self, path, stamp) -> tuple:
+        """Watch *path*; return its absolute and resolved paths, deduplicated."""
+        self.stamps[path] = stamp
+        absolute = os.path.abspath(path)
+        resolved = os.path.realpath(path)
+        for alias in (absolute, resolved):
+            self.aliases[alias] = path
+        return tuple(dict.fromkeys((absolute, resolved)))
+
+    def from_events(self, events) -> set:
+        """Watched paths named by inotify *events*, plus the polled ones."""
+        paths = {self.aliases[path] for path in events if path in self.aliases}
+        return paths | self.polled
+
+    def changed(self, candidates) -> list:
+        """Sorted *candidates* whose stamp changed; their stamps are updated."""
+        changed = []
+        for path in sorted(candidates):
+            identity = file_stamp(path)
+            if identity != self.stamps.get(path):
+                self.stamps[path] = identity
+                changed.append(path)
+        return changed
+
+
+class ConfigWatcher:
+    """Reload the files of *config* when they change and notify *callbacks*.
+
+    Callbacks are called as ``callback(config, keys)`` with the sorted
+    dotted keys whose merged value changed. *backend* is ``"inotify"``,
+    ``"poll"`` or ``"auto"`` (inotify when available); *interval* is the
+    polling period in seconds.
+
+    Call :meth:`check` from the command loop, or :meth:`start` a daemon
+    thread running it (callbacks then run in that thread). Use as a
+    context manager, or :meth:`close` when done.
+    """
+
+    def __init__(
+        self, config, *callbacks, interval=DEFAULT_WATCH_INTERVAL, backend="auto"
+    ):
+        if backend not in WATCH_BACKENDS:
+            raise ValueError(
+                f"Unknown config watch backend {backend!r}, choose from: "
+                f"{WATCH_BACKENDS}"
+            )
+        if isinstance(interval, bool) or not isinstance(interval, (int, float)):
+            raise TypeError(f"watch interval must be a number, got {interval!r}")
+        if interval <= 0:
+            raise ValueError(f"watch interval must be > 0, got {interval}")
+        self.config = config
+        self.callbacks = list(callbacks)
+        self.interval = interval
+        self._inotify = None
+        if backend != "poll":
+            libc = _inotify_libc()
+            if libc is None and backend == "inotify":
+                raise ClakUserError("inotify is not available on this system")
+            if libc is not None:
+                self._inotify = _Inotify(libc)
+        self._files = _WatchedFiles()
+        self._stop = threading.Event()
+        self._thread = None
+        self._sync_paths()
+
+    def __repr__(self):
+        return f"ConfigWatcher({self.backend}, {sorted(self._files.stamps)})"
+
+    @property
+    def backend(self) -> str:
+        """``"inotify"`` or ``"poll"``."""
+        return "poll" if self._inotify is None else "inotify"
+
+    @property
+    def paths(self) -> list:
+        """Files currently watched."""
+        return sorted(self._files.stamps)
+
+    def subscribe(self, callback):
+        """Call *callback* on changes; returns it (usable as a decorator)."""
+        self.callbacks.append(callback)
+        return callback
+
+    def unsubscribe(self, callback) -> None:
+        """Stop calling *callback*."""
+        self.callbacks.remove(callback)
+
+    def _sync_paths(self) -> None:
+        """Watch the files *config* parsed since the last check."""
+        files = self._files
+        for path, stamp in self.config.watch_paths().items():
+            if path in files.stamps:
+                continue
+            aliases = files.add(path, stamp)
+            if self._inotify is None:
+                files.polled.add(path)
+                continue
+            try:
+                for alias in aliases:
+                    self._inotify.add(os.path.dirname(alias))
+            except OSError as err:
+                logger.debug("Polling config file %s: %s", path, err)
+                files.polled.add(path)
+
+    def _candidates(self, timeout):
+        """Paths that may have changed, waiting up to *timeout* for events."""
+        files = self._files
+        if self._inotify is None or len(files.polled) == len(files.stamps):
+            if timeout > 0:
+                time.sleep(min(timeout, self.interval))
+            return set(files.stamps)
+        if files.polled:
+            timeout = min(timeout, self.interval)
+        events = self._inotify.wait(timeout)
+        if events is None:
+            return set(files.stamps)
+        return files.from_events(events)
+
+    def _reload(self, paths) -> list:
+        keys = set()
+        for path in paths:
+            try:
+                keys.update(self.config.reload_source(path))
+            except (ClakUserError, OSError) as err:
+                logger.warning("Config file %s not reloaded: %s", path, err)
+        return sorted(keys)
+
+    def check(self, timeout=0.0) -> list:
+        """Reload changed files and notify; return the changed dotted keys.
+
+        Waits up to *timeout* seconds for a change (a plain check with 0);
+        returns an empty list when nothing changed in that time.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            self._sync_paths()
+            # One stat pass first: a few files, and no event is lost
+            # between two checks
+            remaining = max(0.0, deadline - time.monotonic())
+            paths = self._files.changed(self._files.stamps)
+            if not paths and remaining > 0:
+                paths = self._files.changed(self._candidates(remaining))
+            keys = self._reload(paths) if paths else []
+            if keys:
+                logger.debug("Config changed: %s", ", ".join(keys))
+                for callback in list(self.callbacks):
+                    callback(self.config, keys)
+                return keys
+            if deadline - time.monotonic() <= 0:
+                return []
+
+    def start(self):
+        """Run :meth:`check` in a daemon thread until :meth:`close`."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="clak-config-watch", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.check(self.interval)
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Config watcher callback failed")
+
+    def close(self) -> None:
+        """Stop the thread (if started) and release inotify."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._inotify is not None:
+            self._inotify.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
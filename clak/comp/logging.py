@@ -17,7 +17,6 @@ Notes:
 - Set ``log_prefix`` (typically ``__name__``) so ``self.logger`` uses your app namespace.
 
 
-
 Example:
 
     class AppMain(LoggingOptMixin,Parser):
@@ -66,15 +65,32 @@ With log_prefix set:
 """
 
 import argparse
+import atexit
 import logging
 import logging.config
+import logging.handlers
 import os
+import queue
+import sys
 from types import SimpleNamespace
 
 from clak.common import to_boolean
 from clak.core.descriptors import Argument, MetaSetting
 from clak.core.plugins import PluginHelpers
 from clak.exception import ClakAppError
+from clak.runtime.log_handlers import (
+    DEFAULT_LOG_FILE_OPTIONS,
+    DEFAULT_LOG_QUEUE_SIZE,
+    DEFAULT_LOG_RATE_SUMMARY,
+    LOG_FILE_FORMATS,
+    LOG_QUEUE_POLICIES,
+    LogQueueHandler,
+    LogRateLimiter,
+    LogRouting,
+    StderrLevels,
+    open_log_file,
+    parse_log_rate,
+)
 from clak.runtime.log_levels import register_clak_log_levels
 from clak.runtime.settings import (
     LOG_FORMAT,
@@ -82,6 +98,7 @@ from clak.runtime.settings import (
     apply_coloredlogs_defaults,
     resolve_log_colors,
 )
+from clak.runtime.tracing import TracePoint
 
 DEFAULT_LOG_COLORS_ENV = "CLAK_LOG_COLORS"
 
@@ -100,6 +117,7 @@ if coloredlogs:
 register_clak_log_levels()
 
 logger = logging.getLogger(__name__)
+_TRACE_SETUP = TracePoint(logger, logging.INFO)
 
 DEFAULT_LOG_LEVEL = logging.WARNING
 DEFAULT_LOG_LEVELS = [
@@ -119,6 +137,276 @@ def _logger_entry(**conf):
     }
 
 
+# What the last get_app_logger() call installed: later calls only apply
+# the level, formatter and handler differences (see _update_logging).
+# *handler* writes to stderr, *file* is the buffered log file handler;
+# *fronts* are the handlers loggers point at: those sinks, or the
+# LogQueueHandler feeding *listener* in async mode. *limiters* are the
+# LogRateLimiter filters on those fronts.
+def _logging_state():
+    return SimpleNamespace(
+        handler=None,
+        file=None,
+        file_key=None,
+        fronts=[],
+        listener=None,
+        formatter=None,
+        loggers={},
+        limiters=[],
+        rate_key=None,
+    )
+
+
+_installed = _logging_state()
+_LOGGER_ENTRY_KEYS = frozenset({"handlers", "level", "propagate"})
+
+
+def _level_number(level):
+    "Numeric level of a level name or number (unknown names are kept)"
+    if isinstance(level, str):
+        return logging.getLevelName(level.upper())
+    return level
+
+
+def _build_formatter(conf):
+    "Instanciate a formatter from its dictConfig entry"
+    conf = dict(conf)
+    factory = conf.pop("()")
+    return factory(fmt=conf.pop("format"), **conf)
+
+
+def _set_logger(name, level, handlers):
+    "Point logger *name* at *handlers* only, touching what differs"
+    log = logging.getLogger(name)
+    if log.level != level:
+        log.setLevel(level)
+    log.propagate = False
+    log.disabled = False
+    if log.handlers != handlers:
+        for other in list(log.handlers):
+            log.removeHandler(other)
+        for handler in handlers:
+            log.addHandler(handler)
+
+
+def _start_log_queue(sinks, queue_size, queue_policy):
+    "Return a started LogQueueHandler writing to *sinks* from a thread"
+    if isinstance(queue_size, bool) or not isinstance(queue_size, int):
+        raise TypeError(f"Log queue size must be an int, got {queue_size!r}")
+    if queue_size <= 0:
+        raise ValueError(f"Log queue size must be > 0, got {queue_size}")
+    front = LogQueueHandler(queue.Queue(maxsize=queue_size), policy=queue_policy)
+    front.listener = logging.handlers.QueueListener(
+        front.queue, *sinks, respect_handler_level=True
+    )
+    front.listener.start()
+    _installed.listener = front.listener
+    return front
+
+
+def stop_log_queue():
+    """Stop the async log listener once every queued record is written.
+
+    Loggers configured by clak write directly to their handlers again.
+    Called at interpreter exit (``sys.exit`` included) and before
+    ``clean_terminate`` reports an error; a no-op without ``--log-async``.
+    """
+    listener = _installed.listener
+    if listener is None:
+        return
+    front = _installed.fronts[0]
+    sinks = list(listener.handlers)
+    # Repoint first: records logged while draining are written, not lost
+    for name in _installed.loggers:
+        log = logging.getLogger(name)
+        if front in log.handlers:
+            log.removeHandler(front)
+            for sink in sinks:
+                log.addHandler(sink)
+    # Summaries of the limiters on the queue front go through the queue
+    for limiter in _installed.limiters:
+        limiter.detach()
+    _installed.limiters = []
+    _installed.fronts = sinks
+    _installed.listener = None
+    listener.stop()
+    front.close()
+    if front.dropped:
+        logger.warning("Dropped %d log records: log queue full", front.dropped)
+
+
+atexit.register(stop_log_queue)
+
+
+def _log_fronts(sinks, log_async, queue_size, queue_policy):
+    "Handlers loggers should point at, starting or stopping the log queue"
+    fronts = _installed.fronts
+    if not log_async:
+        stop_log_queue()
+        return sinks
+    listener = _installed.listener
+    if (
+        listener is not None
+        and listener.handlers == tuple(sinks)
+        and fronts[0].queue.maxsize == queue_size
+        and fronts[0].policy == queue_policy
+    ):
+        return fronts
+    stop_log_queue()
+    return [_start_log_queue(sinks, queue_size, queue_policy)]
+
+
+def _apply_rate_limits(fronts, rate_limits, summary):
+    "Put a rate limiter on each front, kept when nothing changed"
+    limiters = _installed.limiters
+    key = repr((rate_limits, summary))
+    if key != _installed.rate_key or [l.handler for l in limiters] != fronts:
+        for limiter in limiters:
+            limiter.detach()
+        limiters = []
+        if rate_limits:
+            limiters = [LogRateLimiter(rate_limits, summary) for _ in fronts]
+        _installed.limiters = limiters
+        _installed.rate_key = key
+    # Re-attach: the stderr level filter must run first
+    for limiter, front in zip(limiters, fronts):
+        limiter.attach(front)
+
+
+def summarize_log_rate_limits():
+    """Log the pending ``Suppressed N similar messages`` records now.
+
+    Called at interpreter exit; a no-op without rate limits.
+    """
+    for limiter in _installed.limiters:
+        limiter.summarize()
+
+
+# Registered after stop_log_queue, so it runs first
+atexit.register(summarize_log_rate_limits)
+
+
+def _close_log_file():
+    buffered = _installed.file
+    if buffered is None:
+        return
+    target = buffered.target
+    buffered.close()  # flushes the buffer, forgets the target
+    target.close()
+    _installed.file = _installed.file_key = None
+
+
+def _log_file_handler(log_file, options):
+    "The buffered log file handler for *log_file*, reused when unchanged"
+    if log_file is None:
+        _close_log_file()
+        return None
+    key = (os.path.abspath(os.path.expanduser(os.fspath(log_file))), repr(options))
+    if key != _installed.file_key:
+        _close_log_file()
+        _installed.file = open_log_file(log_file, options)
+        _installed.file_key = key
+    return _installed.file
+
+
+def _route_loggers(handler, levels, routing):
+    """Point the configured loggers at stderr, the log file and the queue.
+
+    *levels* are the stderr levels per logger name. A log file opens
+    loggers down to its own level; stderr then filters on *levels*.
+    Rate limits filter the records of the handlers loggers point at.
+    """
+    previous = list(_installed.fronts)
+    buffered = _log_file_handler(routing.log_file, routing.log_file_options)
+    for old in [f for f in handler.filters if isinstance(f, StderrLevels)]:
+        handler.removeFilter(old)
+    sinks = [handler]
+    logger_levels = levels
+    if buffered is not None:
+        handler.addFilter(StderrLevels(levels))
+        sinks.append(buffered)
+        logger_levels = {
+            name: min(level, buffered.level) for name, level in levels.items()
+        }
+
+    fronts = _installed.fronts = _log_fronts(
+        sinks, routing.log_async, routing.queue_size, routing.queue_policy
+    )
+    _apply_rate_limits(fronts, routing.rate_limits, routing.rate_summary)
+    for name, log_level in logger_levels.items():
+        _set_logger(name, log_level, fronts)
+    for name in _installed.loggers.keys() - levels.keys():
+        stale = logging.getLogger(name)
+        stale.setLevel(logging.NOTSET)
+        for old in {*previous, *sinks, *fronts}:
+            stale.removeHandler(old)
+        stale.propagate = True
+    _installed.loggers = levels
+
+
+def _incremental_levels(loggers):
+    """Stderr levels of dictConfig *loggers* entries, or None.
+
+    None when an entry uses dictConfig features not handled in place:
+    other handlers, propagation, or keys besides the level.
+    """
+    for conf in loggers.values():
+        if "level" not in conf or set(conf) - _LOGGER_ENTRY_KEYS:
+            return None
+        if conf.get("handlers", ["default"]) != ["default"]:
+            return None
+        if conf.get("propagate", False):
+            return None
+    return {name: _level_number(conf["level"]) for name, conf in loggers.items()}
+
+
+def _update_stderr_handler(handler, formatter_conf, level):
+    "Apply the formatter, level and current stderr to the stderr *handler*"
+    key = repr(formatter_conf)
+    if key != _installed.formatter:
+        handler.setFormatter(_build_formatter(formatter_conf))
+        _installed.formatter = key
+    if handler.level != _level_number(level):
+        handler.setLevel(level)
+    # Tests and embedders swap sys.stderr between calls
+    if handler.stream is not sys.stderr:
+        with handler.lock:
+            handler.stream = sys.stderr
+
+
+def _update_logging(stderr_conf, loggers, routing):
+    """Reconfigure the handler installed last time, in place.
+
+    *stderr_conf* is the ``(formatter_conf, level)`` of the stderr handler.
+    Returns False when it is gone (logging reconfigured outside clak) or
+    when *loggers* use dictConfig features not handled here; the caller
+    then runs ``dictConfig``.
+    """
+    handler = _installed.handler
+    fronts = _installed.fronts
+    if handler is None or not fronts or fronts[0] not in logging.getLogger().handlers:
+        return False
+    levels = _incremental_levels(loggers)
+    if levels is None:
+        return False
+
+    _update_stderr_handler(handler, *stderr_conf)
+    _route_loggers(handler, levels, routing)
+    return True
+
+
+def _log_sample_arg(value):
+    "argparse type of ``--log-sample``: ``(logger name, rate spec)``"
+    name, sep, spec = value.rpartition("=")
+    if not sep:
+        name = ""
+    try:
+        parse_log_rate(spec)
+    except ValueError as err:
+        raise argparse.ArgumentTypeError(str(err)) from err
+    return name.strip(), spec
+
+
 def _dotted_suffix(value):
     """Normalize a logger suffix so a non-empty value starts with ``.``."""
     suffix = str(value)
@@ -127,28 +415,17 @@ def _dotted_suffix(value):
     return suffix
 
 
-def get_app_logger(
-    loggers=None,
-    level="WARNING",
-    colors=False,
-    formatter="default",
-    level_styles=None,
-):
-    "Instanciate application logger"
-
-    loggers = loggers or {}
-
-    # Settings
-    fclass = "logging.Formatter"
+def _log_formatters(colors=False, level_styles=None):
+    "dictConfig formatter entries, by ``--log-format`` name"
+    fclass = logging.Formatter
     formatter_kwargs = {}
     if colors and coloredlogs:
         # Require coloredlogs
-        fclass = "coloredlogs.ColoredFormatter"
+        fclass = coloredlogs.ColoredFormatter
         if level_styles is not None:
             formatter_kwargs["level_styles"] = level_styles
 
-    # Define formatters
-    formatters = {
+    return {
         "default": {
             "()": fclass,
             "format": LOG_FORMAT,
@@ -175,12 +452,9 @@ def get_app_logger(
         },
     }
 
-    # Assert arguments
-    if formatter not in formatters:
-        choice = ",".join(formatters.keys())
-        raise ValueError(
-            f"Invalid formatter: '{formatter}', please choose one of: {choice}"
-        )
+
+def _install_logging(formatters, formatter, level, loggers):
+    "Install the stderr handler and *loggers* entries with ``dictConfig``"
 
     # Logging config
     logging_config = {
@@ -197,19 +471,82 @@ def get_app_logger(
                 "stream": "ext://sys.stderr",  # Default is stderr
             },
         },
-        # Where logs come from
-        "loggers": {
-            # Used to catch ALL logs
-            "": _logger_entry(level="WARNING"),  # root logger
-        },
+        # Where logs come from, "" catches ALL logs
+        "loggers": loggers,
     }
 
-    # Prepare logger components
-    for name, conf in loggers.items():
-        logging_config["loggers"][name] = _logger_entry(**conf)
-
     # Load logger
     logging.config.dictConfig(logging_config)
+    handler = _installed.handler = logging.getLogger().handlers[0]
+    _installed.fronts = [handler]
+    _installed.formatter = repr(formatters[formatter])
+    _installed.loggers = {name: logging.getLogger(name).level for name in loggers}
+    # dictConfig closed the previous log file handlers
+    _installed.file = _installed.file_key = None
+
+
+def get_app_logger(
+    loggers=None,
+    level="WARNING",
+    colors=False,
+    formatter="default",
+    level_styles=None,
+    **options,
+):
+    """Instanciate application logger
+
+    The first call installs the handler with ``dictConfig``. With
+    ``incremental`` (the default), later calls diff the requested state
+    against what was installed and only change logger levels, the handler
+    level and (when the format or colors change) the formatter, instead
+    of rebuilding every handler and formatter.
+
+    The other *options* are :class:`LogRouting` fields. With
+    ``log_async``, loggers get a :class:`LogQueueHandler` and a
+    :class:`~logging.handlers.QueueListener` thread formats and writes the
+    records. The queue holds ``queue_size`` records; ``queue_policy`` is
+    ``"block"`` or ``"drop"`` when it is full. :func:`stop_log_queue`
+    flushes it.
+
+    ``log_file`` also writes records to that file, through a buffer flushed
+    every ``buffer`` records or on a WARNING, in front of a file rotated
+    at ``max_bytes`` (``backups`` kept). Loggers are opened down to the
+    file ``level`` while stderr keeps the levels of *loggers*.
+    ``log_file_options`` override :data:`DEFAULT_LOG_FILE_OPTIONS`;
+    ``format`` is ``"text"`` or ``"json"``
+    (:class:`~clak.runtime.log_handlers.JsonLineFormatter`).
+
+    ``rate_limits`` maps logger names to :func:`parse_log_rate` specs: a
+    :class:`LogRateLimiter` drops their records below WARNING beyond that
+    rate, per message template, and logs how many it dropped every
+    ``rate_summary`` seconds.
+    """
+
+    loggers = loggers or {}
+    incremental = options.pop("incremental", True)
+    formatters = _log_formatters(colors, level_styles)
+
+    # Assert arguments
+    if formatter not in formatters:
+        choice = ",".join(formatters.keys())
+        raise ValueError(
+            f"Invalid formatter: '{formatter}', please choose one of: {choice}"
+        )
+
+    logger_entries = {"": _logger_entry(level="WARNING")}  # root logger
+    for name, conf in loggers.items():
+        logger_entries[name] = _logger_entry(**conf)
+
+    # Fails before changing anything
+    routing = LogRouting(**options)
+
+    stderr_conf = (formatters[formatter], level)
+    if incremental and _update_logging(stderr_conf, logger_entries, routing):
+        return
+    # dictConfig closes the handlers it replaces: drain the queue first
+    stop_log_queue()
+    _install_logging(formatters, formatter, level, logger_entries)
+    _route_loggers(_installed.handler, _installed.loggers, routing)
 
 
 class LoggingOptMixin(PluginHelpers):
@@ -247,6 +584,39 @@ class LoggingOptMixin(PluginHelpers):
         ),
     )
 
+    log_async = Argument(
+        "--log-async",
+        default=None,
+        action=argparse.BooleanOptionalAction,
+        help="Write logs from a background thread (default: Meta.log_async)",
+    )
+
+    log_file = Argument(
+        "--log-file",
+        default=None,
+        metavar="PATH",
+        help="Also write logs to PATH, relative to --log-dir when defined",
+    )
+
+    log_file_format = Argument(
+        "--log-file-format",
+        choices=list(LOG_FILE_FORMATS),
+        default=None,
+        help="Log file record format (default: Meta.log_file_format or text)",
+    )
+
+    log_sample = Argument(
+        "--log-sample",
+        action="append",
+        type=_log_sample_arg,
+        default=None,
+        metavar="[LOGGER=]RATE",
+        help=(
+            "Rate limit log records below WARNING per logger and message, "
+            "as COUNT/PERIOD (10/s, 100/m); without LOGGER, every logger"
+        ),
+    )
+
     # Meta settings
     meta__config__log_prefix = MetaSetting(
         help=(
@@ -276,8 +646,75 @@ class LoggingOptMixin(PluginHelpers):
         ),
     )
 
+    meta__config__log_async = MetaSetting(
+        help="Write logs from a background thread, like --log-async",
+    )
+    meta__config__log_queue_size = MetaSetting(
+        help=f"Records held by the async log queue. Default: {DEFAULT_LOG_QUEUE_SIZE}",
+    )
+    meta__config__log_queue_policy = MetaSetting(
+        help=f"When the async log queue is full, one of: {LOG_QUEUE_POLICIES}",
+    )
+
+    meta__config__log_file = MetaSetting(
+        help="Default of --log-file, relative to --log-dir when defined",
+    )
+    meta__config__log_file_format = MetaSetting(
+        help=f"Default of --log-file-format, one of: {LOG_FILE_FORMATS}",
+    )
+    meta__config__log_file_level = MetaSetting(
+        help="Lowest level written to the log file. Default: DEBUG",
+    )
+    meta__config__log_file_max_bytes = MetaSetting(
+        help="Log file size that triggers a rotation, 0 to never rotate",
+    )
+    meta__config__log_file_backups = MetaSetting(
+        help="Rotated log files kept",
+    )
+    meta__config__log_file_buffer = MetaSetting(
+        help="Records buffered before a log file write (WARNING flushes at once)",
+    )
+
+    meta__config__log_rate_limits = MetaSetting(
+        help=(
+            "Rate limits per logger name ('' for all), like --log-sample: "
+            "'10/s', a number per second or {'rate': ..., 'burst': ...}"
+        ),
+    )
+    meta__config__log_rate_summary = MetaSetting(
+        help=(
+            "Seconds between 'Suppressed N similar messages' records. "
+            f"Default: {DEFAULT_LOG_RATE_SUMMARY}"
+        ),
+    )
+
     logger = None
 
+    def _log_file_settings(self, args):
+        """Return ``(path, options)`` of the log file, or ``(None, None)``."""
+        path = args.get("log_file") or self.query_cfg_parents(
+            "log_file", default=None, include_self=True
+        )
+        if not path:
+            return None, None
+        path = os.path.expanduser(os.fspath(path))
+        log_dir = args.get("xdg_log_dir")
+        if log_dir and not os.path.isabs(path):
+            path = os.path.join(log_dir, path)
+
+        options = {}
+        for name in DEFAULT_LOG_FILE_OPTIONS:
+            value = self.query_cfg_parents(
+                f"log_file_{name}", default=None, include_self=True
+            )
+            if value is not None:
+                options[name] = value
+        if args.get("log_file_format"):
+            options["format"] = args.get("log_file_format")
+        if "level" in options:
+            options["level"] = self._log_level(options["level"])
+        return path, options
+
     def add_arguments(self, arguments: dict = None):
         """Format ``--log-colors`` help with ``Meta.log_colors_env``, then register."""
         if arguments is None:
@@ -422,6 +859,28 @@ class LoggingOptMixin(PluginHelpers):
             log_colors = resolve_log_colors(
                 ctx.args.get("log_colors"), env_value=env_log_colors
             )
+            log_async = ctx.args.get("log_async")
+            if log_async is None:
+                log_async = self.query_cfg_parents(
+                    "log_async", default=False, include_self=True
+                )
+            log_queue_size = self.query_cfg_parents(
+                "log_queue_size", default=DEFAULT_LOG_QUEUE_SIZE, include_self=True
+            )
+            log_queue_policy = self.query_cfg_parents(
+                "log_queue_policy", default="block", include_self=True
+            )
+            log_file, log_file_options = self._log_file_settings(ctx.args)
+            log_rate_limits = dict(
+                self.query_cfg_parents(
+                    "log_rate_limits", default=None, include_self=True
+                )
+                or {}
+            )
+            log_rate_limits.update(ctx.args.get("log_sample") or [])
+            log_rate_summary = self.query_cfg_parents(
+                "log_rate_summary", default=DEFAULT_LOG_RATE_SUMMARY, include_self=True
+            )
 
             log_silent = log_silent or []
             if not isinstance(log_silent, list) or not all(
@@ -447,20 +906,32 @@ class LoggingOptMixin(PluginHelpers):
                 level=logging.NOTSET,
                 formatter=ctx.args.log_format,
                 colors=log_colors,
+                log_async=bool(log_async),
+                queue_size=log_queue_size or DEFAULT_LOG_QUEUE_SIZE,
+                queue_policy=log_queue_policy or "block",
+                log_file=log_file,
+                log_file_options=log_file_options,
+                rate_limits=log_rate_limits,
+                rate_summary=log_rate_summary or DEFAULT_LOG_RATE_SUMMARY,
             )
 
-            logger.info(
-                "Logging set to %s/%s",
-                log_verbosity,
-                log_config.max_level,
-            )
-            for name, conf in logger_config.items():
-                logger.info("  %s: %s", logging.getLevelName(conf["level"]), name)
-            if log_silent:
-                if logs_silenced:
-                    logger.info("Logging to WARNING: %s", ", ".join(log_silent))
-                else:
-                    logger.info("All configured logs are shown")
+            if _TRACE_SETUP:
+                _TRACE_SETUP(
+                    "Logging set to %s/%s",
+                    log_verbosity,
+                    log_config.max_level,
+                )
+                for name, conf in logger_config.items():
+                    _TRACE_SETUP("  %s: %s", logging.getLevelName(conf["level"]), name)
+                if log_file:
+                    _TRACE_SETUP("Logging to file: %s", log_file)
+                for name, spec in log_rate_limits.items():
+                    _TRACE_SETUP("Rate limit %s: %s", name or "<all>", spec)
+                if log_silent:
+                    if logs_silenced:
+                        _TRACE_SETUP("Logging to WARNING: %s", ", ".join(log_silent))
+                    else:
+                        _TRACE_SETUP("All configured logs are shown")
 
         # Create internal logger instance if not already created
         if log_suffix is None:
@@ -5,16 +5,21 @@ Option layers (mirror ClakView hierarchy):
 1. ClakViewOptMixin — generic (no CLI flags)
 2. TableViewOptMixin — table (Show/List): ``width``, ``format``, ``columns``,
    ``sort_columns``, ``sort_mode``, ``wrap``, ``add_index``
-3. ListViewMixin — list-only: ``expand_keys``
+3. RowWindowOptMixin — list rows (List/Composite): ``expand_keys``,
+   ``limit``, ``offset``
 4. TextLayoutOptMixin — text wrap: ``line_length``
 5. TextViewOptMixin — text (Markdown/Rst): ``format`` (``view`` / ``raw``)
    plus ``line_length``
 6. PprintViewMixin / RawViewMixin — ``line_length`` only
 7. DataViewMixin — structured dump: ``format``, ``compact``, ``color``,
    ``anchors``
-8. CompositeViewMixin — table opts + ``expand_keys`` + ``format_scope`` +
+8. CompositeViewMixin — table opts + list opts + ``format_scope`` +
    ``line_length`` (return a ``CompositeView``; no auto ``cli_view``)
 
+List, Data and Composite also add ``output`` (write to a file, see
+OutputFileOptMixin). Every layer also reads ``Meta.view_pager`` (page TTY
+output through ``CLAK_PAGER`` / ``PAGER``).
+
 Example:
 
     class App(ListViewMixin, Parser):
@@ -43,8 +48,8 @@ from typing import Any, Mapping, Set
 from clak.core.descriptors import Argument, MetaSetting
 from clak.core.plugins import PluginHelpers
 from clak.views import (
-    DATA_FORMATS,
     FORMAT_SCOPES,
+    OUTPUT_FORMATS,
     TEXT_FORMATS,
     WIDTH_MODES,
     DataView,
@@ -56,12 +61,16 @@ from clak.views import (
     ShowView,
 )
 from clak.views.base import normalize_width_mode, parse_line_length
+from clak.views.data import DataFormatChoices
+from clak.views.pager import DEFAULT_PAGER
+from clak.views.sink import format_for_path
 from clak.views.table import (
     normalize_columns,
     normalize_sort_columns,
     normalize_wrap,
     normalize_wrap_min,
     parse_columns,
+    parse_row_count,
     parse_sort_columns,
     parse_wrap,
 )
@@ -80,11 +89,12 @@ _LAYER_TABLE_DESTS = frozenset(
         "add_index",
     }
 )
-_LAYER_LIST_DESTS = frozenset({"expand_keys"})
+_LAYER_LIST_DESTS = frozenset({"expand_keys", "limit", "offset"})
 _LAYER_TEXT_LAYOUT_DESTS = frozenset({"line_length"})
 _LAYER_TEXT_DESTS = frozenset({"format"})
 _LAYER_DATA_DESTS = frozenset({"format", "compact", "color", "anchors"})
 _LAYER_COMPOSITE_DESTS = frozenset({"format_scope"})
+_LAYER_OUTPUT_DESTS = frozenset({"output"})
 
 # All known view CLI dests (used to filter Argument collection)
 _VIEW_CLI_OPTION_DESTS = (
@@ -94,6 +104,7 @@ _VIEW_CLI_OPTION_DESTS = (
     | _LAYER_TEXT_DESTS
     | _LAYER_DATA_DESTS
     | _LAYER_COMPOSITE_DESTS
+    | _LAYER_OUTPUT_DESTS
 )
 
 _OUTPUT_OPTIONS_GROUP = "Output options"
@@ -126,7 +137,8 @@ _LINE_LENGTH_HELP = (
 _FORMAT_HELP = "Output format (default: view table)"
 _TEXT_FORMAT_HELP = "Output format: view (rendered) or raw (source). Default: view"
 _DATA_FORMAT_HELP = (
-    "Output format: json or yaml. Default: yaml when PyYAML is installed, else json"
+    "Output format: json, yaml, or ndjson (one record per line). "
+    "Default: yaml when PyYAML is installed, else json"
 )
 _COMPACT_HELP = "Compact JSON (single line). Ignored for YAML. Default: off"
 _COLOR_HELP = (
@@ -140,6 +152,16 @@ _ANCHORS_HELP = (
 _SORT_MODE_HELP = "Sort direction (default: asc)"
 _ADD_INDEX_HELP = "Include key/index column in the table"
 _EXPAND_KEYS_HELP = "Expand nested dict items into table columns"
+_LIMIT_HELP = (
+    "Show at most N rows (after sorting); the table ends with an "
+    "'N more rows' marker"
+)
+_OFFSET_HELP = "Skip the first N rows (after sorting)"
+_OUTPUT_HELP = (
+    "Write output to PATH (replaced atomically, without colors). The format "
+    "follows the suffix (.csv, .json, .ndjson, .yaml) unless --format is "
+    "set; .gz, .bz2 and .xz are compressed"
+)
 _FORMAT_SCOPE_HELP = (
     "When using CompositeView with machine formats: first (primary "
     "section only) or all (envelope of every section). Default: first"
@@ -150,6 +172,10 @@ class _ViewMixinBase(PluginHelpers):
     """Shared view-mixin plumbing: option filtering, hook, settings collection."""
 
     _view_cli_option_names: frozenset[str] = frozenset()
+    # (setting, Meta name) pairs filled from Meta only, without a CLI flag
+    _view_meta_settings: tuple = ()
+    # Formats ``--output`` may infer from the file suffix
+    _output_file_formats = frozenset()
 
     meta__config__view_cli_options = MetaSetting(
         help=(
@@ -159,6 +185,20 @@ class _ViewMixinBase(PluginHelpers):
     )
     meta__view_cli_options = True
 
+    meta__config__view_pager = MetaSetting(
+        help=(
+            "Page output through CLAK_PAGER / PAGER (default less) when "
+            "stdout is a TTY: True or False (default)"
+        ),
+    )
+    meta__view_pager = None
+
+    # Read by the layers that list ``ndjson_batch`` in _view_meta_settings
+    meta__config__view_ndjson_batch = MetaSetting(
+        help="Records written (and flushed) per batch with --format ndjson",
+    )
+    meta__view_ndjson_batch = None
+
     def _enabled_view_options(self) -> Set[str]:
         available = set(self._view_cli_option_names)
         configured = self.query_cfg_parents(
@@ -224,6 +264,8 @@ class _ViewMixinBase(PluginHelpers):
         for key in (
             "add_index",
             "expand_keys",
+            "limit",
+            "offset",
             "width",
             "format",
             "format_scope",
@@ -266,6 +308,8 @@ class _ViewMixinBase(PluginHelpers):
             ("format_scope", "view_format_scope", None),
             ("add_index", "view_add_index", None),
             ("expand_keys", "view_expand_keys", None),
+            ("limit", "view_limit", parse_row_count),
+            ("offset", "view_offset", parse_row_count),
             ("compact", "view_compact", None),
             ("color", "view_color", None),
             ("anchors", "view_anchors", None),
@@ -287,6 +331,14 @@ class _ViewMixinBase(PluginHelpers):
             if value is not None:
                 settings["wrap_min"] = normalize_wrap_min(value)
 
+        # Meta-only settings (no CLI flag) declared per mixin
+        for key, meta_name in self._view_meta_settings:
+            if key in settings:
+                continue
+            value = self.query_cfg_parents(meta_name, default=None, include_self=True)
+            if value is not None:
+                settings[key] = value
+
         if getattr(self, "_uses_syntax_theme", False) and "theme" not in settings:
             value = self.query_cfg_parents(
                 "view_syntax_theme", default=None, include_self=True
@@ -294,13 +346,37 @@ class _ViewMixinBase(PluginHelpers):
             if value is not None:
                 settings["theme"] = value
 
+    def _apply_output_file(self, settings: dict, args: Any, enabled: Set[str]):
+        """``--output PATH``: format from the file suffix, no colors."""
+        if "output" not in enabled:
+            return
+        path = self._args_get(args, "output", None)
+        if not path:
+            return
+        settings["output"] = path
+        fmt = format_for_path(path)
+        if "format" not in settings and fmt in self._output_file_formats:
+            settings["format"] = fmt
+        settings["clak_colors"] = False
+        if "color" in self._view_cli_option_names:
+            settings["color"] = False
+
     def collect_view_settings(self, args: Any) -> dict:
         """Build view render kwargs from parsed CLI args (only set flags)."""
         enabled = self._enabled_view_options()
         settings = self._collect_enabled_cli_settings(args, enabled)
+        # Before Meta defaults: the file suffix beats Meta.view_format
+        self._apply_output_file(settings, args, enabled)
         self._apply_meta_view_defaults(settings, enabled)
         return settings
 
+    def _view_pager_command(self, runtime):
+        """Pager command when ``Meta.view_pager`` is on and stdout is a TTY."""
+        enabled = self.query_cfg_parents("view_pager", default=None, include_self=True)
+        if not enabled or not runtime.stdout_tty:
+            return None
+        return runtime.pager or DEFAULT_PAGER
+
     def cli_hook__views(self, instance, ctx, **_):  # pylint: disable=unused-argument
         "Collect view CLI options into ctx.plugins and stash on root for dispatch."
         settings = self.collect_view_settings(ctx.args)
@@ -309,6 +385,12 @@ class _ViewMixinBase(PluginHelpers):
             runtime.get_size()
             settings["term_width"] = runtime.term_width
             settings["stdout_tty"] = runtime.stdout_tty
+            pager = self._view_pager_command(runtime)
+            if pager and "output" not in settings:
+                settings["pager"] = pager
+        if "output" in settings:
+            # Files get unwrapped text, like a redirected stdout
+            settings["stdout_tty"] = False
         ctx.plugins["view_settings"] = settings
         logger.debug("View settings for %s: %s", instance, settings)
 
@@ -319,10 +401,61 @@ class ClakViewOptMixin(_ViewMixinBase):
     _view_cli_option_names = frozenset()
 
 
+class RowWindowOptMixin(_ViewMixinBase):
+    """Layer 3: list row options shared by List and Composite."""
+
+    _view_cli_option_names = _LAYER_LIST_DESTS
+
+    meta__config__view_expand_keys = MetaSetting(
+        help="Default for --expand-keys / --no-expand-keys",
+    )
+    meta__view_expand_keys = None
+
+    expand_keys = Argument(
+        "--expand-keys",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        option_group=_OUTPUT_OPTIONS_GROUP,
+        help=_EXPAND_KEYS_HELP,
+    )
+
+    meta__config__view_limit = MetaSetting(
+        help="Default for --limit (rows shown after sorting)",
+    )
+    meta__view_limit = None
+
+    meta__config__view_offset = MetaSetting(
+        help="Default for --offset (rows skipped after sorting)",
+    )
+    meta__view_offset = None
+
+    limit = Argument(
+        "--limit",
+        type=parse_row_count,
+        default=None,
+        metavar="N",
+        option_group=_OUTPUT_OPTIONS_GROUP,
+        help=_LIMIT_HELP,
+    )
+    offset = Argument(
+        "--offset",
+        type=parse_row_count,
+        default=None,
+        metavar="N",
+        option_group=_OUTPUT_OPTIONS_GROUP,
+        help=_OFFSET_HELP,
+    )
+
+
 class TableViewOptMixin(ClakViewOptMixin):
     """Layer 2: table view options shared by Show and List."""
 
     _view_cli_option_names = _LAYER_TABLE_DESTS
+    _view_meta_settings = (
+        ("ndjson_batch", "view_ndjson_batch"),
+        ("table_backend", "view_table_backend"),
+        ("presorted", "view_presorted"),
+    )
 
     meta__config__view_width = MetaSetting(
         help="Default table width: content, fit, or terminal",
@@ -383,15 +516,31 @@ class TableViewOptMixin(ClakViewOptMixin):
     meta__view_wrap_min = None
 
     meta__config__view_format = MetaSetting(
-        help="Default output format: view, yaml, json, or csv",
+        help="Default output format: view, yaml, json, ndjson, or csv",
     )
     meta__view_format = None
 
+    meta__config__view_table_backend = MetaSetting(
+        help=(
+            "Table renderer: prettytable (default) or native. "
+            "Overrides CLAK_TABLE_BACKEND"
+        ),
+    )
+    meta__view_table_backend = None
+
     meta__config__view_add_index = MetaSetting(
         help="Default for --add-index / --no-add-index",
     )
     meta__view_add_index = None
 
+    meta__config__view_presorted = MetaSetting(
+        help=(
+            "Rows are returned already in display order: skip the default "
+            "sort (explicit --sort still applies)"
+        ),
+    )
+    meta__view_presorted = None
+
     columns = Argument(
         "--columns",
         default=None,
@@ -407,7 +556,7 @@ class TableViewOptMixin(ClakViewOptMixin):
     )
     format = Argument(
         "--format",
-        choices=["view", "yaml", "json", "csv"],
+        choices=["view", "yaml", "json", "ndjson", "csv"],
         default=None,
         option_group=_OUTPUT_OPTIONS_GROUP,
         help=_FORMAT_HELP,
@@ -434,6 +583,28 @@ class TableViewOptMixin(ClakViewOptMixin):
     )
 
 
+class OutputFileOptMixin(_ViewMixinBase):
+    """``--output PATH``: write the rendered view to a file.
+
+    The file is written to a temporary file in the same directory and
+    renamed into place once complete (see
+    :class:`~clak.views.sink.AtomicFileSink`), compressed while writing
+    when the name ends with ``.gz``, ``.bz2`` or ``.xz``. Without
+    ``--format``, the format follows the suffix; colors, wrapping and the
+    pager are off.
+    """
+
+    _view_cli_option_names = _LAYER_OUTPUT_DESTS
+
+    output = Argument(
+        "--output",
+        default=None,
+        metavar="PATH",
+        option_group=_OUTPUT_OPTIONS_GROUP,
+        help=_OUTPUT_HELP,
+    )
+
+
 class ShowViewMixin(TableViewOptMixin):
     """Auto-render command results with :class:`~clak.views.ShowView`.
 
@@ -447,30 +618,50 @@ class ShowViewMixin(TableViewOptMixin):
     meta__cli_view = ShowView
 
 
-class ListViewMixin(TableViewOptMixin):
+class ListViewMixin(RowWindowOptMixin, OutputFileOptMixin, TableViewOptMixin):
     """Auto-render command results with :class:`~clak.views.ListView`.
 
     Adds ``--columns``, ``--add-index`` / ``--no-add-index``,
     ``--expand-keys`` / ``--no-expand-keys``, ``--format``,
-    ``--sort-columns``, ``--sort-mode``, ``--width``, and ``--wrap``.
+    ``--sort-columns``, ``--sort-mode``, ``--width``, ``--wrap``,
+    ``--limit``, ``--offset``, and ``--output``.
     Configure exposed flags with ``Meta.view_cli_options``.
     """
 
-    _view_cli_option_names = _LAYER_TABLE_DESTS | _LAYER_LIST_DESTS
+    _view_cli_option_names = (
+        _LAYER_TABLE_DESTS | _LAYER_LIST_DESTS | _LAYER_OUTPUT_DESTS
+    )
+    _output_file_formats = OUTPUT_FORMATS
+    _view_meta_settings = TableViewOptMixin._view_meta_settings + (
+        ("stream_sample", "view_stream_sample"),
+        ("stream_overflow", "view_stream_overflow"),
+        ("sort_buffer", "view_sort_buffer"),
+    )
     meta__cli_view = ListView
 
-    meta__config__view_expand_keys = MetaSetting(
-        help="Default for --expand-keys / --no-expand-keys",
+    meta__config__view_stream_sample = MetaSetting(
+        help=(
+            "Rows read ahead to size table columns when the command returns "
+            "an iterator (default: 200)"
+        ),
     )
-    meta__view_expand_keys = None
+    meta__view_stream_sample = None
 
-    expand_keys = Argument(
-        "--expand-keys",
-        action=argparse.BooleanOptionalAction,
-        default=None,
-        option_group=_OUTPUT_OPTIONS_GROUP,
-        help=_EXPAND_KEYS_HELP,
+    meta__config__view_stream_overflow = MetaSetting(
+        help=(
+            "Streamed rows wider than the sampled columns: wrap (default) "
+            "or truncate"
+        ),
+    )
+    meta__view_stream_overflow = None
+
+    meta__config__view_sort_buffer = MetaSetting(
+        help=(
+            "Rows of a sorted iterator kept in memory; larger streams spill "
+            "sorted runs to $XDG_CACHE_HOME/clak/sort (default: 100000)"
+        ),
     )
+    meta__view_sort_buffer = None
 
 
 class TextLayoutOptMixin(ClakViewOptMixin):
@@ -564,21 +755,25 @@ class RstViewMixin(TextViewOptMixin):
     meta__cli_view = RstView
 
 
-class DataViewMixin(_ViewMixinBase):
+class DataViewMixin(OutputFileOptMixin):
     """Auto-render command results with :class:`~clak.views.DataView`.
 
-    Adds ``--format`` (``json`` / ``yaml``), ``--compact`` / ``--no-compact``,
-    ``--color`` / ``--no-color``, and ``--anchors`` / ``--no-anchors``.
+    Adds ``--format`` (``json`` / ``yaml`` / ``ndjson``), ``--compact`` /
+    ``--no-compact``,
+    ``--color`` / ``--no-color``, ``--anchors`` / ``--no-anchors``, and
+    ``--output``.
     Syntax theme: ``Meta.view_syntax_theme`` or ``CLAK_SYNTAX_THEME``, else
     ``ansi_dark``. Configure exposed flags with ``Meta.view_cli_options``.
     """
 
-    _view_cli_option_names = _LAYER_DATA_DESTS
+    _view_cli_option_names = _LAYER_DATA_DESTS | _LAYER_OUTPUT_DESTS
+    _output_file_formats = DataFormatChoices()
     _uses_syntax_theme = True
+    _view_meta_settings = (("ndjson_batch", "view_ndjson_batch"),)
     meta__cli_view = DataView
 
     meta__config__view_format = MetaSetting(
-        help="Default data format: json, yaml, or unset for auto",
+        help="Default data format: json, yaml, ndjson, or unset for auto",
     )
     meta__view_format = None
 
@@ -607,7 +802,7 @@ class DataViewMixin(_ViewMixinBase):
 
     format = Argument(
         "--format",
-        choices=sorted(DATA_FORMATS),
+        choices=DataFormatChoices(),
         default=None,
         option_group=_OUTPUT_OPTIONS_GROUP,
         help=_DATA_FORMAT_HELP,
@@ -638,16 +833,21 @@ class DataViewMixin(_ViewMixinBase):
     )
 
 
-class CompositeViewMixin(TextLayoutOptMixin, TableViewOptMixin):
+class CompositeViewMixin(
+    RowWindowOptMixin, OutputFileOptMixin, TextLayoutOptMixin, TableViewOptMixin
+):
     """CLI flags for multi-section :class:`~clak.views.CompositeView` output.
 
-    Adds table options, ``--expand-keys``, ``--format-scope``, ``--width``,
-    and ``--line-length``. Does **not** set ``Meta.cli_view``: return a
-    ``CompositeView(...)`` from ``cli_run``. Table flags apply to the primary
-    section only. ``--line-length`` applies to text/pprint sections only.
-    ``--expand-keys`` is for a ListView primary; hide it with
-    ``Meta.view_cli_options`` when the primary is ShowView.
-    ``--format`` is table-scoped (``view`` / ``yaml`` / ``json`` / ``csv``);
+    Adds table options, ``--expand-keys``, ``--limit``, ``--offset``,
+    ``--format-scope``, ``--width``, ``--line-length``, and ``--output``.
+    Does **not** set ``Meta.cli_view``: return a ``CompositeView(...)``
+    from ``cli_run``. Table flags apply to the primary section only.
+    ``--line-length`` applies to text/pprint sections only.
+    ``--expand-keys``, ``--limit`` and ``--offset`` are for a ListView
+    primary; hide them with ``Meta.view_cli_options`` when the primary is
+    ShowView.
+    ``--format`` is table-scoped (``view`` / ``yaml`` / ``json`` / ``ndjson``
+    / ``csv``);
     markdown source is in ``--format-scope all`` envelopes, not ``--format raw``.
     """
 
@@ -656,25 +856,15 @@ class CompositeViewMixin(TextLayoutOptMixin, TableViewOptMixin):
         | _LAYER_LIST_DESTS
         | _LAYER_COMPOSITE_DESTS
         | _LAYER_TEXT_LAYOUT_DESTS
+        | _LAYER_OUTPUT_DESTS
     )
+    _output_file_formats = OUTPUT_FORMATS
 
     meta__config__view_format_scope = MetaSetting(
         help="Default format scope for CompositeView: first or all",
     )
     meta__view_format_scope = None
 
-    meta__config__view_expand_keys = MetaSetting(
-        help="Default for --expand-keys / --no-expand-keys",
-    )
-    meta__view_expand_keys = None
-
-    expand_keys = Argument(
-        "--expand-keys",
-        action=argparse.BooleanOptionalAction,
-        default=None,
-        option_group=_OUTPUT_OPTIONS_GROUP,
-        help=_EXPAND_KEYS_HELP,
-    )
     format_scope = Argument(
         "--format-scope",
         choices=sorted(FORMAT_SCOPES),
@@ -14,15 +14,29 @@ from clak.core.plugins import CLI_HOOK_PREFIX
 from clak.runtime.facts import detect_facts
 from clak.runtime.runtime import detect_runtime
 from clak.runtime.settings import ClakSettings, apply_debug_logging
+from clak.runtime.tracing import TracePoint
 from clak.views import ClakView
+from clak.views.pager import paged_output
+from clak.views.sink import AtomicFileSink, output_to
 
 # Same logger as parser.py so tests can patch clak.core.parser.logger
 logger = logging.getLogger("clak.core.parser")
+_TRACE = TracePoint(logger)
+_TRACE_NODES = TracePoint(logger, logging.INFO)
+
+
+def _view_output(pager=None, output=None):
+    """Where the view writes: ``--output`` file, pager, or stdout."""
+    if output:
+        return output_to(AtomicFileSink(output))
+    return paged_output(pager)
 
 
 class Dispatcher:
     """Argv parse, hook walk, and view render. Owned by a ParserNode."""
 
+    __slots__ = ("node", "ctx")
+
     def __init__(self, node):
         self.node = node
         self.ctx = None
@@ -116,11 +130,14 @@ class Dispatcher:
                     ctx_settings = getattr(ctx, "settings", None)
                     if ctx_settings is not None:
                         view_settings.setdefault("clak_colors", ctx_settings.colors)
+                pager = view_settings.pop("pager", None)
+                output = view_settings.pop("output", None)
                 if isinstance(data, ClakView):
                     render_kwargs = ClakView.merge_settings(
                         getattr(data, "settings", None), view_settings
                     )
-                    data.render(**render_kwargs)
+                    with _view_output(pager, output):
+                        data.render(**render_kwargs)
                 else:
                     viewer = cli_leaf.query_cfg_parents("cli_view", default=None)
                     if isinstance(viewer, type) and issubclass(viewer, ClakView):
@@ -130,7 +147,8 @@ class Dispatcher:
                             raise TypeError(
                                 "Meta.cli_view must be a ClakView instance or subclass"
                             )
-                        viewer.render(data, **view_settings)
+                        with _view_output(pager, output):
+                            viewer.render(data, **view_settings)
 
                 return data
 
@@ -152,7 +170,7 @@ class Dispatcher:
         logger.critical("Error: %s", error)
         sys.exit(1)
 
-    def cli_execute(  # pylint: disable=too-many-locals,too-many-statements
+    def cli_execute(  # pylint: disable=too-many-locals,too-many-statements,too-many-branches
         self,
         args: Optional[Dict[str, Any]] = None,
         settings: Optional[ClakSettings] = None,
@@ -196,7 +214,8 @@ class Dispatcher:
         hierarchy = cli_self.get_hierarchy()
         node_count = len(hierarchy)
 
-        logger.debug("Run instance %s", cli_self)
+        if _TRACE:
+            _TRACE("Run instance %s", cli_self)
 
         if settings is None:
             settings = ClakSettings.current()
@@ -221,10 +240,12 @@ class Dispatcher:
         self.ctx = ctx
 
         ret = None
+        tracing = _TRACE_NODES.enabled
         for idx, walk_node in enumerate(hierarchy):
             last_node = idx == (node_count - 1)
 
-            logger.info("Processing node %d:%s.%s", idx, walk_node, fn_group_name)
+            if tracing:
+                _TRACE_NODES("Processing node %d:%s.%s", idx, walk_node, fn_group_name)
 
             node_hooks = getattr(walk_node, "_cli_hooks", None)
             if node_hooks is None:
@@ -245,26 +266,34 @@ class Dispatcher:
             ctx.cli_state = "run_hooks"
 
             for hook_name, hook_fn in hook_list.items():
-                logger.info("Run hook %d:%s.%s", idx, walk_node, hook_name)
+                if tracing:
+                    _TRACE_NODES("Run hook %d:%s.%s", idx, walk_node, hook_name)
                 hook_fn(walk_node, ctx)
+            # Hooks configure logging: read the level again once they ran
+            tracing = _TRACE_NODES.enabled
 
             ctx.cli_methods = getattr(walk_node, "cli_methods", {})
             ctx.cli_state = "run_groups"
 
             group_fn = getattr(walk_node, fn_group_name, None)
             if group_fn is not None:
-                logger.info(
-                    "Group function execute: %d:%s.%s", idx, walk_node, fn_group_name
-                )
+                if tracing:
+                    _TRACE_NODES(
+                        "Group function execute: %d:%s.%s",
+                        idx,
+                        walk_node,
+                        fn_group_name,
+                    )
                 group_fn(ctx=ctx, **ctx.__dict__)
 
             ctx.cli_state = "run_exec"
             if last_node is True:
                 run_fn = getattr(walk_node, fn_exec_name, None)
 
-                logger.info(
-                    "Run function execute: %d:%s.%s", idx, walk_node, fn_exec_name
-                )
+                if tracing:
+                    _TRACE_NODES(
+                        "Run function execute: %d:%s.%s", idx, walk_node, fn_exec_name
+                    )
                 ret = run_fn(ctx=ctx, **ctx.args.__dict__)
 
             ctx.cli_first = False
@@ -10,6 +10,15 @@ from clak import exception
 logger = logging.getLogger("clak.core.parser")
 
 
+def _flush_log_handlers():
+    """Write records still held by root handlers (``--log-async`` queue)."""
+    for handler in logging.getLogger().handlers:
+        try:
+            handler.flush()
+        except Exception:  # pylint: disable=broad-exception-caught
+            pass
+
+
 def _exit_broken_pipe(rc=1):
     """Exit quietly after BrokenPipeError (e.g. ``| head`` / ``| tail``).
 
@@ -30,6 +39,8 @@ def _exit_broken_pipe(rc=1):
 class Terminator:  # pylint: disable=too-few-public-methods
     """Paasify-style terminate chain used by ``Dispatcher.dispatch()``."""
 
+    __slots__ = ("node",)
+
     def __init__(self, node):
         self.node = node
 
@@ -43,6 +54,7 @@ class Terminator:  # pylint: disable=too-few-public-methods
         advice = getattr(err, "advice", None)
         if isinstance(advice, str):
             logger.warning(advice)
+            _flush_log_handlers()
 
     def _terminate_app_exception(self, err):
         """Default handler for app exceptions (Paasify-style: rc + message)."""
@@ -94,6 +106,8 @@ class Terminator:  # pylint: disable=too-few-public-methods
         """
 
         node = self.node
+        # Queued log records come before the error report
+        _flush_log_handlers()
 
         # 1. App-known exceptions (e.g. PaasifyError hierarchy)
         for exc_type, handler in self._iter_exception_entries(known_exceptions):
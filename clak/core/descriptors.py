@@ -16,8 +16,10 @@ from clak.core.argparse_ import (
 )
 from clak.core.help_render import HelpArg
 from clak.core.nodes import Fn
+from clak.runtime.tracing import TracePoint
 
 logger = logging.getLogger(__name__)
+_TRACE = TracePoint(logger)
 
 
 def _kwargs_for_add_argument(kwargs: dict, parser) -> dict:
@@ -260,6 +262,7 @@ class Argument(ArgParseItem):
         key: str,
         config: "ParserNode",
         attach_overrides: Optional[dict] = None,
+        shared: Optional[dict] = None,
     ) -> argparse.Action:
         """Create and add an argument to the parser.
 
@@ -268,11 +271,43 @@ class Argument(ArgParseItem):
             config (ParserNode): The parser configuration object
             attach_overrides (dict): Kwargs applied only to this attach
                 (not stored on the shared Argument descriptor).
+            shared (dict): Attached copies by key. The action and HelpArg
+                built on the first parser are added as-is to later ones;
+                argparse only reads actions when parsing or formatting help.
 
         Returns:
             argparse.Action: The created argument parser action
         """
         parser = config.parser
+        cached = shared.get(key) if shared is not None else None
+        if cached is None:
+            if _TRACE:
+                _TRACE(
+                    "Create new argument %s.%s: %s",
+                    config.get_fname(attr="key"),
+                    key,
+                    self.kwargs,
+                )
+            action, help_arg, help_group_title, exclusive_key = self._create_action(
+                key, config, attach_overrides
+            )
+            if shared is not None:
+                shared[key] = (action, help_arg, help_group_title, exclusive_key)
+        else:
+            action, help_arg, help_group_title, exclusive_key = cached
+            if _TRACE:
+                _TRACE("Share argument %s.%s", config.get_fname(attr="key"), key)
+            target = _parser_add_target(parser, help_group_title, exclusive_key)
+            target._add_action(action)  # pylint: disable=protected-access
+
+        help_args = getattr(config, "help_args", None)
+        if help_args is not None:
+            help_args.append(help_arg)
+        return action
+
+    def _create_action(self, key, config, attach_overrides):
+        """(action, HelpArg, help group title, exclusive key) for a new attach."""
+        parser = config.parser
         args, kwargs = self.build_params(key)
         kwargs = dict(kwargs)
         if attach_overrides:
@@ -286,20 +321,10 @@ class Argument(ArgParseItem):
         exclusive_key = kwargs.pop("exclusive_group", None)
         kwargs.pop("propagate", None)
 
-        # Create argument
-        logger.debug(
-            "Create new argument %s.%s: %s",
-            config.get_fname(attr="key"),
-            key,
-            self.kwargs,
-        )
-
         target = _parser_add_target(parser, help_group_title, exclusive_key)
         action = target.add_argument(*args, **_kwargs_for_add_argument(kwargs, parser))
-        help_args = getattr(config, "help_args", None)
-        if help_args is not None:
-            help_args.append(HelpArg.from_action(action, group=help_group_title))
-        return action
+        help_arg = HelpArg.from_action(action, group=help_group_title)
+        return action, help_arg, help_group_title, exclusive_key
 
 
 def _check_arg_opt_names(args, expect_option: bool, cls_name: str) -> None:
@@ -417,11 +442,8 @@ class SubParser(ArgParseItem):
                 f"Command name '{key}' contains spaces. Command names must not contain spaces."
             )
 
-        logger.debug(
-            "Create new subparser %s.%s",
-            config.get_fname(attr="key"),
-            key,
-        )
+        if _TRACE:
+            _TRACE("Create new subparser %s.%s", config.get_fname(attr="key"), key)
 
         # Fetch help from class
         parser_help = self.kwargs.get(
@@ -26,7 +26,7 @@ def strip_rst_literals(text: Optional[str]) -> str:
     return text.replace("``", "")
 
 
-@dataclass
+@dataclass(slots=True)
 class HelpLayout:
     """Listing policy for subcommands on one ParserNode."""
 
@@ -47,7 +47,7 @@ class HelpLayout:
             self.command_groups = tuple(self.command_groups or ())
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _HelpWidths:
     """Column widths for one --help listing."""
 
@@ -56,7 +56,7 @@ class _HelpWidths:
     help_width: int
 
 
-@dataclass
+@dataclass(slots=True)
 class HelpArg:  # pylint: disable=too-many-instance-attributes
     """One attached argument, recorded at add_argument time."""
 
@@ -98,7 +98,7 @@ class HelpArg:  # pylint: disable=too-many-instance-attributes
         return self.suppress or (self.dest or "").startswith("__")
 
 
-@dataclass
+@dataclass(slots=True)
 class HelpLine:
     """One output line as typed parts (kind, text)."""
 
@@ -110,7 +110,7 @@ class HelpLine:
             self.parts.append((kind, text))
 
 
-@dataclass
+@dataclass(slots=True)
 class HelpDocument:
     """Structured help; render to plain text or styled parts."""
 
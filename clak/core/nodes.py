@@ -10,15 +10,17 @@ Key components:
 - NotSet: Marker for unset configuration values 
 - UnSetArg: Marker for unset command arguments
 - Node: Base class for building hierarchical command structures
+- NodeIndex: Registry of a node tree, by full name, path, class and prefix
 - Fn: Function wrapper for command handlers
 """
 
+import bisect
 import copy
 import logging
 
 # from pprint import pprint
 from types import SimpleNamespace
-from typing import Any, List, Tuple, Union
+from typing import Any, Iterator, List, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +33,7 @@ __all__ = [
     "Fn",
     "MissingMetaError",
     "Node",
+    "NodeIndex",
     "NotSet",
     "NullType",
     "UnSetArg",
@@ -108,10 +111,17 @@ class MissingMetaError(ConfigurationError):
 
 
 class Node:
-    "New version and simpler version of node"
+    """New version and simpler version of node
+
+    Attaching a node to its parent stores :attr:`ancestors`, the tuple of
+    nodes from the root to the parent, and :attr:`depth` (0 for a root):
+    hierarchy lookups read them instead of walking the parents.
+    """
 
     name: str = None
-    parent: "Node" = None
+    ancestors: tuple = ()
+    depth: int = 0
+    _parent: "Node" = None
 
     class Meta:
         """Class to store class-level configuration overrides.
@@ -129,22 +139,33 @@ class Node:
             raise TypeError(f"Node name must be a str, got {type(self.name).__name__}")
 
         # Initialize parent
-        self.parent = parent
-        if not isinstance(self.parent, (Node, type(None))):
+        if not isinstance(parent, (Node, type(None))):
             raise TypeError(
-                f"Node parent must be a Node or None, got {type(self.parent).__name__}"
+                f"Node parent must be a Node or None, got {type(parent).__name__}"
             )
+        self.parent = parent
 
-    def get_hierarchy(self):
-        "Return the hierarchy of the node"
+    @property
+    def parent(self):
+        "Parent node, None for a root"
+        return self._parent
+
+    @parent.setter
+    def parent(self, parent):
+        self._parent = parent
+        self._update_ancestors()
 
-        hierarchy = []
-        current = self
-        while current is not None:
-            hierarchy.append(current)
-            current = current.parent
-        hierarchy.reverse()
-        return hierarchy
+    def _update_ancestors(self):
+        "Recompute ancestors and depth, here and below (on re-parenting)"
+        parent = self.parent
+        self.ancestors = () if parent is None else (*parent.ancestors, parent)
+        self.depth = len(self.ancestors)
+        for child in (getattr(self, "children", None) or {}).values():
+            child._update_ancestors()  # pylint: disable=protected-access
+
+    def get_hierarchy(self):
+        "Return the hierarchy of the node, from the root to self, as a new list"
+        return [*self.ancestors, self]
 
     def get_name(self, attr="name", default=UNSET_ARG):
         "Return the name of the parser"
@@ -154,12 +175,9 @@ class Node:
 
     def get_fname(self, attr="name"):
         "Return the full name of the parser"
-        parents = self.get_hierarchy()
-
-        if parents:
-            fname = [x.get_name(attr=attr, default=None) or "" for x in parents]
-            return ".".join(fname) or ""
-        return ""
+        fname = [x.get_name(attr=attr, default=None) or "" for x in self.ancestors]
+        fname.append(self.get_name(attr=attr, default=None) or "")
+        return ".".join(fname)
 
     def query_cfg_parents(  # pylint: disable=too-many-branches
         self,
@@ -197,12 +215,11 @@ class Node:
             )
             raise ConfigurationError(msg)
 
-        # Prepare lookup chain
+        # Prepare lookup chain, from self/immediate parent
         _report = []
-        parents = self.get_hierarchy()
-        if include_self is False:
-            parents = parents[:-1]
-        parents.reverse()  # Start from self/immediate parent
+        parents = reversed(self.ancestors)
+        if include_self is not False:
+            parents = (self, *parents)
         out = NOT_SET
         last_checked_parent = None
 
@@ -328,3 +345,95 @@ class Node:
         if report:
             return out, _report
         return out
+
+
+class NodeIndex(dict):
+    """Registry of a node tree: a dict of nodes by full name, plus indexes.
+
+    Nodes are added when attached (:meth:`add`), so lookups never walk the
+    tree. The dict keys stay the dotted full names (``get_fname``); the
+    indexes add lookups by command path (the tuple of *attr* values below
+    the root, ``()`` for the root), by class and by path prefix.
+    """
+
+    def __init__(self, attr="key"):
+        super().__init__()
+        self.attr = attr
+        self._seq = 0
+        self._paths = {}  # path tuple -> node
+        self._classes = {}  # class -> {id(node): (seq, node)}
+        self._sorted = []  # path tuples, sorted on demand for prefix lookups
+        self._dirty = False
+
+    def path_of(self, node) -> tuple:
+        "Command path of *node*: *attr* of its ancestors below the root and itself"
+        attr = self.attr
+        return tuple(
+            x.get_name(attr=attr, default=None) or ""
+            for x in (*node.ancestors, node)[1:]
+        )
+
+    def add(self, node, fname=None):
+        "Index *node* under *fname* (its full name by default), replacing any"
+        if fname is None:
+            fname = node.get_fname(attr=self.attr)
+        old = self.get(fname)
+        if old is not None:
+            self._discard(old)
+        self[fname] = node
+        path = self.path_of(node)
+        self._paths[path] = node
+        self._classes.setdefault(type(node), {})[id(node)] = (self._seq, node)
+        self._seq += 1
+        self._sorted.append(path)
+        self._dirty = True
+        return node
+
+    def _discard(self, node):
+        path = self.path_of(node)
+        if self._paths.get(path) is node:
+            del self._paths[path]
+            self._sorted.remove(path)
+        self._classes.get(type(node), {}).pop(id(node), None)
+
+    def by_path(self, path, default=UNSET_ARG):
+        "Node at command *path*, a tuple or a space separated string"
+        if isinstance(path, str):
+            path = path.split()
+        node = self._paths.get(tuple(path), default)
+        if node is UNSET_ARG:
+            raise KeyError(path)
+        return node
+
+    def by_class(self, cls) -> list:
+        "Nodes that are instances of *cls*, in attach order"
+        entries = [
+            entry
+            for klass, nodes in self._classes.items()
+            if issubclass(klass, cls)
+            for entry in nodes.values()
+        ]
+        return [node for _, node in sorted(entries, key=lambda entry: entry[0])]
+
+    def by_prefix(self, prefix) -> list:
+        "Nodes at or below command path *prefix*, sorted by path"
+        if isinstance(prefix, str):
+            prefix = prefix.split()
+        prefix = tuple(prefix)
+        paths = self._sorted
+        if self._dirty:
+            paths.sort()
+            self._dirty = False
+        size = len(prefix)
+        found = []
+        for path in paths[bisect.bisect_left(paths, prefix) :]:
+            if path[:size] != prefix:
+                break
+            found.append(self._paths[path])
+        return found
+
+    def leaves(self) -> Iterator["Node"]:
+        "Iterate over the nodes without children, in attach order"
+        for node in self.values():
+            if not getattr(node, "children", None):
+                yield node
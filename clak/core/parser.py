@@ -13,6 +13,7 @@ Dispatch and exception handling live in ``clak.core._dispatch`` and
 """
 
 import logging
+from dataclasses import dataclass
 from typing import Any, Optional
 
 from clak import exception
@@ -39,7 +40,7 @@ from clak.core.descriptors import (  # pylint: disable=unused-import
     prepare_docstring,
 )
 from clak.core.help_render import HelpRenderer
-from clak.core.nodes import NOT_SET, Node
+from clak.core.nodes import NOT_SET, Node, NodeIndex
 from clak.core.plugins import CLI_HOOK_PREFIX
 from clak.runtime.settings import apply_debug_logging
 from clak.views import ClakView
@@ -52,6 +53,40 @@ Command = SubParser
 PROPAGATE_OPTIONS_GROUP_DEFAULT = "parent options"
 
 
+@dataclass(frozen=True, slots=True)
+class FlagIndex:
+    """Flags defined on a node and its ancestors, closest node first.
+
+    A child reads its parent's index instead of walking the ancestor chain.
+    ``entries`` are ``(dest, arg, option strings, copies)``, where
+    ``copies`` holds the propagated actions of the defining node, shared
+    by all its descendants. A node without local flags reuses the index of
+    its parent.
+    """
+
+    entries: tuple = ()
+    dests: frozenset = frozenset()
+    strings: frozenset = frozenset()
+
+    def extend(self, local_flags: dict[str, Argument]) -> "FlagIndex":
+        """Index of a node defining *local_flags* below this one."""
+        if not local_flags:
+            return self
+        copies: dict = {}
+        entries = tuple(
+            (dest, arg, arg.flag_strings(dest), copies)
+            for dest, arg in local_flags.items()
+        )
+        return FlagIndex(
+            entries=entries + self.entries,
+            dests=self.dests.union(local_flags),
+            strings=self.strings.union(*(entry[2] for entry in entries)),
+        )
+
+
+NO_FLAGS = FlagIndex()
+
+
 class ParserNode(Node):  # pylint: disable=too-many-instance-attributes
     """An extensible argument parser that can be inherited to create custom CLIs.
 
@@ -191,17 +226,21 @@ class ParserNode(Node):  # pylint: disable=too-many-instance-attributes
 
         self.name = self.query_cfg_parents("name", default=self.__class__.__name__)
         self.key = key
-        self.fkey = self.get_fname(attr="key")
+        # Same as get_fname(attr="key"), from the parent's full name
+        self.fkey = key or ""
+        if parent is not None:
+            self.fkey = f"{parent.fkey}.{self.fkey}"
         self.proc_name = proc_name
         self.add_help = add_help
 
         # Add children link
         self.children = {}
-        self.registry = {}
         if parent:
             parent.children[self.key] = self
             self.registry = parent.registry
-        self.registry[self.fkey] = self
+        else:
+            self.registry = NodeIndex(attr="key")
+        self.registry.add(self, self.fkey)
 
         # Create or reuse parent parser
         if parser is None:
@@ -216,7 +255,8 @@ class ParserNode(Node):  # pylint: disable=too-many-instance-attributes
 
         # Init _subparsers
         self._subparsers = None
-        self.local_flag_arguments: dict[str, Argument] = {}
+        # Flags of this node and its ancestors, read by its children
+        self.flag_index = parent.flag_index if parent else NO_FLAGS
 
         self.add_arguments()
         self.add_subcommands()
@@ -313,7 +353,7 @@ class ParserNode(Node):  # pylint: disable=too-many-instance-attributes
     def subparsers(self):
         """Lazily create and return the subparsers object."""
         if self._subparsers is None:
-            level = len(self.get_hierarchy())
+            level = self.depth + 1
             self._subparsers = self.parser.add_subparsers(
                 dest=f"__cli_cmd__{level}",
                 help="Available commands",
@@ -366,7 +406,7 @@ class ParserNode(Node):  # pylint: disable=too-many-instance-attributes
         # Add __cli_self__ argument
         arguments["__cli_self__"] = Argument(help=argparse.SUPPRESS, default=self)
 
-        ancestor_dests, ancestor_strings = self._ancestor_flag_index()
+        inherited = self.parent.flag_index if self.parent else NO_FLAGS
         local_flags: dict[str, Argument] = {}
 
         for key, arg in arguments.items():
@@ -375,31 +415,25 @@ class ParserNode(Node):  # pylint: disable=too-many-instance-attributes
             flag_strings = arg.flag_strings(key)
             if flag_strings:
                 local_flags[key] = arg
-                if key in ancestor_dests or (ancestor_strings & set(flag_strings)):
+                if key in inherited.dests or not inherited.strings.isdisjoint(
+                    flag_strings
+                ):
                     overrides = arg.suppress_attach_overrides()
             self.add_argument(key, arg, attach_overrides=overrides)
 
-        self.local_flag_arguments = local_flags
+        self.flag_index = inherited.extend(local_flags)
 
         if self.query_cfg_parents("propagate_options", default=True, include_self=True):
-            self._attach_inherited_parent_flags(arguments, local_flags)
-
-    def _ancestor_flag_index(self) -> tuple[set[str], set[str]]:
-        """Dests and option strings from ancestors' locally defined flags."""
-        dests: set[str] = set()
-        strings: set[str] = set()
-        node = self.parent
-        while node:
-            for dest, arg in node.local_flag_arguments.items():
-                dests.add(dest)
-                strings.update(arg.flag_strings(dest))
-            node = node.parent
-        return dests, strings
+            self._attach_inherited_parent_flags(arguments, local_flags, inherited)
 
     def _attach_inherited_parent_flags(
-        self, arguments: dict, local_flags: dict[str, Argument]
+        self, arguments: dict, local_flags: dict[str, Argument], inherited: FlagIndex
     ) -> None:
-        """Copy closest ancestor flags onto this parser (default=SUPPRESS)."""
+        """Copy closest ancestor flags onto this parser (default=SUPPRESS).
+
+        Each ancestor flag is built once per help group and the same action
+        is added to every descendant parser that receives it.
+        """
         seen_dests = set(arguments)
         seen_strings: set[str] = set()
         for dest, arg in local_flags.items():
@@ -415,30 +449,28 @@ class ParserNode(Node):  # pylint: disable=too-many-instance-attributes
             "argument_group": None,
         }
 
-        node = self.parent
-        while node:
-            for dest, arg in node.local_flag_arguments.items():
-                if dest in seen_dests:
-                    continue
-                if not arg.propagates():
-                    continue
-                strings = arg.flag_strings(dest)
-                if not strings or (seen_strings & set(strings)):
-                    continue
-                self.add_argument(
-                    dest,
-                    arg,
-                    attach_overrides=arg.suppress_attach_overrides(extra=group_extra),
-                )
-                seen_dests.add(dest)
-                seen_strings.update(strings)
-            node = node.parent
+        for dest, arg, strings, copies in inherited.entries:
+            if dest in seen_dests:
+                continue
+            if not arg.propagates():
+                continue
+            if not seen_strings.isdisjoint(strings):
+                continue
+            self.add_argument(
+                dest,
+                arg,
+                attach_overrides=arg.suppress_attach_overrides(extra=group_extra),
+                shared=copies.setdefault(group, {}),
+            )
+            seen_dests.add(dest)
+            seen_strings.update(strings)
 
     def add_argument(
         self,
         key: str,
         arg: Optional[Argument] = None,
         attach_overrides: Optional[dict] = None,
+        shared: Optional[dict] = None,
         **kwargs: Any,
     ) -> None:
         """Add an argument to this parser.
@@ -447,6 +479,7 @@ class ParserNode(Node):  # pylint: disable=too-many-instance-attributes
             key (str): The key/name for the argument
             arg (Argument): The argument object to add
             attach_overrides (dict): Kwargs applied only to this attach
+            shared (dict): Copies to reuse across parsers (propagated flags)
             **kwargs (Any): Additional keyword arguments to pass to add_argument()
 
         This method adds a new argument to the parser. The argument can be either a
@@ -456,7 +489,9 @@ class ParserNode(Node):  # pylint: disable=too-many-instance-attributes
         if arg is None:
             arg = Argument(**kwargs)
 
-        arg.attach_arg_to_parser(key, self, attach_overrides=attach_overrides)
+        arg.attach_arg_to_parser(
+            key, self, attach_overrides=attach_overrides, shared=shared
+        )
 
     # Subcommand management
     # ========================
@@ -5,7 +5,10 @@
 import logging
 from typing import Any, Protocol
 
+from clak.runtime.tracing import TracePoint
+
 logger = logging.getLogger(__name__)
+_TRACE = TracePoint(logger)
 
 CLI_HOOK_PREFIX = "cli_hook__"
 
@@ -74,9 +77,10 @@ class PluginHelpers:
         methods_dict[name] = _wrapper
         if name.startswith(CLI_HOOK_PREFIX):
             hooks[name] = _wrapper
-        logger.debug(
-            "Registered plugin method %s.%s = %s",
-            instance,
-            name,
-            _wrapper.__qualname__,
-        )
+        if _TRACE:
+            _TRACE(
+                "Registered plugin method %s.%s = %s",
+                instance,
+                name,
+                _wrapper.__qualname__,
+            )
@@ -1,4 +1,4 @@
-"""Process / env context: runtime snapshot, facts, settings, log levels."""
+"""Process / env context: runtime snapshot, facts, settings, log levels, tracing."""
 
 from clak.runtime.facts import FactsInfo, IdentityInfo, detect_facts
 from clak.runtime.log_levels import (
@@ -34,6 +34,7 @@ from clak.runtime.settings import (
     resolve_color_backend,
     resolve_log_colors,
 )
+from clak.runtime.tracing import TracePoint
 
 __all__ = [
     "CLAK_COLOR_BACKEND_ENV",
@@ -57,6 +58,7 @@ __all__ = [
     "LOG_FORMAT",
     "LOG_STYLES",
     "RuntimeInfo",
+    "TracePoint",
     "add_logging_level",
     "apply_coloredlogs_defaults",
     "apply_debug_logging",
@@ -0,0 +1,407 @@
+"""Logging handlers, formatters and filters used by the logging plugin.
+
+:class:`LogQueueHandler` feeds the ``--log-async`` listener thread,
+:func:`open_log_file` builds the buffered rotating ``--log-file``
+handler (text or :class:`JsonLineFormatter` records), and
+:class:`LogRateLimiter` applies ``--log-sample`` rate limits;
+:class:`LogRouting` holds those settings. None of them keep state
+outside their instances; :mod:`clak.comp.logging` wires them to the
+loggers it configures.
+"""
+
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from json.encoder import encode_basestring as quote
+from typing import Optional
+
+from clak.exception import ClakUserError
+
+LOG_QUEUE_POLICIES = ("block", "drop")
+DEFAULT_LOG_QUEUE_SIZE = 10000
+LOG_FILE_FORMATS = ("text", "json")
+LOG_FILE_FORMAT = "%(asctime)s.%(msecs)03d [%(levelname)s] %(name)s: %(message)s"
+DEFAULT_LOG_FILE_OPTIONS = {
+    "level": "DEBUG",
+    "format": "text",
+    "max_bytes": 10 * 1024 * 1024,
+    "backups": 5,
+    "buffer": 100,
+}
+DEFAULT_LOG_RATE_SUMMARY = 10.0
+LOG_RATE_PERIODS = {"s": 1, "m": 60, "h": 3600}
+LOG_RATE_MAX_KEYS = 4096
+
+
+class LogQueueHandler(logging.handlers.QueueHandler):
+    """Queue records for a :class:`~logging.handlers.QueueListener` thread.
+
+    *policy* tells what to do when the bounded queue is full: ``"block"``
+    waits for room, ``"drop"`` discards the record and counts it in
+    :attr:`dropped`. :meth:`flush` waits until the listener has handled
+    every queued record.
+    """
+
+    def __init__(self, log_queue, policy="block"):
+        if policy not in LOG_QUEUE_POLICIES:
+            choice = ",".join(LOG_QUEUE_POLICIES)
+            raise ValueError(
+                f"Invalid log queue policy: '{policy}', please choose one of: {choice}"
+            )
+        super().__init__(log_queue)
+        self.policy = policy
+        self.dropped = 0
+        self.listener = None
+
+    def enqueue(self, record):
+        if self.policy == "block":
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self):
+        listener = self.listener
+        # pylint: disable-next=protected-access
+        if listener is not None and listener._thread is not None:
+            self.queue.join()
+
+
+class JsonLineFormatter(logging.Formatter):
+    """One compact JSON object per record, for log files.
+
+    Fields: ``time`` (epoch seconds), ``level``, ``logger``, ``message``,
+    and ``exc_info`` when an exception is attached. No format string is
+    interpolated and no date is formatted, which makes it cheaper than
+    the text formats.
+    """
+
+    def format(self, record):
+        # Built by hand: json.dumps on a dict costs more than the text format
+        line = (
+            f'{{"time":{record.created!r},"level":{quote(record.levelname)},'
+            f'"logger":{quote(record.name)},"message":{quote(record.getMessage())}'
+        )
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            line += f',"exc_info":{quote(record.exc_text)}'
+        return line + "}"
+
+
+class StderrLevels(logging.Filter):
+    """Keep stderr to the ``-v`` tier levels when a log file lowers them.
+
+    The file handler needs records below those levels, so loggers are
+    opened to the file level and each record is checked against the level
+    of its nearest configured logger.
+    """
+
+    def __init__(self, levels):
+        super().__init__()
+        self.levels = levels
+        self._cache = {}
+
+    def threshold(self, name):
+        """Level of the nearest configured logger of logger *name*."""
+        level = self._cache.get(name)
+        if level is None:
+            levels = self.levels
+            parent = "" if name == "root" else name
+            while parent and parent not in levels:
+                parent = parent.rpartition(".")[0]
+            level = self._cache[name] = levels.get(parent, logging.NOTSET)
+        return level
+
+    def filter(self, record):
+        return record.levelno >= self.threshold(record.name)
+
+
+def parse_log_rate(spec):
+    """Return ``(rate, burst)`` of a rate limit, or None for no limit.
+
+    *spec* is a number of records per second, a ``COUNT/PERIOD`` string
+    (``s``, ``m`` or ``h``: ``"10/s"``, ``"600/m"``), or a mapping with
+    ``rate`` (one of the former) and ``burst``, the records let through at
+    once after a quiet time (default: the count of one period).
+    """
+    if spec is None:
+        return None
+    burst = None
+    if isinstance(spec, dict):
+        unknown = set(spec) - {"rate", "burst"}
+        if unknown or "rate" not in spec:
+            raise ValueError(
+                f"Log rate limit needs 'rate' and optional 'burst', got {spec!r}"
+            )
+        burst = spec.get("burst")
+        spec = spec["rate"]
+    if isinstance(spec, str):
+        count, _, period = spec.strip().partition("/")
+        seconds = LOG_RATE_PERIODS.get(period.strip() or "s")
+        try:
+            count = float(count)
+        except ValueError:
+            count = None
+        if seconds is None or count is None:
+            raise ValueError(
+                f"Invalid log rate: '{spec}', expected COUNT/PERIOD with PERIOD "
+                f"one of: {','.join(LOG_RATE_PERIODS)}"
+            )
+    elif isinstance(spec, (int, float)) and not isinstance(spec, bool):
+        count, seconds = float(spec), 1
+    else:
+        raise TypeError(f"Log rate must be a number or a string, got {spec!r}")
+    if count <= 0:
+        raise ValueError(f"Log rate must be > 0, got {spec!r}")
+    if burst is None:
+        burst = max(count, 1.0)
+    elif isinstance(burst, bool) or not isinstance(burst, int) or burst < 1:
+        raise ValueError(f"Log rate burst must be an int >= 1, got {burst!r}")
+    return count / seconds, float(burst)
+
+
+def _log_rate_limits(limits):
+    'Parsed rate limits per logger name (root is ``""``)'
+    if not isinstance(limits, dict):
+        raise TypeError(f"Log rate limits must be a dict, got {type(limits)}")
+    return {
+        ("" if name == "root" else name): parse_log_rate(spec)
+        for name, spec in limits.items()
+    }
+
+
+class _RateBuckets:
+    """Token buckets per ``(logger name, msg)`` key, with dropped counts.
+
+    Not thread safe: :class:`LogRateLimiter` calls it under its lock.
+    """
+
+    def __init__(self, summary):
+        self.summary = summary
+        self.suppressed = 0
+        self._buckets = {}  # (logger name, msg) -> [tokens, time, dropped, levelno]
+        self._next_summary = time.monotonic() + summary
+
+    def take(self, key, limit, levelno, now):
+        """Count a record of *key* against its bucket.
+
+        Returns ``(passed, pending)``: whether the record passes, and the
+        suppressed counts due for a summary (see :meth:`pending`).
+        """
+        rate, burst = limit
+        pending = self.pending(now) if now >= self._next_summary else []
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            if len(self._buckets) >= LOG_RATE_MAX_KEYS:
+                # Templates built per record (f-strings): start over
+                pending += self.pending(now)
+                self._buckets.clear()
+            bucket = self._buckets[key] = [burst, now, 0, levelno]
+        tokens = bucket[0] + (now - bucket[1]) * rate
+        bucket[0] = burst if tokens > burst else tokens
+        bucket[1] = now
+        passed = bucket[0] >= 1
+        if passed:
+            bucket[0] -= 1
+        else:
+            bucket[2] += 1
+            bucket[3] = levelno
+            self.suppressed += 1
+        return passed, pending
+
+    def pending(self, now):
+        """Take the suppressed counts out of the buckets."""
+        self._next_summary = now + self.summary
+        pending = []
+        for (name, msg), bucket in self._buckets.items():
+            if bucket[2]:
+                pending.append((name, msg, bucket[3], bucket[2]))
+                bucket[2] = 0
+        return pending
+
+
+class LogRateLimiter(logging.Filter):
+    """Token bucket rate limits per logger and message template.
+
+    *limits* maps logger names to :func:`parse_log_rate` specs and applies
+    to their children too; None lifts the limit of a parent. Records of
+    the same logger and ``msg`` (the template, before ``%`` arguments)
+    share a bucket. Records at or above *max_level* always pass.
+
+    Every *summary* seconds, and when detached, the limiter sends one
+    ``Suppressed N similar messages`` record per template it dropped
+    records of to the handler it is attached to.
+
+    Handlers may be shared by threads: buckets are updated under a lock,
+    and summaries are handed to the handler after it is released.
+    """
+
+    def __init__(
+        self, limits, summary=DEFAULT_LOG_RATE_SUMMARY, max_level=logging.WARNING
+    ):
+        super().__init__()
+        if isinstance(summary, bool) or not isinstance(summary, (int, float)):
+            raise TypeError(f"Log rate summary must be a number, got {summary!r}")
+        if summary <= 0:
+            raise ValueError(f"Log rate summary must be > 0, got {summary}")
+        self.limits = _log_rate_limits(limits)
+        self.max_level = max_level
+        self.handler = None
+        self._cache = {}  # logger name -> (rate, burst) or None
+        self._buckets = _RateBuckets(summary)
+        self._lock = threading.Lock()
+
+    @property
+    def suppressed(self):
+        """Records dropped since the limiter was created."""
+        return self._buckets.suppressed
+
+    def _limit(self, name):
+        limits = self.limits
+        parent = name
+        while parent and parent not in limits:
+            parent = parent.rpartition(".")[0]
+        limit = self._cache[name] = limits.get(parent)
+        return limit
+
+    def filter(self, record):
+        if record.levelno >= self.max_level or getattr(record, "rate_summary", False):
+            return True
+        name = record.name
+        limit = self._cache[name] if name in self._cache else self._limit(name)
+        if limit is None:
+            return True
+        now = time.monotonic()
+        msg = record.msg
+        key = (name, msg if isinstance(msg, str) else type(msg).__name__)
+        with self._lock:
+            passed, pending = self._buckets.take(key, limit, record.levelno, now)
+        if pending:
+            self._send(pending)
+        return passed
+
+    def _send(self, pending):
+        """Hand summary records to the handler, outside the lock."""
+        handler = self.handler
+        if handler is None:
+            return
+        for name, msg, levelno, count in pending:
+            record = logging.LogRecord(
+                name,
+                levelno,
+                __file__,
+                0,
+                "Suppressed %d similar messages: %s",
+                (count, msg),
+                None,
+            )
+            record.rate_summary = True
+            handler.handle(record)
+
+    def summarize(self, now=None):
+        """Send the pending suppressed counts to the handler."""
+        with self._lock:
+            pending = self._buckets.pending(now or time.monotonic())
+        self._send(pending)
+
+    def attach(self, handler):
+        """Filter the records of *handler*, after its current filters."""
+        if self.handler is not None and self.handler is not handler:
+            self.detach()
+        handler.removeFilter(self)
+        handler.addFilter(self)
+        self.handler = handler
+
+    def detach(self):
+        """Send pending summaries, then stop filtering."""
+        if self.handler is None:
+            return
+        self.summarize()
+        self.handler.removeFilter(self)
+        self.handler = None
+
+
+def resolve_log_file_options(options):
+    "Log file options completed with defaults and checked"
+    options = {**DEFAULT_LOG_FILE_OPTIONS, **(options or {})}
+    unknown = set(options) - set(DEFAULT_LOG_FILE_OPTIONS)
+    if unknown:
+        raise ValueError(f"Unknown log file options: {sorted(unknown)}")
+    if options["format"] not in LOG_FILE_FORMATS:
+        choice = ",".join(LOG_FILE_FORMATS)
+        raise ValueError(
+            f"Invalid log file format: '{options['format']}', "
+            f"please choose one of: {choice}"
+        )
+    for name in ("max_bytes", "backups", "buffer"):
+        value = options[name]
+        if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+            raise ValueError(f"Log file {name} must be an int >= 0, got {value!r}")
+    return options
+
+
+def open_log_file(path, options):
+    "Buffered rotating file handler writing to *path*"
+    path = os.path.abspath(os.path.expanduser(os.fspath(path)))
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        target = logging.handlers.RotatingFileHandler(
+            path,
+            maxBytes=options["max_bytes"],
+            backupCount=options["backups"],
+            encoding="utf-8",
+        )
+    except OSError as err:
+        raise ClakUserError(
+            f"Cannot write log file {path}: {err.strerror or err}"
+        ) from err
+    if options["format"] == "json":
+        target.setFormatter(JsonLineFormatter())
+    else:
+        target.setFormatter(
+            logging.Formatter(LOG_FILE_FORMAT, datefmt="%Y-%m-%d %H:%M:%S")
+        )
+    buffered = logging.handlers.MemoryHandler(
+        options["buffer"],
+        flushLevel=logging.WARNING,
+        target=target,
+    )
+    level = options["level"]
+    buffered.setLevel(level.upper() if isinstance(level, str) else level)
+    return buffered
+
+
+@dataclass(slots=True)
+class LogRouting:
+    """Where configured loggers write besides stderr.
+
+    See :func:`~clak.comp.logging.get_app_logger` for the queue, log file
+    and rate limit settings; they are checked before logging is changed.
+    """
+
+    log_async: bool = False
+    queue_size: int = DEFAULT_LOG_QUEUE_SIZE
+    queue_policy: str = "block"
+    log_file: Optional[str] = None
+    log_file_options: Optional[dict] = None
+    rate_limits: Optional[dict] = None
+    rate_summary: float = DEFAULT_LOG_RATE_SUMMARY
+
+    def __post_init__(self):
+        if self.queue_policy not in LOG_QUEUE_POLICIES:
+            choice = ",".join(LOG_QUEUE_POLICIES)
+            raise ValueError(
+                f"Invalid log queue policy: '{self.queue_policy}', "
+                f"please choose one of: {choice}"
+            )
+        self.log_file_options = resolve_log_file_options(self.log_file_options)
+        self.rate_limits = self.rate_limits or {}
+        if self.rate_limits:
+            LogRateLimiter(self.rate_limits, self.rate_summary)
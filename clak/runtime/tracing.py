@@ -0,0 +1,48 @@
+"""Trace points: debug records that cost nothing while their level is off.
+
+A :class:`TracePoint` binds a logger and a level. It is false when the
+logger would drop the record, so callers guard the work of building the
+message arguments, not only the formatting::
+
+    _TRACE = TracePoint(logger)
+
+    if _TRACE:
+        _TRACE("Create argument %s.%s", node.get_fname(), key)
+
+Loops can read :attr:`TracePoint.enabled` once and reuse the flag: a
+level change during the loop is then seen on the next run.
+"""
+
+from __future__ import annotations
+
+import logging
+
+
+class TracePoint:
+    """Log to *logger* at *level*, only when that level is enabled.
+
+    The truth value is ``logger.isEnabledFor(level)``, which :mod:`logging`
+    caches until levels change. Calling the trace point logs the record
+    with the caller as origin (``funcName``, ``lineno``).
+    """
+
+    __slots__ = ("logger", "level")
+
+    def __init__(self, logger: logging.Logger, level: int = logging.DEBUG):
+        self.logger = logger
+        self.level = level
+
+    def __repr__(self):
+        return f"TracePoint({self.logger.name}, {logging.getLevelName(self.level)})"
+
+    @property
+    def enabled(self) -> bool:
+        """True when records of this trace point would be handled."""
+        return self.logger.isEnabledFor(self.level)
+
+    def __bool__(self) -> bool:
+        return self.logger.isEnabledFor(self.level)
+
+    def __call__(self, msg, *args, **kwargs) -> None:
+        kwargs.setdefault("stacklevel", 2)
+        self.logger.log(self.level, msg, *args, **kwargs)
@@ -1,6 +1,7 @@
 """View classes for command line output formatting.
 
-Public names are the view classes and a few format/width constants.
+Public names are the view classes, the :class:`Columns` payload wrapper and
+a few format/width constants.
 Helpers (`parse_columns`, `merge_view_settings`, `require_yaml`, ...) live in
 the submodules (`clak.views.table`, `clak.views.base`, ...).
 """
@@ -20,10 +21,12 @@ from clak.views.base import (
 from clak.views.composite import CompositeView
 from clak.views.data import DATA_FORMATS, DataView
 from clak.views.table import ListView, ShowView, TableView
+from clak.views.table_columnar import Columns
 from clak.views.text import MarkdownView, PprintView, RawView, RstView
 
 __all__ = [
     "ClakView",
+    "Columns",
     "CompositeView",
     "DATA_FORMATS",
     "DEFAULT_FORMAT_SCOPE",
@@ -7,13 +7,15 @@ from __future__ import annotations
 import logging
 import re
 import textwrap
-from collections.abc import Mapping
+from collections.abc import Iterable, Mapping, Sequence
 from pprint import pformat
 from typing import Any, Optional, Tuple
 
+from clak.views.sink import TextSink, close_stream, current_sink
+
 logger = logging.getLogger(__name__)
 
-OUTPUT_FORMATS = frozenset({"view", "yaml", "json", "csv"})
+OUTPUT_FORMATS = frozenset({"view", "yaml", "json", "csv", "ndjson"})
 TEXT_FORMATS = frozenset({"view", "raw"})
 WIDTH_MODES = frozenset({"content", "fit", "terminal"})
 WIDTH_MODE_ALIASES = {
@@ -28,6 +30,8 @@ DEFAULT_WRAP_MODE = "last"
 FORMAT_SCOPES = frozenset({"first", "all"})
 DEFAULT_FORMAT_SCOPE = "first"
 
+DEFAULT_NDJSON_BATCH = 100
+
 _ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
 
 
@@ -36,6 +40,41 @@ def strip_ansi(text: str) -> str:
     return _ANSI_RE.sub("", text)
 
 
+def is_stream_payload(payload) -> bool:
+    """True for one-shot iterables (generators, cursors), not list/dict/str."""
+    if isinstance(payload, (Mapping, Sequence, str, bytes, bytearray)):
+        return False
+    return isinstance(payload, Iterable)
+
+
+def write_chunks(chunks, source=None, stream=None, end="\n", flush=False):
+    """Write text chunks to *stream* (default: the current sink), like ``print``.
+
+    See :meth:`~clak.views.sink.OutputSink.write_chunks`: chunks are written
+    in batches (or one by one with *flush*), and *source* is closed whatever
+    happens; errors (e.g. BrokenPipeError) still propagate to the parser
+    terminate chain.
+    """
+    sink = TextSink(stream) if stream is not None else current_sink()
+    sink.write_chunks(chunks, source=source, end=end, flush=flush)
+
+
+def output_stream(chunks, source=None, stdout=True, **write_options):
+    """Streamed counterpart of ``ClakView._output``.
+
+    Writes chunks to the current sink and returns None, or joins and
+    returns them when *stdout* is False. *write_options* go to
+    :func:`write_chunks`.
+    """
+    if stdout:
+        write_chunks(chunks, source=source, **write_options)
+        return None
+    try:
+        return "".join(chunks)
+    finally:
+        close_stream(source)
+
+
 class ClakView:
     "Render command line output"
 
@@ -63,9 +102,9 @@ class ClakView:
 
     @staticmethod
     def _output(rendered, stdout=True):
-        "Optionally print rendered output and always return it."
+        "Optionally write rendered output to the current sink and always return it."
         if stdout:
-            print(rendered)
+            current_sink().write_chunks((rendered,))
         return rendered
 
     @staticmethod
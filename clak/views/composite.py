@@ -4,7 +4,6 @@
 
 from __future__ import annotations
 
-import json
 from collections.abc import Mapping
 from typing import List, Optional, Sequence, Tuple
 
@@ -17,10 +16,11 @@ from clak.views.base import (
     FORMAT_SCOPES,
     OUTPUT_FORMATS,
     ClakView,
+    output_stream,
     resolve_view_width,
-    strip_ansi,
 )
 from clak.views.data import DataView
+from clak.views.serializers import get_serializer
 from clak.views.table import (
     ListView,
     ShowView,
@@ -28,14 +28,15 @@ from clak.views.table import (
     _project_item_columns,
     _project_list_columns,
 )
-from clak.views.table_formatter import require_yaml
+from clak.views.table_formatter import RENDER_OPTION_KEYS
+from clak.views.table_records import iter_ndjson_records
 from clak.views.text import MarkdownView, PprintView, RawView, RstView
 
-_SHARED_SETTINGS = frozenset({"width", "wrap", "wrap_min", "term_width", "stdout_tty"})
+_SHARED_SETTINGS = frozenset(RENDER_OPTION_KEYS)
 _PRIMARY_TABLE_SETTINGS = frozenset(
     {"columns", "sort_columns", "sort_mode", "add_index"}
 )
-_LIST_ONLY_SETTINGS = frozenset({"expand_keys"})
+_LIST_ONLY_SETTINGS = frozenset({"expand_keys", "offset", "limit"})
 
 Section = Tuple[str, ClakView, dict]
 
@@ -183,6 +184,14 @@ class CompositeView(ClakView):
             )
             return primary_view.render(stdout=stdout, **child_kw)
 
+        if fmt == "ndjson":
+            # One envelope section per line, written as each one is built
+            chunks = iter_ndjson_records(
+                self._iter_envelope_sections(sections, settings, primary_name),
+                batch=1,
+            )
+            return output_stream(chunks, stdout=stdout, end="", flush=True)
+
         rendered = self._render_envelope(sections, settings, primary_name, fmt)
         return self._output(rendered, stdout=stdout)
 
@@ -248,20 +257,22 @@ class CompositeView(ClakView):
         return "\n\n".join(parts)
 
     def _natural_table_widths(self, tables, settings, primary_name):
-        """Render each table at min width and return outer border widths."""
-        measure_settings = dict(settings)
-        measure_settings["width"] = "min"
+        """Outer border widths of each table at content width.
+
+        Widths are measured from processed rows, so every table is rendered
+        only once (in :meth:`_render_view`). Stream payloads are skipped.
+        """
         naturals = []
         for name, view in tables:
             child_kw = self._settings_for_child(
                 view,
-                measure_settings,
+                settings,
                 is_primary=(name == primary_name),
                 fmt="view",
             )
-            text = view.render(stdout=False, **child_kw) or ""
-            first = text.splitlines()[0] if text else ""
-            naturals.append(len(strip_ansi(first)))
+            natural = view.natural_width(**child_kw)
+            if natural is not None:
+                naturals.append(natural)
         return naturals
 
     def _equalize_table_width_settings(self, sections, settings, primary_name):
@@ -315,11 +326,8 @@ class CompositeView(ClakView):
             return _project_item_columns(data, columns)
         return data
 
-    def _render_envelope(self, sections, settings, primary_name, fmt):
-        if fmt == "csv":
-            return self._render_envelope_csv(sections, settings, primary_name)
-
-        envelope = {"sections": []}
+    def _iter_envelope_sections(self, sections, settings, primary_name):
+        """Yield envelope entries: name, kind, data, and optional title/description."""
         for name, view, meta in sections:
             is_primary = name == primary_name
             entry = {
@@ -331,14 +339,21 @@ class CompositeView(ClakView):
                 entry["title"] = meta["title"]
             if "description" in meta:
                 entry["description"] = meta["description"]
-            envelope["sections"].append(entry)
+            yield entry
+
+    def _render_envelope(self, sections, settings, primary_name, fmt):
+        if fmt == "csv":
+            return self._render_envelope_csv(sections, settings, primary_name)
 
-        if fmt == "json":
-            return json.dumps(envelope, indent=2, default=str) + "\n"
-        if fmt == "yaml":
-            return require_yaml().safe_dump(
-                envelope, sort_keys=False, default_flow_style=False
+        envelope = {
+            "sections": list(
+                self._iter_envelope_sections(sections, settings, primary_name)
             )
+        }
+
+        if fmt in {"json", "yaml"}:
+            text = get_serializer(fmt).dump(envelope, indent=2)
+            return text + "\n" if fmt == "json" else text
         raise ValueError(f"Unsupported format {fmt!r}")
 
     def _render_envelope_csv(self, sections, settings, primary_name):
@@ -4,17 +4,22 @@
 
 from __future__ import annotations
 
-import json
 import os
 
 from clak.common import resolve_bool_option
 from clak.exception import ClakUserError
 from clak.runtime.rich_style import make_rich_console, syntax_kwargs
 from clak.runtime.settings import ClakSettings, resolve_color_backend
-from clak.views.base import ClakView
-from clak.views.table_formatter import require_yaml
+from clak.views.base import ClakView, is_stream_payload, output_stream
+from clak.views.serializers import (
+    BUILTIN_SERIALIZERS,
+    get_serializer,
+    require_yaml,
+    serializer_names,
+)
+from clak.views.table_records import iter_ndjson_records
 
-DATA_FORMATS = frozenset({"json", "yaml"})
+DATA_FORMATS = frozenset({"json", "yaml", "ndjson"})
 
 _RICH_INSTALL_HINT = "pip install 'mrjk.clak[markdown]'"
 
@@ -43,54 +48,76 @@ def require_rich_for_data():
     return rich_console, rich_syntax
 
 
+def data_format_names() -> list:
+    """Built-in data formats plus formats registered with a dump function."""
+    registered = {
+        name
+        for name in serializer_names()
+        if name not in BUILTIN_SERIALIZERS and get_serializer(name).dump is not None
+    }
+    return sorted(DATA_FORMATS | registered)
+
+
+class DataFormatChoices:
+    """Live ``--format`` choices: see :func:`data_format_names`.
+
+    Formats registered after the CLI classes are defined are still valid.
+    """
+
+    def __contains__(self, value):
+        return value in data_format_names()
+
+    def __iter__(self):
+        return iter(data_format_names())
+
+    def __len__(self):
+        return len(data_format_names())
+
+    def __repr__(self):
+        return repr(data_format_names())
+
+
 def resolve_data_format(fmt=None) -> str:
-    """Resolve ``json`` / ``yaml``; ``None`` / ``view`` means auto (yaml if available)."""
+    """Resolve ``json`` / ``yaml`` / ``ndjson``; ``None`` / ``view`` means auto.
+
+    Auto picks yaml when PyYAML is installed, else json. Formats added with
+    :func:`~clak.views.serializers.register_serializer` are accepted too.
+    """
     if fmt is None or (isinstance(fmt, str) and fmt.lower() == "view"):
         return "yaml" if _yaml_available() else "json"
     if not isinstance(fmt, str):
         raise TypeError(f"format must be a string, got {type(fmt).__name__}")
     fmt = fmt.lower()
-    if fmt not in DATA_FORMATS:
+    if fmt not in data_format_names():
         raise ValueError(
-            f"Unsupported format {fmt!r}, choose one of: {sorted(DATA_FORMATS)}"
+            f"Unsupported format {fmt!r}, choose one of: {data_format_names()}"
         )
     if fmt == "yaml":
         require_yaml()
     return fmt
 
 
-def _yaml_dumper(yaml, *, anchors: bool):
-    """Return a SafeDumper, optionally disabling anchors/aliases."""
-    if anchors:
-        return yaml.SafeDumper
-
-    class _NoAliasDumper(yaml.SafeDumper):
-        def ignore_aliases(self, _data):  # pylint: disable=unused-argument
-            """Always expand aliases instead of emitting anchors."""
-            return True
-
-    return _NoAliasDumper
+def iter_data_records(payload):
+    """Records of a data payload for NDJSON: list items, stream items, or itself."""
+    if isinstance(payload, (list, tuple)) or is_stream_payload(payload):
+        return iter(payload)
+    return iter((payload,))
 
 
 def format_data_payload(payload, *, fmt=None, compact=False, anchors=True):
-    """Serialize *payload* as JSON or YAML text (no color)."""
+    """Serialize *payload* as JSON, NDJSON, YAML or a registered format (no color)."""
     resolved = resolve_data_format(fmt)
 
-    if resolved == "json":
-        indent = None if compact else 2
-        text = json.dumps(payload, indent=indent, default=str)
-        if not text.endswith("\n"):
-            text += "\n"
-        return text, resolved
+    if resolved == "ndjson":
+        return "".join(iter_ndjson_records(iter_data_records(payload))), resolved
 
-    yaml = require_yaml()
-    dumper = _yaml_dumper(yaml, anchors=bool(anchors))
-    text = yaml.dump(
+    text = get_serializer(resolved).dump(
         payload,
-        Dumper=dumper,
-        sort_keys=False,
-        default_flow_style=False,
+        indent=None if compact else 2,
+        anchors=bool(anchors),
     )
+    if not text.endswith("\n"):
+        text += "\n"
     return text, resolved
 
 
@@ -177,6 +204,18 @@ class DataView(ClakView):
         stdout_tty = settings.get("stdout_tty")
         theme = self.settings.get("theme") or settings.pop("theme", None)
 
+        if resolve_data_format(fmt_setting) == "ndjson":
+            # Line-oriented output for pipes: never colorized, written as produced
+            return output_stream(
+                iter_ndjson_records(
+                    iter_data_records(payload), batch=settings.get("ndjson_batch")
+                ),
+                source=payload,
+                stdout=stdout,
+                end="",
+                flush=True,
+            )
+
         text, fmt = format_data_payload(
             payload,
             fmt=fmt_setting,
@@ -0,0 +1,64 @@
+"""Page view output through an external pager (``CLAK_PAGER`` / ``PAGER``)."""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import os
+import shlex
+import subprocess
+import sys
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGER = "less"
+# Like git: quit if one screen, keep ANSI colors, do not clear the screen
+PAGER_ENV_DEFAULTS = {"LESS": "FRX", "LV": "-c"}
+
+
+def _pager_env():
+    env = dict(os.environ)
+    for key, value in PAGER_ENV_DEFAULTS.items():
+        env.setdefault(key, value)
+    return env
+
+
+@contextlib.contextmanager
+def paged_output(command=None):
+    """Send everything printed to stdout in the block to a pager.
+
+    The pager is spawned once and reads from a pipe, so streamed views
+    reach it as they write. If the pager exits early (user pressed ``q``),
+    the next write raises BrokenPipeError: the producer stops there, its
+    source is closed (see :func:`~clak.views.base.write_chunks`), and the
+    error is swallowed. Without *command*, or if the pager cannot start,
+    output goes to stdout unchanged.
+    """
+    if not command:
+        yield
+        return
+
+    try:
+        proc = subprocess.Popen(  # pylint: disable=consider-using-with
+            shlex.split(command),
+            stdin=subprocess.PIPE,
+            env=_pager_env(),
+            encoding=getattr(sys.stdout, "encoding", None) or "utf-8",
+            errors="replace",
+        )
+    except (OSError, ValueError) as err:
+        logger.warning("Cannot start pager %r: %s", command, err)
+        yield
+        return
+
+    try:
+        with contextlib.redirect_stdout(proc.stdin):
+            yield
+    except BrokenPipeError:
+        logger.debug("Pager %r exited before the end of output", command)
+    finally:
+        try:
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass
+        proc.wait()
@@ -0,0 +1,273 @@
+"""Serializer registry: structured formats (json, yaml, ...) by name.
+
+Built-in formats use the fastest installed backend: ``orjson`` for JSON and
+the libyaml ``CSafeDumper`` / ``CSafeLoader`` for YAML, else the pure Python
+ones. ``CLAK_SERIALIZER_BACKEND=python`` forces the pure Python backends.
+
+Apps add their own formats with :func:`register_serializer`; registered
+formats are available to ``DataView`` and, with file suffixes, to config
+files::
+
+    register_serializer("toml", dump=tomli_w.dumps, load=tomllib.loads,
+                        suffixes=(".toml",))
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from functools import lru_cache
+
+from clak.exception import ClakUserError
+
+# Optional JSON accelerator
+try:
+    import orjson as _orjson  # type: ignore
+except ImportError:
+    _orjson = None
+
+CLAK_SERIALIZER_BACKEND_ENV = "CLAK_SERIALIZER_BACKEND"
+SERIALIZER_BACKENDS = frozenset({"auto", "python"})
+BUILTIN_SERIALIZERS = frozenset({"json", "yaml"})
+_YAML_INSTALL_HINT = "pip install 'mrjk.clak[config]'"
+
+
+def require_yaml():
+    """Import PyYAML or raise ClakUserError with the config extra hint."""
+    try:
+        import yaml  # pylint: disable=import-outside-toplevel
+    except ImportError as err:
+        raise ClakUserError(
+            "YAML output requires the PyYAML package",
+            advice=f"Install with: {_YAML_INSTALL_HINT}",
+        ) from err
+    return yaml
+
+
+class Serializer:  # pylint: disable=too-few-public-methods
+    """A named format: ``dump(payload, **options) -> str``, ``load(text)``.
+
+    Dump options are hints a format may ignore: ``indent`` (None: one
+    line), ``compact`` (no blanks between items), ``anchors`` (YAML
+    aliases). ``load`` raises ValueError on invalid input; it is None for
+    output-only formats.
+    """
+
+    __slots__ = ("name", "dump", "load", "suffixes", "backend")
+
+    def __init__(self, name, dump=None, load=None, *, suffixes=(), backend="custom"):
+        self.name = name
+        self.dump = dump
+        self.load = load
+        self.suffixes = tuple(suffix.lower() for suffix in suffixes)
+        self.backend = backend
+
+    def __repr__(self):
+        return f"Serializer({self.name!r}, backend={self.backend!r})"
+
+
+# JSON backends
+
+
+def _python_json_dump(payload, indent=2, compact=False, **_):
+    separators = (",", ":") if compact else None
+    return json.dumps(payload, indent=indent, separators=separators, default=str)
+
+
+def _orjson_dump(payload, indent=2, compact=False, **options):
+    # orjson only writes 2-space indent or compact (no blanks) text
+    if indent not in (None, 2) or (indent is None and not compact):
+        return _python_json_dump(payload, indent=indent, compact=compact)
+    # Same values as json.dumps(default=str): dates and dataclasses go
+    # through str(), non-str keys are converted
+    option = (
+        _orjson.OPT_NON_STR_KEYS
+        | _orjson.OPT_PASSTHROUGH_DATETIME
+        | _orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+    if indent:
+        option |= _orjson.OPT_INDENT_2
+    try:
+        return _orjson.dumps(payload, default=str, option=option).decode("utf-8")
+    except _orjson.JSONEncodeError:
+        # Integers beyond 64 bits, recursion depth...
+        return _python_json_dump(payload, indent=indent, compact=compact, **options)
+
+
+def _orjson_load(text):
+    return _orjson.loads(text)
+
+
+# YAML backends
+
+
+@lru_cache(maxsize=None)
+def _no_alias_dumper(base):
+    class _NoAliasDumper(base):  # pylint: disable=too-few-public-methods
+        def ignore_aliases(self, _data):  # pylint: disable=unused-argument
+            """Always expand aliases instead of emitting anchors."""
+            return True
+
+    return _NoAliasDumper
+
+
+def _yaml_dump_with(accelerated):
+    def dump(payload, anchors=True, **_):
+        yaml = require_yaml()
+        dumper = yaml.SafeDumper
+        # libyaml omits the "..." end marker of a scalar document
+        if accelerated and isinstance(payload, (dict, list, tuple)):
+            dumper = getattr(yaml, "CSafeDumper", dumper)
+        if not anchors:
+            dumper = _no_alias_dumper(dumper)
+        return yaml.dump(
+            payload, Dumper=dumper, sort_keys=False, default_flow_style=False
+        )
+
+    return dump
+
+
+def _yaml_load_with(accelerated):
+    def load(text):
+        yaml = require_yaml()
+        loader = yaml.SafeLoader
+        if accelerated:
+            loader = getattr(yaml, "CSafeLoader", loader)
+        try:
+            return yaml.load(text, Loader=loader)  # nosec B506 - safe loaders only
+        except yaml.YAMLError as err:
+            raise ValueError(str(err)) from err
+
+    return load
+
+
+def _libyaml_available() -> bool:
+    try:
+        import yaml  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return False
+    return bool(getattr(yaml, "__with_libyaml__", False))
+
+
+def serializer_backends(name) -> list:
+    """Installed backends of built-in format *name*, fastest first."""
+    if name == "json":
+        return (["orjson"] if _orjson is not None else []) + ["python"]
+    if name == "yaml":
+        return (["libyaml"] if _libyaml_available() else []) + ["python"]
+    return []
+
+
+def _builtin_serializer(name, backend):
+    if name == "json":
+        if backend == "orjson":
+            return Serializer(
+                "json",
+                _orjson_dump,
+                _orjson_load,
+                suffixes=(".json",),
+                backend="orjson",
+            )
+        return Serializer(
+            "json", _python_json_dump, json.loads, suffixes=(".json",), backend=backend
+        )
+    accelerated = backend == "libyaml"
+    return Serializer(
+        "yaml",
+        _yaml_dump_with(accelerated),
+        _yaml_load_with(accelerated),
+        suffixes=(".yaml", ".yml"),
+        backend=backend,
+    )
+
+
+def resolve_serializer_backend(name, backend=None) -> str:
+    """Backend used for built-in format *name*.
+
+    Priority: *backend* > ``CLAK_SERIALIZER_BACKEND`` > fastest installed.
+    ``python`` selects the pure Python backend.
+    """
+    if backend is None:
+        backend = os.environ.get(CLAK_SERIALIZER_BACKEND_ENV) or "auto"
+        backend = backend.strip().lower()
+        if backend not in SERIALIZER_BACKENDS:
+            raise ValueError(
+                f"{CLAK_SERIALIZER_BACKEND_ENV} must be one of "
+                f"{sorted(SERIALIZER_BACKENDS)}, got {backend!r}"
+            )
+    available = serializer_backends(name)
+    if backend == "auto":
+        return available[0]
+    if backend not in available:
+        raise ValueError(
+            f"Unknown or missing {name} backend {backend!r}, choose one of: "
+            f"{available}"
+        )
+    return backend
+
+
+_REGISTRY = {}
+
+
+def _payload_only(dump):
+    def wrapper(payload, **_):
+        return dump(payload)
+
+    return wrapper
+
+
+def register_serializer(name, dump=None, load=None, *, suffixes=(), replace=False):
+    """Register format *name* and return its :class:`Serializer`.
+
+    *dump* turns a payload into text (called as ``dump(payload)``), *load*
+    parses text (and raises ValueError on invalid input). *suffixes* make
+    config files with these extensions load with *load*. Registering an
+    existing name, built-in ones included, needs ``replace=True``.
+    """
+    if not isinstance(name, str) or not name:
+        raise TypeError(f"serializer name must be a non-empty string, got {name!r}")
+    name = name.lower()
+    if dump is None and load is None:
+        raise ValueError(f"Serializer {name!r} needs a dump or a load function")
+    if not replace and (name in _REGISTRY or name in BUILTIN_SERIALIZERS):
+        raise ValueError(f"Serializer {name!r} is already registered, use replace=True")
+    if dump is not None:
+        dump = _payload_only(dump)
+    serializer = Serializer(name, dump, load, suffixes=suffixes)
+    _REGISTRY[name] = serializer
+    return serializer
+
+
+def unregister_serializer(name) -> None:
+    """Remove a registered format; built-in formats fall back to their default."""
+    _REGISTRY.pop(name.lower(), None)
+
+
+def serializer_names() -> list:
+    """Built-in and registered format names, sorted."""
+    return sorted(BUILTIN_SERIALIZERS | set(_REGISTRY))
+
+
+def get_serializer(name, backend=None) -> Serializer:
+    """Serializer for format *name* (see :func:`resolve_serializer_backend`)."""
+    key = name.lower() if isinstance(name, str) else name
+    if key in _REGISTRY:
+        return _REGISTRY[key]
+    if key not in BUILTIN_SERIALIZERS:
+        raise ValueError(
+            f"Unsupported format {name!r}, choose one of: {serializer_names()}"
+        )
+    return _builtin_serializer(key, resolve_serializer_backend(key, backend))
+
+
+def serializer_for_suffix(suffix):
+    """Serializer loading files with *suffix* (``.json``, ...), or None."""
+    suffix = suffix.lower()
+    for serializer in _REGISTRY.values():
+        if suffix in serializer.suffixes and serializer.load is not None:
+            return serializer
+    for name in sorted(BUILTIN_SERIALIZERS - set(_REGISTRY)):
+        serializer = get_serializer(name)
+        if suffix in serializer.suffixes:
+            return serializer
+    return None
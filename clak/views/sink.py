@@ -0,0 +1,385 @@
+"""Output sinks: where rendered view text is written.
+
+Views hand text chunks to the current sink (:func:`current_sink`) instead
+of printing. Chunks are batched and written with ``writelines`` once
+``flush_bytes`` of text are pending, or one by one when the producer asks
+for it (NDJSON lines, pagers).
+
+Sinks:
+
+- :class:`StdoutSink` (default): the current ``sys.stdout``, through its
+  binary buffer when it has one and ``\n`` is the platform line separator
+  (no newline translation to skip). Pagers redirect ``sys.stdout``, so paged
+  output goes through it too.
+- :class:`TextSink`: any text stream.
+- :class:`BinarySink` / :class:`FileSink`: encoded bytes to a binary file.
+- :class:`AtomicFileSink`: a temporary file renamed over the target once
+  the output is complete, compressed on the fly (``.gz``, ``.bz2``,
+  ``.xz``). Backs the ``--output PATH`` view option.
+- :class:`CaptureSink`: keeps the chunks in memory (tests, embedding).
+
+``BrokenPipeError`` is not handled here: the stream source is closed and
+the error reaches the parser terminate chain, which exits quietly
+(``_exit_broken_pipe``).
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import errno
+import importlib
+import os
+import secrets
+import sys
+
+from clak.exception import ClakUserError
+
+STREAM_WRITE_BYTES = 64 * 1024
+
+# Output file suffix -> stdlib compression module
+COMPRESSION_SUFFIXES = {".gz": "gzip", ".bz2": "bz2", ".xz": "lzma"}
+# Output file suffix (after compression) -> view format
+OUTPUT_SUFFIX_FORMATS = {
+    ".csv": "csv",
+    ".json": "json",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    ".yaml": "yaml",
+    ".yml": "yaml",
+}
+
+
+def close_stream(source) -> None:
+    """Close a generator-like payload so its ``finally`` blocks run now."""
+    close = getattr(source, "close", None)
+    if callable(close):
+        close()
+
+
+def _write_text(stream, chunks) -> None:
+    # Minimal file-likes (tests, proxies) may only implement write()
+    if len(chunks) == 1 or not hasattr(stream, "writelines"):
+        stream.write("".join(chunks))
+    else:
+        stream.writelines(chunks)
+
+
+class OutputSink:
+    """Base sink: batches text chunks and writes them with ``writelines``.
+
+    *flush_bytes* is the pending text size that triggers a write; with
+    *flush_each*, every chunk is written and flushed as soon as it is
+    produced.
+    """
+
+    def __init__(self, flush_bytes=STREAM_WRITE_BYTES, flush_each=False):
+        if isinstance(flush_bytes, bool) or not isinstance(flush_bytes, int):
+            raise TypeError(f"flush_bytes must be an int, got {flush_bytes!r}")
+        if flush_bytes <= 0:
+            raise ValueError(f"flush_bytes must be > 0, got {flush_bytes}")
+        self.flush_bytes = flush_bytes
+        self.flush_each = flush_each
+
+    def writelines(self, chunks) -> None:
+        """Write a batch of text chunks."""
+        raise NotImplementedError("Subclass must implement this method")
+
+    def flush(self) -> None:
+        """Push written text to the underlying stream."""
+
+    def close(self) -> None:
+        """Flush and release the underlying stream (if owned)."""
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def write(self, text) -> None:
+        """Write one text chunk now."""
+        if text:
+            self.writelines((text,))
+
+    def write_chunks(self, chunks, source=None, end="\n", flush=False) -> None:
+        """Write text *chunks* in batches, then *end*, like ``print``.
+
+        With *flush* (or ``flush_each``), every chunk is written and
+        flushed as soon as it is produced. *source* is closed whatever
+        happens, so a user generator releases its cursor or file when the
+        pipe breaks; the error still propagates.
+        """
+        flush = flush or self.flush_each
+        batch = []
+        size = 0
+        try:
+            for chunk in chunks:
+                batch.append(chunk)
+                size += len(chunk)
+                if flush or size >= self.flush_bytes:
+                    self.writelines(batch)
+                    if flush:
+                        self.flush()
+                    batch.clear()
+                    size = 0
+            if end:
+                batch.append(end)
+            if batch:
+                self.writelines(batch)
+            self.flush()
+        finally:
+            close_stream(source)
+
+
+class TextSink(OutputSink):
+    """Write to a text stream; None means the current ``sys.stdout``."""
+
+    def __init__(self, stream=None, **options):
+        super().__init__(**options)
+        self.stream = stream
+
+    @property
+    def target(self):
+        """Text stream written to."""
+        return self.stream if self.stream is not None else sys.stdout
+
+    def writelines(self, chunks) -> None:
+        _write_text(self.target, chunks)
+
+    def flush(self) -> None:
+        self.target.flush()
+
+
+class StdoutSink(TextSink):
+    """Write to the current ``sys.stdout``, as bytes when it has a buffer.
+
+    Text already written through the stream (``print``) is flushed first,
+    so output keeps its order. Streams without a binary buffer (StringIO)
+    are written as text, and so is everything when :attr:`write_bytes` is
+    false: text streams translate ``\n`` to ``os.linesep`` (Windows),
+    which writing to the buffer would skip.
+    """
+
+    write_bytes = os.linesep == "\n"
+
+    def __init__(self, **options):
+        super().__init__(None, **options)
+
+    def writelines(self, chunks) -> None:
+        stream = self.target
+        buffer = getattr(stream, "buffer", None) if self.write_bytes else None
+        if buffer is None:
+            _write_text(stream, chunks)
+            return
+        stream.flush()
+        encoding = getattr(stream, "encoding", None) or "utf-8"
+        errors = getattr(stream, "errors", None) or "strict"
+        buffer.writelines([chunk.encode(encoding, errors) for chunk in chunks])
+
+    def flush(self) -> None:
+        stream = self.target
+        stream.flush()
+        buffer = getattr(stream, "buffer", None)
+        if buffer is not None:
+            buffer.flush()
+
+
+class BinarySink(OutputSink):
+    """Write encoded text to a binary file object."""
+
+    def __init__(self, fileobj, encoding="utf-8", **options):
+        super().__init__(**options)
+        self.fileobj = fileobj
+        self.encoding = encoding
+
+    def writelines(self, chunks) -> None:
+        self.fileobj.writelines([chunk.encode(self.encoding) for chunk in chunks])
+
+    def flush(self) -> None:
+        self.fileobj.flush()
+
+
+class FileSink(BinarySink):
+    """Write to the file at *path* (truncated), closed with the sink."""
+
+    def __init__(self, path, encoding="utf-8", **options):
+        # pylint: disable-next=consider-using-with
+        super().__init__(open(path, "wb"), encoding=encoding, **options)
+        self.path = path
+
+    def close(self) -> None:
+        if not self.fileobj.closed:
+            self.fileobj.close()
+
+
+def _split_compression(path):
+    """Return ``(path without compression suffix, compression module or None)``."""
+    root, suffix = os.path.splitext(os.fspath(path))
+    compression = COMPRESSION_SUFFIXES.get(suffix.lower())
+    if compression is None:
+        return os.fspath(path), None
+    return root, compression
+
+
+def compression_for_path(path):
+    """Compression module (``gzip``, ``bz2``, ``lzma``) for *path*, or None."""
+    return _split_compression(path)[1]
+
+
+def format_for_path(path):
+    """View format for an output file name, or None when the suffix is unknown.
+
+    A compression suffix is ignored: ``users.json.gz`` is ``json``.
+    """
+    root, _ = _split_compression(path)
+    return OUTPUT_SUFFIX_FORMATS.get(os.path.splitext(root)[1].lower())
+
+
+def _existing_mode(path):
+    """Permission bits of *path*, or None when it does not exist."""
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        return None
+
+
+def _create_temp_file(directory, name, mode):
+    """Create ``.NAME.XXXXXXXX.tmp`` in *directory*: ``(fd, path)``.
+
+    The file is created with *mode* minus the umask, like ``open()`` does,
+    so the umask is never read or changed.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    for _ in range(100):
+        temp_path = os.path.join(directory, f".{name}.{secrets.token_hex(4)}.tmp")
+        try:
+            return os.open(temp_path, flags, mode), temp_path
+        except FileExistsError:
+            continue
+    raise FileExistsError(
+        errno.EEXIST, "No usable temporary file name found", directory
+    )
+
+
+class AtomicFileSink(BinarySink):
+    """Write to a temporary file next to *path*, renamed over it on close.
+
+    Readers never see a partial file: the temporary file is moved into place
+    (``os.replace``) only when the ``with`` block ends without error;
+    otherwise it is removed and *path* is left untouched. *compression*
+    (``gzip``, ``bz2``, ``lzma`` or None) compresses while writing; by
+    default it is picked from the suffix of *path*. Writes are batched
+    whatever the producer asks, since nothing reads the file before the
+    rename.
+    """
+
+    def __init__(self, path, encoding="utf-8", compression="auto", **options):
+        path = os.fspath(path)
+        if compression == "auto":
+            compression = compression_for_path(path)
+        directory, name = os.path.split(os.path.abspath(path))
+        # An existing file keeps its mode; a new one gets 0o666 - umask
+        self.mode = _existing_mode(path)
+        try:
+            fd, self.temp_path = _create_temp_file(
+                directory, name, 0o666 if self.mode is None else self.mode
+            )
+        except OSError as err:
+            raise ClakUserError(
+                f"Cannot write output file {path}: {err.strerror or err}"
+            ) from err
+        # pylint: disable-next=consider-using-with
+        self.raw = os.fdopen(fd, "wb")
+        fileobj = self.raw
+        if compression:
+            module = importlib.import_module(compression)
+            fileobj = module.open(self.raw, "wb")
+        super().__init__(fileobj, encoding=encoding, **options)
+        self.path = path
+        self.compression = compression
+        self.done = False
+
+    def write_chunks(
+        self, chunks, source=None, end="\n", flush=False
+    ) -> None:  # pylint: disable=unused-argument
+        # Per-chunk flushes would only hurt compression
+        super().write_chunks(chunks, source=source, end=end)
+
+    def flush(self) -> None:
+        """Nothing to do: the file is only visible once closed."""
+
+    def _close_files(self) -> None:
+        if self.fileobj is not self.raw and not self.fileobj.closed:
+            self.fileobj.close()
+        if not self.raw.closed:
+            self.raw.flush()
+            os.fsync(self.raw.fileno())
+            self.raw.close()
+
+    def close(self) -> None:
+        """Finish the file and move it into place."""
+        if self.done:
+            return
+        self.done = True
+        try:
+            self._close_files()
+            if self.mode is not None:
+                # The umask may have dropped bits at creation
+                os.chmod(self.temp_path, self.mode)
+            os.replace(self.temp_path, self.path)
+        except BaseException:
+            self.abort()
+            raise
+
+    def abort(self) -> None:
+        """Drop the temporary file; *path* is left as it was."""
+        self.done = True
+        with contextlib.suppress(OSError):
+            self.fileobj.close()
+        with contextlib.suppress(OSError):
+            self.raw.close()
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self.temp_path)
+
+    def __exit__(self, *exc_info):
+        if exc_info[0] is not None:
+            self.abort()
+        else:
+            self.close()
+
+
+class CaptureSink(OutputSink):
+    """Keep written chunks in memory; :meth:`getvalue` joins them."""
+
+    def __init__(self, **options):
+        super().__init__(**options)
+        self.chunks = []
+
+    def writelines(self, chunks) -> None:
+        self.chunks.extend(chunks)
+
+    def getvalue(self) -> str:
+        """All text written so far."""
+        return "".join(self.chunks)
+
+
+_CURRENT_SINK = contextvars.ContextVar("clak_output_sink", default=None)
+
+
+def current_sink() -> OutputSink:
+    """Sink views write to: the one set by :func:`output_to`, else stdout."""
+    sink = _CURRENT_SINK.get()
+    return sink if sink is not None else StdoutSink()
+
+
+@contextlib.contextmanager
+def output_to(sink):
+    """Send view output written in the block to *sink* (then close it)."""
+    token = _CURRENT_SINK.set(sink)
+    try:
+        with sink:
+            yield sink
+    finally:
+        _CURRENT_SINK.reset(token)
@@ -4,8 +4,8 @@
 
 from __future__ import annotations
 
-import json
 from collections.abc import Mapping, Sequence
+from itertools import chain, islice
 
 from clak.views.base import (
     DEFAULT_WIDTH_MODE,
@@ -13,15 +13,31 @@ from clak.views.base import (
     OUTPUT_FORMATS,
     WRAP_MODES,
     ClakView,
+    is_stream_payload,
+    output_stream,
 )
+from clak.views.serializers import get_serializer
+from clak.views.table_columnar import Columns, as_columns, iter_take_rows
 from clak.views.table_formatter import (
     TableListFormatter,
     TableShowFormatter,
-    default_sort_columns,
-    format_structured,
-    require_yaml,
     resolve_column_keys,
-    sort_table_rows,
+)
+from clak.views.table_records import (
+    format_structured,
+    iter_json_records,
+    iter_ndjson_records,
+    iter_yaml_records,
+)
+from clak.views.table_sort import (
+    RowSort,
+    RowWindow,
+    default_sort_columns,
+    external_sort,
+    resolve_column_index,
+    resolve_sort_column_index,
+    row_sort_key,
+    sort_rows,
 )
 
 
@@ -198,6 +214,35 @@ def normalize_wrap_min(value):
     )
 
 
+def parse_row_count(value):
+    """Parse a ``--limit`` / ``--offset`` row count: non-negative int."""
+    if isinstance(value, bool):
+        raise TypeError("row count must be a non-negative int")
+    if isinstance(value, str):
+        try:
+            value = int(value.strip())
+        except ValueError as err:
+            raise ValueError("row count must be a non-negative int") from err
+    if not isinstance(value, int):
+        raise TypeError(
+            f"row count must be a non-negative int, got {type(value).__name__}"
+        )
+    if value < 0:
+        raise ValueError(f"row count must be >= 0, got {value}")
+    return value
+
+
+def _window_list_payload(payload, window):
+    """Keep the :class:`RowWindow` rows of a sorted list or dict payload."""
+    if not window.active:
+        return payload
+    if isinstance(payload, Mapping):
+        return dict(window.iter_take(payload.items()))
+    if isinstance(payload, Sequence) and not isinstance(payload, (str, bytes)):
+        return list(window.take(payload))
+    return payload
+
+
 def _project_item_columns(item, columns):
     """Keep original values while projecting selected columns on one row."""
     if isinstance(item, Mapping):
@@ -226,29 +271,24 @@ def _project_list_columns(payload, columns):
 
 
 def _dump_structured_payload(payload, fmt):
-    """Serialize an original payload as json or yaml."""
+    """Serialize an original payload as json, ndjson (one line), or yaml."""
     if fmt == "json":
-        return json.dumps(payload, indent=2, default=str) + "\n"
+        return get_serializer("json").dump(payload, indent=2) + "\n"
+
+    if fmt == "ndjson":
+        return get_serializer("json").dump(payload, indent=None, compact=True) + "\n"
 
     if fmt == "yaml":
-        return require_yaml().safe_dump(
-            payload, sort_keys=False, default_flow_style=False
-        )
+        return get_serializer("yaml").dump(payload)
 
     raise ValueError(f"Unsupported format {fmt!r}")
 
 
-def format_show_payload(  # pylint: disable=too-many-arguments,too-many-positional-arguments
-    payload,
-    fmt,
-    columns=None,
-    sort_columns=None,
-    sort_mode="asc",
-    add_index=True,
-):
-    """Render a single show payload as yaml, json, or csv.
+def format_show_payload(payload, fmt, columns=None, sort=RowSort(), add_index=True):
+    """Render a single show payload as yaml, json, ndjson (one line), or csv.
 
-    Sort is applied before serialization (same column rules as the table path).
+    Sort is applied before serialization (same column rules as the table path),
+    unless ``sort.presorted`` and no explicit ``sort.columns``.
     """
     if fmt not in OUTPUT_FORMATS - {"view"}:
         raise ValueError(
@@ -259,31 +299,26 @@ def format_show_payload(  # pylint: disable=too-many-arguments,too-many-position
         rows, headers = TableShowFormatter().process_table(
             payload, columns=columns, add_index=add_index
         )
-        if sort_columns is None and headers:
-            sort_columns = default_sort_columns(headers)
-        if sort_columns:
-            rows = sort_table_rows(rows, headers, sort_columns, sort_mode=sort_mode)
+        rows = sort.apply(rows, headers)
         return format_structured(rows, headers, "csv")
 
     # json / yaml: project original values, then reorder by sort
     if columns is not None:
         payload = _project_item_columns(payload, columns)
-    payload = _sort_show_payload(payload, sort_columns, sort_mode)
+    payload = _sort_show_payload(payload, sort)
     return _dump_structured_payload(payload, fmt)
 
 
-def _sort_show_payload(payload, sort_columns=None, sort_mode="asc"):
+def _sort_show_payload(payload, sort=RowSort()):
     """Reorder a show mapping/sequence using table sort rules (Key/Value rows)."""
+    if sort.presorted and not sort.columns:
+        return payload
     rows, headers = TableShowFormatter().process_table(
         payload, columns=None, add_index=True, remove_tabs=False
     )
-    if not rows:
+    if not rows or not sort.resolve(headers):
         return payload
-    if sort_columns is None:
-        sort_columns = default_sort_columns(headers)
-    if not sort_columns:
-        return payload
-    rows = sort_table_rows(rows, headers, sort_columns, sort_mode=sort_mode)
+    rows = sort.apply(rows, headers)
     if isinstance(payload, Mapping):
         return {row[0]: payload[row[0]] for row in rows if row[0] in payload}
     if isinstance(payload, Sequence) and not isinstance(payload, (str, bytes)):
@@ -292,28 +327,189 @@ def _sort_show_payload(payload, sort_columns=None, sort_mode="asc"):
     return payload
 
 
-def format_list_payload(
-    payload,
-    fmt,
-    columns=None,
-    sort_columns=None,
-    sort_mode="asc",
-):
+def format_list_payload(payload, fmt, columns=None, sort=RowSort(), window=RowWindow()):
     """Render a list payload as yaml or json with original values.
 
     Unlike the table path, this does not fill missing cells with ``"-"``,
     strip tabs, add Index columns, or otherwise adapt values for display.
-    Sort is applied to the projected payload before serialization.
+    Sort (skipped when ``sort.presorted`` and no explicit ``sort.columns``),
+    then the :class:`RowWindow`, are applied to the original items; only
+    the window is projected on *columns* before serialization.
     """
     if fmt not in {"json", "yaml"}:
         raise ValueError(f"Unsupported format {fmt!r}, choose one of: ['json', 'yaml']")
 
-    projected = _project_list_columns(payload, columns)
-    projected = _sort_list_payload(projected, sort_columns, sort_mode)
+    if isinstance(payload, Columns):
+        records = _iter_columnar_records(payload, columns, sort, window)
+        return _dump_structured_payload(list(records), fmt)
+
+    projected = _sort_window_list_payload(payload, sort, window, columns)
     return _dump_structured_payload(projected, fmt)
 
 
-def _sort_mapping_payload(payload, sort_columns, sort_mode):
+def _iter_columnar_records(payload, columns, sort, window):
+    """Yield the records of a columnar payload, sorted and windowed.
+
+    Like list payloads: unknown columns are dropped, values are not adapted
+    for display. *sort* and *window* are as in
+    :meth:`~clak.views.table_formatter.TableListFormatter.columnar_order`.
+    """
+    formatter = TableListFormatter()
+    keys, headers = formatter.columnar_keys(payload, columns=columns, add_index=False)
+    known = [idx for idx, values in enumerate(keys) if values is not None]
+    keys = [keys[idx] for idx in known]
+    headers = [headers[idx] for idx in known]
+    sort, hidden_keys = formatter.columnar_hidden(payload, sort, columns)
+    indexes, _ = formatter.columnar_order(
+        payload.num_rows, keys + hidden_keys, headers, sort, window
+    )
+    for row in iter_take_rows(keys, indexes, remove_tabs=False):
+        yield dict(zip(headers, row))
+
+
+def _sort_window_list_payload(payload, sort, window, columns=None):
+    """Sort a list/dict payload, keep the *window* rows, then project.
+
+    Only the rows of the window are projected on *columns*.
+    """
+    if sort.columns or not sort.presorted:
+        payload = _sort_list_payload(payload, sort, limit=window.stop, columns=columns)
+    return _project_list_columns(_window_list_payload(payload, window), columns)
+
+
+def select_list_records(payload, columns=None, sort=RowSort(), window=RowWindow()):
+    """Sort, window and project a list, dict, or iterator payload.
+
+    Lists, dicts and :class:`~clak.views.table_columnar.Columns` are sorted
+    like :func:`format_list_payload`; columnar records are built lazily.
+    Iterators keep their source order and are read record by record; a
+    window *limit* stops reading them once the window is full. With
+    ``sort.columns``, see :func:`_sort_stream_payload`.
+    """
+    if isinstance(payload, Columns):
+        return _iter_columnar_records(payload, columns, sort, window)
+    if not is_stream_payload(payload):
+        return _sort_window_list_payload(payload, sort, window, columns)
+
+    if sort.columns:
+        payload = _sort_stream_payload(payload, sort, window, columns)
+    else:
+        payload = window.iter_take(payload)
+    if columns is not None:
+        payload = (_project_item_columns(item, columns) for item in payload)
+    return payload
+
+
+def iter_list_payload(payload, fmt, ndjson_batch=None):
+    """Yield a list, dict, or iterator payload as yaml, json, or ndjson chunks.
+
+    Records are written as they are read; select them first with
+    :func:`select_list_records`. NDJSON writes a dict payload as one
+    ``{key: value}`` line per entry.
+    """
+    if fmt not in {"json", "yaml", "ndjson"}:
+        raise ValueError(
+            f"Unsupported format {fmt!r}, choose one of: ['json', 'ndjson', 'yaml']"
+        )
+
+    if isinstance(payload, Mapping):
+        if fmt != "ndjson":
+            return iter((_dump_structured_payload(payload, fmt),))
+        payload = ({key: value} for key, value in payload.items())
+
+    if fmt == "json":
+        return iter_json_records(payload)
+    if fmt == "ndjson":
+        return iter_ndjson_records(payload, batch=ndjson_batch)
+    return iter_yaml_records(payload)
+
+
+def _displayed_keys(first, columns=None):
+    """Fields of items shaped like *first* kept by the *columns* projection.
+
+    Same fields, in the same order, as :func:`_project_item_columns`.
+    """
+    if isinstance(first, Mapping):
+        available = list(first.keys())
+        if columns is None:
+            return available
+        keys = resolve_column_keys(columns, available, strict_names=False)
+        return [key for key in keys if key in first]
+    available = list(range(len(first)))
+    if columns is None:
+        return available
+    keys = resolve_column_keys(columns, available)
+    return [key for key in keys if isinstance(key, int) and key < len(first)]
+
+
+def _item_sort_fields(first, sort_columns, columns=None):
+    """Item fields sorted on, for items shaped like *first*.
+
+    Indexes (and the default, the first column) count the displayed
+    columns; names may be any field of a mapping item, displayed or not.
+    """
+    displayed = _displayed_keys(first, columns)
+    if sort_columns is None:
+        sort_columns = default_sort_columns(displayed)
+    fields = []
+    for col in sort_columns or ():
+        if isinstance(col, str) and isinstance(first, Mapping) and col not in displayed:
+            resolve_column_index(col, list(first.keys()))
+            fields.append(col)
+        else:
+            fields.append(displayed[resolve_sort_column_index(col, displayed)])
+    return fields
+
+
+def _item_sort_key(first, sort_columns, columns=None):
+    """Sort key for raw list items shaped like *first*, or None.
+
+    Only the sort fields are read from each item (see
+    :func:`_item_sort_fields`). None for scalar items or no sort column.
+    """
+    if isinstance(first, Mapping):
+        fields = _item_sort_fields(first, sort_columns, columns)
+        if not fields:
+            return None
+        key_fn = row_sort_key(range(len(fields)))
+        return lambda item: key_fn([item.get(field, "") for field in fields])
+    if isinstance(first, Sequence) and not isinstance(first, (str, bytes)):
+        fields = _item_sort_fields(first, sort_columns, columns)
+        return row_sort_key(fields) if fields else None
+    return None
+
+
+def _sort_stream_payload(payload, sort, window=RowWindow(), columns=None):
+    """Sort streamed list items and keep the :class:`RowWindow` rows.
+
+    Items are sorted before the *columns* projection, so sort columns need
+    not be displayed. With a *limit* only ``offset + limit`` items are kept
+    (heap). Otherwise up to ``sort.buffer`` items are sorted in memory and
+    larger streams spill sorted runs to disk
+    (:func:`~clak.views.table_sort.external_sort`).
+    """
+    items = iter(payload)
+    first = list(islice(items, 1))
+    if not first:
+        return []
+    items = chain(first, items)
+    key_fn = _item_sort_key(first[0], sort.columns, columns)
+    if key_fn is None:
+        return window.iter_take(items)
+
+    if window.limit is not None:
+        return window.take(
+            sort_rows(items, key_fn, reverse=sort.reverse, limit=window.stop)
+        )
+    ordered = external_sort(
+        items, key_fn, reverse=sort.reverse, buffer_rows=sort.buffer
+    )
+    if isinstance(ordered, list):
+        return window.take(ordered)
+    return window.iter_take(ordered)
+
+
+def _sort_mapping_payload(payload, sort, limit=None, columns=None):
     """Sort a dict-of-row-mappings; preserve key association."""
     if not payload:
         return payload
@@ -321,75 +517,55 @@ def _sort_mapping_payload(payload, sort_columns, sort_mode):
     values = list(payload.values())
     if not isinstance(values[0], Mapping):
         return payload
-    headers = list(values[0].keys())
-    if sort_columns is None:
-        sort_columns = default_sort_columns(headers)
-    if not sort_columns:
+    key_fn = _item_sort_key(values[0], sort.columns, columns)
+    if key_fn is None:
         return payload
-    rows = [[item.get(header, "") for header in headers] for item in values]
-    indexed = [[idx] + row for idx, row in enumerate(rows)]
-    remapped = _remap_sort_cols_after_index(sort_columns)
-    sorted_indexed = sort_table_rows(
-        indexed, ["__idx__"] + headers, remapped, sort_mode=sort_mode
+    order = sort_rows(
+        range(len(values)),
+        lambda idx: key_fn(values[idx]),
+        reverse=sort.reverse,
+        limit=limit,
     )
-    order = [row[0] for row in sorted_indexed]
-    return {keys[i]: values[i] for i in order}
+    return {keys[idx]: values[idx] for idx in order}
 
 
-def _sort_sequence_payload(payload, sort_columns, sort_mode):
+def _sort_sequence_payload(payload, sort, limit=None, columns=None):
     """Sort a sequence of rows (mappings or sequences)."""
     if not payload:
         return payload
     first = payload[0]
-    if isinstance(first, Mapping):
-        return _sort_sequence_of_mappings(list(payload), sort_columns, sort_mode)
     if isinstance(first, Sequence) and not isinstance(first, (str, bytes)):
-        headers = list(range(len(first)))
-        if sort_columns is None:
-            sort_columns = default_sort_columns(headers)
-        if not sort_columns:
-            return payload
-        rows = [list(item) for item in payload]
-        return sort_table_rows(rows, headers, sort_columns, sort_mode=sort_mode)
-    return payload
+        payload = [list(item) for item in payload]
+    elif not isinstance(first, Mapping):
+        return payload
+    key_fn = _item_sort_key(first, sort.columns, columns)
+    if key_fn is None:
+        return payload
+    return sort_rows(payload, key_fn, reverse=sort.reverse, limit=limit)
 
 
-def _sort_list_payload(payload, sort_columns=None, sort_mode="asc"):
-    """Sort a list/dict-of-rows payload by column specs."""
+def _sort_list_payload(payload, sort=RowSort(), limit=None, columns=None):
+    """Sort a list/dict-of-rows payload by ``sort.columns`` specs.
+
+    Sort keys come from the original items; *columns* is the projection
+    applied afterwards (it gives column indexes their meaning). With
+    *limit*, rows past the first *limit* sorted ones may be dropped.
+    """
     if isinstance(payload, Mapping):
-        return _sort_mapping_payload(payload, sort_columns, sort_mode)
+        return _sort_mapping_payload(payload, sort, limit=limit, columns=columns)
     if isinstance(payload, Sequence) and not isinstance(payload, (str, bytes)):
-        return _sort_sequence_payload(payload, sort_columns, sort_mode)
+        return _sort_sequence_payload(payload, sort, limit=limit, columns=columns)
     return payload
 
 
-def _remap_sort_cols_after_index(sort_columns):
-    """Shift 1-based positive indexes by +1 when a leading index column is present."""
-    remapped = []
-    for col in sort_columns:
-        if isinstance(col, int) and col > 0:
-            remapped.append(col + 1)
-        else:
-            remapped.append(col)
-    return remapped
-
-
-def _sort_sequence_of_mappings(items, sort_columns=None, sort_mode="asc"):
-    """Sort a list of mapping rows; return original dicts in sorted order."""
-    if not items:
-        return items
-    headers = list(items[0].keys())
-    if sort_columns is None:
-        sort_columns = default_sort_columns(headers)
-    if not sort_columns:
-        return items
-    rows = [[item.get(header, "") for header in headers] for item in items]
-    indexed = [[idx] + row for idx, row in enumerate(rows)]
-    remapped = _remap_sort_cols_after_index(sort_columns)
-    sorted_indexed = sort_table_rows(
-        indexed, ["__idx__"] + headers, remapped, sort_mode=sort_mode
+def _settings_sort(settings):
+    """RowSort built from view *settings* (sort columns, mode, buffer)."""
+    return RowSort(
+        settings.get("sort_columns"),
+        settings.get("sort_mode") or "asc",
+        presorted=bool(settings.get("presorted")),
+        buffer=settings.get("sort_buffer"),
     )
-    return [items[row[0]] for row in sorted_indexed]
 
 
 class TableView(ClakView):
@@ -406,6 +582,24 @@ class TableView(ClakView):
         "add_index": None,
     }
 
+    def make_formatter(self):
+        """Formatter that turns the payload into table rows."""
+        raise NotImplementedError(
+            f"{self.__class__.__name__} must implement make_formatter()"
+        )
+
+    def natural_width(self, *args, **kwargs):
+        """Outer border width of the table at content width, or None.
+
+        Measured from the processed rows without rendering. Stream payloads
+        return None: measuring them would consume the source.
+        """
+
+        payload, settings = self._render(*args, **kwargs)
+        if is_stream_payload(payload):
+            return None
+        return self.make_formatter().natural_width(payload, **settings)
+
 
 class ShowView(TableView):
     "Render show data"
@@ -415,6 +609,9 @@ class ShowView(TableView):
         "add_index": True,
     }
 
+    def make_formatter(self):
+        return TableShowFormatter()
+
     def render(self, *args, stdout=True, **kwargs):
         "Render data"
 
@@ -425,14 +622,16 @@ class ShowView(TableView):
                 payload,
                 fmt,
                 columns=settings.get("columns"),
-                sort_columns=settings.get("sort_columns"),
-                sort_mode=settings.get("sort_mode") or "asc",
+                sort=_settings_sort(settings),
                 add_index=(
                     settings["add_index"]
                     if isinstance(settings.get("add_index"), bool)
                     else True
                 ),
             )
+            if fmt == "ndjson":
+                # One record line; print() supplies the newline
+                rendered = rendered.rstrip("\n")
             return self._output(rendered, stdout=stdout)
 
         rendered = TableShowFormatter().render(payload, **settings)
@@ -446,22 +645,58 @@ class ListView(TableView):
         **TableView.settings_default,
         "expand_keys": True,
         "add_index": None,
+        "offset": None,
+        "limit": None,
     }
 
+    def make_formatter(self):
+        return TableListFormatter()
+
+    def _render(self, *args, **settings):
+        "Render data; NumPy structured arrays become Columns payloads"
+
+        payload, _settings = super()._render(*args, **settings)
+        columnar = as_columns(payload)
+        return (payload if columnar is None else columnar), _settings
+
     def render(self, *args, stdout=True, **kwargs):
         "Render data"
 
         payload, settings = self._render(*args, **kwargs)
         fmt = settings.pop("format", None) or "view"
+        if fmt == "ndjson":
+            chunks = self.iter_stream(payload, fmt, settings)
+            return output_stream(
+                chunks, source=payload, stdout=stdout, end="", flush=True
+            )
+        if is_stream_payload(payload):
+            chunks = self.iter_stream(payload, fmt, settings)
+            return output_stream(chunks, source=payload, stdout=stdout)
+
         if fmt in {"yaml", "json"}:
             rendered = format_list_payload(
                 payload,
                 fmt,
                 columns=settings.get("columns"),
-                sort_columns=settings.get("sort_columns"),
-                sort_mode=settings.get("sort_mode") or "asc",
+                sort=_settings_sort(settings),
+                window=RowWindow.of(settings.get("offset"), settings.get("limit")),
             )
             return self._output(rendered, stdout=stdout)
 
         rendered = TableListFormatter().render(payload, format=fmt, **settings)
         return self._output(rendered, stdout=stdout)
+
+    @staticmethod
+    def iter_stream(payload, fmt, settings):
+        """Text chunks for streamed output (iterator payloads, or ndjson)."""
+        if fmt not in {"yaml", "json", "ndjson"}:
+            return TableListFormatter().iter_render(payload, format=fmt, **settings)
+        records = select_list_records(
+            payload,
+            columns=settings.get("columns"),
+            sort=_settings_sort(settings),
+            window=RowWindow.of(settings.get("offset"), settings.get("limit")),
+        )
+        return iter_list_payload(
+            records, fmt, ndjson_batch=settings.get("ndjson_batch")
+        )
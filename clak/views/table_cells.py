@@ -0,0 +1,157 @@
+"""Per-column cell caches for table views.
+
+Status, region or boolean columns repeat a handful of values across many
+rows. A :class:`CellCache` belongs to one column and maps each distinct
+raw value to its formatted text, display width and sort key, so each is
+computed once per value instead of once per cell.
+
+Caches are bounded: once ``maxsize`` values are stored, new values are
+computed without being stored. A column whose values turn out to be
+mostly distinct (fewer hits than stored values when the cache fills)
+stops caching altogether, so unique names or ids do not pay for lookups
+that never hit. Only str, int, bool and None values are cached: equal
+values of other types may print differently (``Decimal("1.10")`` and
+``Decimal("1.1")``, ``0.0`` and ``-0.0``).
+"""
+
+from __future__ import annotations
+
+from clak.views.table_engine import DEFAULT_CELL_CACHE_SIZE, cell_text, text_width
+
+# Types whose equal values always format to the same text
+CACHED_TYPES = frozenset({str, int, bool, type(None)})
+
+
+def cell_sort_key(value):
+    """Sort key: numbers before strings; digit strings compare as ints."""
+    if isinstance(value, bool):
+        return (2, str(value))
+    if isinstance(value, (int, float)):
+        return (0, value)
+    text = "" if value is None else str(value)
+    if text.isdigit() or (text.startswith("-") and text[1:].isdigit()):
+        return (0, int(text))
+    return (1, text.lower())
+
+
+class CellCache:
+    """Formatted text, display width and sort key of one column's values.
+
+    Values of :data:`CACHED_TYPES` are keyed by ``(type, value)``, so ``1``
+    and ``True`` keep their own text; other values are formatted each time.
+    :attr:`widest` is the display width of the widest text passed through
+    :meth:`measure`, cached or not.
+    """
+
+    __slots__ = ("maxsize", "widest", "_entries", "_hits")
+
+    def __init__(self, maxsize=DEFAULT_CELL_CACHE_SIZE):
+        if isinstance(maxsize, bool) or not isinstance(maxsize, int):
+            raise TypeError(f"cell cache size must be an int, got {maxsize!r}")
+        if maxsize < 0:
+            raise ValueError(f"cell cache size must be >= 0, got {maxsize}")
+        self.maxsize = maxsize
+        self.widest = 0
+        self._entries = {} if maxsize else None
+        self._hits = 0
+
+    def __len__(self):
+        return len(self._entries) if self._entries is not None else 0
+
+    @property
+    def enabled(self) -> bool:
+        """False once the column stopped caching (see module docstring)."""
+        return self._entries is not None
+
+    def _entry(self, value):
+        """Cache entry ``[text, width, sort key]`` of *value*, or None.
+
+        Fields are filled on first use: sorting alone never formats.
+        """
+        entries = self._entries
+        cls = value.__class__
+        if entries is None or cls not in CACHED_TYPES:
+            return None
+        marker = (cls, value)
+        entry = entries.get(marker)
+        if entry is not None:
+            self._hits += 1
+            return entry
+        if len(entries) >= self.maxsize:
+            if self._hits < len(entries):
+                self._entries = None
+            return None
+        entry = entries[marker] = [None, None, None]
+        return entry
+
+    def text(self, value) -> str:
+        """Formatted text of *value* (see :func:`cell_text`)."""
+        entry = self._entry(value)
+        if entry is None:
+            return cell_text(value)
+        text = entry[0]
+        if text is None:
+            text = entry[0] = cell_text(value)
+        return text
+
+    def width(self, value) -> int:
+        """Display width of the formatted text of *value*."""
+        entry = self._entry(value)
+        if entry is None:
+            return text_width(cell_text(value))
+        width = entry[1]
+        if width is None:
+            text = entry[0]
+            if text is None:
+                text = entry[0] = cell_text(value)
+            width = entry[1] = text_width(text)
+        return width
+
+    def measure(self, value) -> str:
+        """Like :meth:`text`, also widening :attr:`widest` to fit the text."""
+        entry = self._entry(value)
+        if entry is None:
+            text = cell_text(value)
+            width = text_width(text)
+        else:
+            text = entry[0]
+            if text is None:
+                text = entry[0] = cell_text(value)
+            width = entry[1]
+            if width is None:
+                width = entry[1] = text_width(text)
+        if width > self.widest:  # pylint: disable=consider-using-max-builtin
+            self.widest = width
+        return text
+
+    def sort_key(self, value):
+        """Sort key of *value* (see :func:`cell_sort_key`)."""
+        entry = self._entry(value)
+        if entry is None:
+            return cell_sort_key(value)
+        key = entry[2]
+        if key is None:
+            key = entry[2] = cell_sort_key(value)
+        return key
+
+
+def cell_caches(count, maxsize=DEFAULT_CELL_CACHE_SIZE) -> list:
+    """One :class:`CellCache` per column, for *count* columns."""
+    return [CellCache(maxsize) for _ in range(count)]
+
+
+def format_cached_row(row, caches, measure=True) -> list:
+    """Stringify one row through per-column *caches* (see :func:`format_row`).
+
+    With *measure*, the cells also widen their cache :attr:`~CellCache.widest`.
+    """
+    if measure:
+        return [cache.measure(value) for cache, value in zip(caches, row)]
+    return [cache.text(value) for cache, value in zip(caches, row)]
+
+
+def cached_widths(headers, caches) -> list:
+    """Column widths of the rows measured through *caches* so far."""
+    return [
+        max(text_width(header), cache.widest) for header, cache in zip(headers, caches)
+    ]
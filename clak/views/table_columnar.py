@@ -0,0 +1,224 @@
+"""Column-oriented list payloads for table views.
+
+A :class:`Columns` payload holds one sequence per column instead of one
+record per row. Projection, sorting and width measurement run per column,
+and row lists are only built for the rows actually displayed. Columns held
+as NumPy arrays (or a NumPy structured array) are sorted and measured with
+vectorized operations when NumPy is installed; other columns use the pure
+Python path.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+from clak.common import replace_tabs
+from clak.views.table_cells import CellCache
+from clak.views.table_sort import column_sort_keys, sort_rows
+
+# Optional vectorized path
+try:
+    import numpy as _np  # type: ignore
+except ImportError:
+    _np = None
+
+MISSING_CELL = "-"
+DEFAULT_ROW_BATCH = 1024
+
+# dtype kinds whose sort order and text width can be computed on the array:
+# bool, signed and unsigned int, float (same order as the Python cell keys)
+_NUMERIC_KINDS = frozenset("biuf")
+
+
+def _is_structured_array(data) -> bool:
+    return (
+        _np is not None
+        and isinstance(data, _np.ndarray)
+        and data.dtype.names is not None
+    )
+
+
+def _is_ndarray(values) -> bool:
+    return _np is not None and isinstance(values, _np.ndarray)
+
+
+class Columns:
+    """Table payload held column-wise: ``{name: values}``.
+
+    *data* is a mapping of equal-length sequences (lists, tuples, ranges or
+    NumPy arrays), or a NumPy structured array (one column per field)::
+
+        ListView(Columns({"name": names, "size": sizes}))
+
+    Each column is one table column; a plain dict payload is read as one
+    row per key instead.
+    """
+
+    __slots__ = ("_columns", "num_rows")
+
+    def __init__(self, data):
+        if isinstance(data, Columns):
+            columns = dict(data._columns)  # pylint: disable=protected-access
+        elif _is_structured_array(data):
+            columns = {name: data[name] for name in data.dtype.names}
+        elif isinstance(data, Mapping):
+            columns = dict(data)
+        else:
+            raise TypeError(
+                "Columns expects a mapping of sequences or a NumPy structured "
+                f"array, got {type(data).__name__}"
+            )
+
+        for name, values in columns.items():
+            if isinstance(values, (str, bytes)) or not hasattr(values, "__len__"):
+                raise TypeError(
+                    f"Column {name!r} must be a sequence, got {type(values).__name__}"
+                )
+        lengths = {len(values) for values in columns.values()}
+        if len(lengths) > 1:
+            sizes = ", ".join(
+                f"{name}={len(values)}" for name, values in columns.items()
+            )
+            raise ValueError(f"All columns must have the same length, got {sizes}")
+
+        self._columns = columns
+        self.num_rows = lengths.pop() if lengths else 0
+
+    def __repr__(self):
+        return f"Columns(names={self.names!r}, num_rows={self.num_rows})"
+
+    @property
+    def names(self) -> list:
+        """Column names, in payload order."""
+        return list(self._columns)
+
+    def column(self, name, default=None):
+        """Values of column *name*, or *default* when there is no such column."""
+        return self._columns.get(name, default)
+
+
+def as_columns(payload):
+    """Return *payload* as :class:`Columns` if it is columnar, else None."""
+    if isinstance(payload, Columns):
+        return payload
+    if _is_structured_array(payload):
+        return Columns(payload)
+    return None
+
+
+def _numeric_vector(values):
+    """*values* as a NumPy array when it can be sorted vectorized, else None."""
+    if _np is None:
+        return None
+    if isinstance(values, range):
+        return _np.arange(values.start, values.stop, values.step)
+    if isinstance(values, _np.ndarray) and values.dtype.kind in _NUMERIC_KINDS:
+        return values
+    return None
+
+
+def _python_values(values):
+    return values.tolist() if _is_ndarray(values) else values
+
+
+def _vector_order(vectors, reverse=False):
+    """Stable lexicographic order of *vectors* (first vector is primary).
+
+    Descending order keeps ties in their original order, like
+    ``sorted(..., reverse=True)``: sort the reversed arrays, then flip.
+    """
+    if reverse:
+        size = len(vectors[0])
+        vectors = [vector[::-1] for vector in vectors]
+        order = _np.lexsort(vectors[::-1])
+        return (size - 1 - order)[::-1]
+    return _np.lexsort(vectors[::-1])
+
+
+def sort_order(keys, num_rows, reverse=False, limit=None) -> list:
+    """Row numbers ordered by the *keys* columns (first key is primary).
+
+    Same order as sorting the equivalent rows with the table cell keys
+    (see :mod:`clak.views.table_sort`). NumPy numeric columns are sorted
+    with a vectorized stable sort; other columns have their cell keys
+    computed once per column. With *limit*, only the first *limit* row
+    numbers are returned.
+    """
+    vectors = [_numeric_vector(values) for values in keys]
+    if vectors and all(vector is not None for vector in vectors):
+        order = _vector_order(vectors, reverse=reverse)
+        if limit is not None:
+            order = order[:limit]
+        return order.tolist()
+
+    key_lists = [column_sort_keys(_python_values(values)) for values in keys]
+    if len(key_lists) == 1:
+        key_fn = key_lists[0].__getitem__
+    else:
+
+        def key_fn(idx):
+            return [key_list[idx] for key_list in key_lists]
+
+    return sort_rows(range(num_rows), key_fn, reverse=reverse, limit=limit)
+
+
+def _take(values, indexes, remove_tabs=True) -> list:
+    """Cells of one column for *indexes*; a None column is all ``"-"``."""
+    if values is None:
+        return [MISSING_CELL] * len(indexes)
+    if _is_ndarray(values):
+        if isinstance(indexes, range) and indexes.step == 1:
+            picked = values[indexes.start : indexes.stop]
+        else:
+            picked = values[_np.asarray(indexes, dtype=_np.intp)]
+        if values.dtype.kind in _NUMERIC_KINDS:
+            return picked.tolist()
+        cells = picked.tolist()
+    elif isinstance(indexes, range) and indexes.step == 1:
+        cells = list(values[indexes.start : indexes.stop])
+    else:
+        cells = [values[idx] for idx in indexes]
+    if remove_tabs is not False:
+        cells = [replace_tabs(value, remove_tabs) for value in cells]
+    return cells
+
+
+def take_rows(keys, indexes, remove_tabs=True) -> list:
+    """Row lists for row numbers *indexes*, one cell per column of *keys*."""
+    if not keys:
+        return [[] for _ in indexes]
+    cells = [_take(values, indexes, remove_tabs) for values in keys]
+    return [list(row) for row in zip(*cells)]
+
+
+def iter_take_rows(keys, indexes, remove_tabs=True, batch=DEFAULT_ROW_BATCH):
+    """Like :func:`take_rows`, building *batch* rows at a time."""
+    for start in range(0, len(indexes), batch):
+        yield from take_rows(keys, indexes[start : start + batch], remove_tabs)
+
+
+def column_width(values, remove_tabs=True) -> int:
+    """Widest formatted cell of one column, in display cells.
+
+    Integer and bool NumPy columns are measured from their extreme values;
+    a None column (missing) is as wide as ``"-"``.
+    """
+    if values is None:
+        return len(MISSING_CELL)
+    if len(values) == 0:  # pylint: disable=use-implicit-booleaness-not-len
+        return 0
+    if isinstance(values, range):
+        return max(len(str(values[0])), len(str(values[-1])))
+    if _is_ndarray(values):
+        kind = values.dtype.kind
+        if kind in "iu":
+            return max(len(str(values.min())), len(str(values.max())))
+        if kind == "b":
+            return len(str(bool(values.all())))
+        values = values.tolist()
+    if remove_tabs is not False:
+        values = (replace_tabs(value, remove_tabs) for value in values)
+    cache = CellCache()
+    for value in values:
+        cache.measure(value)
+    return cache.widest
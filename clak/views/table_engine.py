@@ -0,0 +1,280 @@
+"""Line-oriented table renderer compatible with the PrettyTable layout.
+
+Rows are formatted and emitted one at a time, so a table can be written
+while its source iterator is still producing data. Output matches
+``PrettyTable.get_string()`` (left aligned, padding 1, frame borders) for
+the same column widths, including ColorTable theme escape codes.
+"""
+
+from __future__ import annotations
+
+import textwrap
+from functools import lru_cache
+
+import wcwidth
+
+from clak.views.base import strip_ansi
+
+STREAM_OVERFLOW_MODES = frozenset({"wrap", "truncate"})
+DEFAULT_STREAM_OVERFLOW = "wrap"
+DEFAULT_STREAM_SAMPLE = 200
+# Distinct values cached per column (formatted cells, padded cells)
+DEFAULT_CELL_CACHE_SIZE = 4096
+_ELLIPSIS = "…"
+_WORD_SEP = textwrap.TextWrapper.wordsep_re
+
+
+class TableStyle:  # pylint: disable=too-few-public-methods
+    """Border characters (possibly ANSI colored) and the table suffix."""
+
+    __slots__ = ("vertical", "horizontal", "junction", "suffix")
+
+    def __init__(self, vertical="|", horizontal="-", junction="+", suffix=""):
+        self.vertical = vertical
+        self.horizontal = horizontal
+        self.junction = junction
+        self.suffix = suffix
+
+    @classmethod
+    def from_table(cls, table):
+        """Copy border chars from a configured PrettyTable/ColorTable instance."""
+        # ColorTable appends a reset code once, after the last line
+        suffix = "\x1b[0m" if getattr(table, "theme", None) is not None else ""
+        return cls(
+            vertical=table.vertical_char,
+            horizontal=table.horizontal_char,
+            junction=table.junction_char,
+            suffix=suffix,
+        )
+
+
+def cell_text(value) -> str:
+    """Stringify a cell the way PrettyTable does (``str`` + tab expansion)."""
+    text = value if isinstance(value, str) else str(value)
+    if "\t" in text:
+        return text.expandtabs()
+    return text
+
+
+def line_width(line: str) -> int:
+    """Display width of one line; plain printable ASCII skips wcwidth.
+
+    ANSI color codes take no cells; control characters count as zero.
+    """
+    if line.isascii() and line.isprintable():
+        return len(line)
+    line = strip_ansi(line)
+    size = wcwidth.wcswidth(line)
+    if size < 0:
+        size = sum(max(wcwidth.wcwidth(char), 0) for char in line)
+    return size
+
+
+def ljust(line: str, width: int) -> str:
+    """Pad *line* with spaces to *width* display cells."""
+    pad = width - line_width(line)
+    return line + " " * pad if pad > 0 else line
+
+
+@lru_cache(maxsize=4096)
+def text_width(text: str) -> int:
+    """Display width of a (possibly multi-line) cell."""
+    if "\n" not in text:
+        return line_width(text)
+    return max(line_width(line) for line in text.split("\n"))
+
+
+def format_row(row) -> list:
+    """Stringify every cell of one row."""
+    return [cell_text(value) for value in row]
+
+
+def measure_widths(headers, rows) -> list:
+    """Natural column widths: widest header or formatted cell per column."""
+    widths = [text_width(header) for header in headers]
+    for row in rows:
+        for idx, text in enumerate(row):
+            size = text_width(text)
+            if size > widths[idx]:
+                widths[idx] = size
+    return widths
+
+
+def _fit_prefix(text: str, width: int) -> str:
+    """Longest prefix of *text* that fits in *width* display cells."""
+    used = 0
+    for idx, char in enumerate(text):
+        used += max(wcwidth.wcwidth(char), 0)
+        if used > width:
+            return text[:idx]
+    return text
+
+
+def _truncate_line(line: str, width: int) -> str:
+    """Cut *line* to *width* display cells, marking the cut with an ellipsis."""
+    line = _fit_prefix(strip_ansi(line), width - 1 if width > 1 else width)
+    return line + _ELLIPSIS if width > 1 else line
+
+
+def _end_line(lines: list, parts: list) -> None:
+    """Append the joined *parts* to *lines* unless they are blank."""
+    text = "".join(parts)
+    if text.strip(" "):
+        lines.append(text)
+
+
+def _wrap_cells(line: str, width: int) -> list:
+    """Greedy word wrap counting display cells, like :func:`textwrap.wrap`.
+
+    Words are split like textwrap does (whitespace, hyphens); a word wider
+    than *width* fills the rest of the current line, then is cut. Blanks
+    starting a line are dropped, except at the start of the paragraph.
+    """
+    lines = []
+    current = []
+    used = 0
+    for chunk in _WORD_SEP.split(line):
+        size = line_width(chunk)
+        if size <= width < used + size:
+            _end_line(lines, current)
+            current, used = [], 0
+        while used + size > width:
+            head = _fit_prefix(chunk, width - used) or ("" if current else chunk[0])
+            _end_line(lines, current + [head])
+            current, used = [], 0
+            chunk = chunk[len(head) :]
+            size = line_width(chunk)
+        if chunk and (current or not lines or not chunk.isspace()):
+            current.append(chunk)
+            used += size
+    _end_line(lines, current)
+    return lines
+
+
+def wrap_line(line: str, width: int) -> list:
+    """Wrap one line on display cells, dropping blank lines and trailing blanks.
+
+    Plain printable ASCII goes through the faster stdlib wrapper.
+    """
+    if line.isascii() and line.isprintable():
+        parts = textwrap.wrap(line, width)
+    else:
+        parts = _wrap_cells(line, width)
+    return [part.rstrip(" ") for part in parts if part.strip(" ")] or [""]
+
+
+def _cell_lines(text: str, width: int, overflow: str) -> list:
+    """Split one cell into display lines no wider than *width*."""
+    lines = []
+    for line in text.split("\n"):
+        if line_width(line) <= width:
+            lines.append(line)
+        elif overflow == "truncate":
+            lines.append(_truncate_line(line, width))
+        else:
+            lines.extend(wrap_line(line, width))
+    return lines
+
+
+def hrule(widths, style: TableStyle) -> str:
+    """Horizontal border line for the given column widths."""
+    bits = [style.junction]
+    for width in widths:
+        bits.append(style.horizontal * (width + 2))
+        bits.append(style.junction)
+    return "".join(bits)
+
+
+def header_line(headers, widths, style: TableStyle) -> str:
+    """Header row; names wider than their column are cut like PrettyTable."""
+    bits = [style.vertical]
+    for header, width in zip(headers, widths):
+        if text_width(header) > width:
+            header = header[:width]
+        bits.append(" " + ljust(header, width) + " " + style.vertical)
+    return "".join(bits)
+
+
+def row_block(row, widths, style: TableStyle, overflow=DEFAULT_STREAM_OVERFLOW) -> str:
+    """Render one formatted row, possibly spanning several display lines."""
+    cells = [_cell_lines(text, width, overflow) for text, width in zip(row, widths)]
+    height = max((len(lines) for lines in cells), default=1)
+    out = []
+    for y in range(height):
+        bits = [style.vertical]
+        for lines, width in zip(cells, widths):
+            line = lines[y] if y < len(lines) else ""
+            bits.append(" " + ljust(line, width) + " " + style.vertical)
+        out.append("".join(bits))
+    return "\n".join(out)
+
+
+# pylint: disable-next=too-many-arguments,too-many-positional-arguments,too-many-locals
+def _multiline_block(pieces, lines, row, widths, vertical, overflow) -> str:
+    """Finish a row whose cell number ``len(pieces)`` spans several *lines*.
+
+    *pieces* are the padded single-line cells before it; their lines below
+    the first one are blank.
+    """
+    done = len(pieces)
+    cells = [lines] + [
+        _cell_lines(text, width, overflow)
+        for text, width in zip(row[done + 1 :], widths[done + 1 :])
+    ]
+    height = max(len(cell) for cell in cells)
+    blanks = "".join(" " * (width + 2) + vertical for width in widths[:done])
+    out = []
+    for y in range(height):
+        bits = [vertical, "".join(pieces) if y == 0 else blanks]
+        for cell, width in zip(cells, widths[done:]):
+            line = cell[y] if y < len(cell) else ""
+            bits.append(" " + ljust(line, width) + " " + vertical)
+        out.append("".join(bits))
+    return "\n".join(out)
+
+
+def _iter_row_blocks(rows, widths, style: TableStyle, overflow):
+    """Render formatted rows like :func:`row_block`, reusing padded cells.
+
+    Single-line cells are padded once per distinct text and column (up to
+    ``DEFAULT_CELL_CACHE_SIZE`` texts per column).
+    """
+    vertical = style.vertical
+    columns = [({}, width) for width in widths]
+    for row in rows:
+        pieces = []
+        for (padded, width), text in zip(columns, row):
+            piece = padded.get(text)
+            if piece is None:
+                lines = _cell_lines(text, width, overflow)
+                if len(lines) > 1:
+                    yield _multiline_block(
+                        pieces, lines, row, widths, vertical, overflow
+                    )
+                    break
+                piece = " " + ljust(lines[0], width) + " " + vertical
+                if len(padded) < DEFAULT_CELL_CACHE_SIZE:
+                    padded[text] = piece
+            pieces.append(piece)
+        else:
+            yield vertical + "".join(pieces)
+
+
+def iter_table_lines(
+    headers, rows, widths, style: TableStyle, overflow=DEFAULT_STREAM_OVERFLOW
+):
+    """Yield table text line blocks; joined with newlines they form the table.
+
+    *rows* must already be formatted (see :func:`format_row`) and may be a
+    lazy iterator. The final border carries the style suffix.
+    """
+    if overflow not in STREAM_OVERFLOW_MODES:
+        raise ValueError(
+            f"overflow must be one of {sorted(STREAM_OVERFLOW_MODES)}, got {overflow!r}"
+        )
+    rule = hrule(widths, style)
+    yield rule
+    yield header_line(headers, widths, style)
+    yield rule
+    yield from _iter_row_blocks(rows, widths, style, overflow)
+    yield rule + style.suffix
@@ -1,117 +1,139 @@
 """
-Table view classes for pretty-printing data structures.
+Table formatter classes: turn payloads into rows and render them.
+
+Rows are rendered with PrettyTable or the native line renderer
+(:mod:`clak.views.table_engine`). Sorting and the row window live in
+:mod:`clak.views.table_sort`, structured records (json, yaml, csv) in
+:mod:`clak.views.table_records` and width fitting in
+:mod:`clak.views.table_width`.
 
 Classes:
     _TableFormatter: Abstract base class for table views
-        Provides common functionality for rendering data in tabular format.
-        
+        Processes, sorts and windows rows, then renders them.
+
     TableShowFormatter: Table view for single data items
         Renders individual dictionaries or sequences as tables.
-        
-    TableListFormatter: Table view for lists of data items 
-        Renders collections of dictionaries or sequences as tables.
+
+    TableListFormatter: Table view for lists of data items
+        Renders collections of dictionaries or sequences (or streams and
+        columnar payloads) as tables.
 """
 
-import csv
-import io
-import json
+import os
 from abc import ABC, abstractmethod
 from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field, replace
+from itertools import chain, count, islice
+from typing import Optional
+
+from prettytable import PrettyTable
 
 from clak.common import replace_tabs
-from clak.exception import ClakUserError
 from clak.runtime.settings import ClakSettings
-from clak.views.base import DEFAULT_WIDTH_MODE, strip_ansi
-
-SORT_MODES = frozenset({"asc", "desc"})
-_YAML_INSTALL_HINT = "pip install 'mrjk.clak[config]'"
-
-
-def require_yaml():
-    """Import PyYAML or raise ClakUserError with the config extra hint."""
-    try:
-        import yaml  # pylint: disable=import-outside-toplevel
-    except ImportError as err:
-        raise ClakUserError(
-            "YAML output requires the PyYAML package",
-            advice=f"Install with: {_YAML_INSTALL_HINT}",
-        ) from err
-    return yaml
+from clak.views.base import DEFAULT_WIDTH_MODE, is_stream_payload, output_stream
+from clak.views.sink import current_sink
+from clak.views.table_cells import cached_widths, cell_caches, format_cached_row
+from clak.views.table_columnar import (
+    Columns,
+    as_columns,
+    column_width,
+    sort_order,
+    take_rows,
+)
+from clak.views.table_engine import (
+    DEFAULT_STREAM_OVERFLOW,
+    DEFAULT_STREAM_SAMPLE,
+    TableStyle,
+    iter_table_lines,
+    text_width,
+)
+from clak.views.table_records import iter_structured
+from clak.views.table_sort import (
+    RowSort,
+    RowWindow,
+    external_sort,
+    resolve_column_index,
+    sort_rows,
+)
+from clak.views.table_width import apply_prettytable_width, fit_table_widths
+
+TABLE_BACKENDS = frozenset({"native", "prettytable"})
+DEFAULT_TABLE_BACKEND = "prettytable"
+CLAK_TABLE_BACKEND_ENV = "CLAK_TABLE_BACKEND"
+# View options consumed by render_rows, not by row processing
+RENDER_OPTION_KEYS = (
+    "width",
+    "wrap",
+    "wrap_min",
+    "term_width",
+    "stdout_tty",
+    "ndjson_batch",
+    "table_backend",
+    "clak_colors",
+)
 
 
 # pylint: disable=invalid-name
 table_kwargs = {}
 if not ClakSettings.current().colors:
-    from prettytable import PrettyTable
-
     table_cls = PrettyTable
 else:
     try:
         # Colortable use colorama to colorize text, but the latest patches
         # the stderr/out python commands, and thus add a reset shell code
         # after each line, and thus break regression tests on CLI output.
+        # pylint: disable-next=ungrouped-imports
         from prettytable.colortable import ColorTable, Themes
 
         table_cls = ColorTable
         table_kwargs = {"theme": Themes.GLARE_REDUCTION}
     except ImportError:
-        from prettytable import PrettyTable
-
         table_cls = PrettyTable
 
 
-################## Parent class
+_TABLE_STYLE = None
+_PLAIN_TABLE_STYLE = TableStyle()
 
 
-def normalize_sort_mode(mode, default="asc"):
-    """Return True when sort order is descending."""
-    if mode is None:
-        mode = default
-    if not isinstance(mode, str):
-        raise TypeError(f"sort_mode must be a string, got {type(mode).__name__}")
-    mode = mode.lower()
-    if mode not in SORT_MODES:
-        raise ValueError(f"sort_mode must be one of {sorted(SORT_MODES)}, got {mode!r}")
-    return mode == "desc"
+def new_table(clak_colors=None):
+    """Empty PrettyTable/ColorTable; plain PrettyTable when *clak_colors* is False."""
+    if clak_colors is False:
+        return PrettyTable()
+    return table_cls(**table_kwargs)
 
 
-def resolve_column_index(col, headers):
-    """Resolve a column spec to a 0-based index in *headers*.
+def table_style(clak_colors=None):
+    """Border style of the configured PrettyTable/ColorTable class (cached).
 
-    - str: header name
-    - int < 0: index from end (-1 = last column)
-    - int > 0: 1-based index (1 = first column)
-    - int == 0: rejected
+    *clak_colors* False returns plain borders (files, ``--output``).
     """
-    if isinstance(col, str):
-        try:
-            return headers.index(col)
-        except ValueError as err:
-            choices = ", ".join(str(header) for header in headers)
-            raise KeyError(
-                f"Column {col!r} not found in headers, choices: {choices}"
-            ) from err
-
-    if isinstance(col, int):
-        if col == 0:
-            raise KeyError(
-                "Column index 0 is invalid; use 1 for first column or -1 for last"
-            )
-        if col < 0:
-            idx = len(headers) + col
-        else:
-            idx = col - 1
-        if idx < 0 or idx >= len(headers):
-            choices = ", ".join(str(header) for header in headers)
-            raise KeyError(f"Column index {col} out of range, choices: {choices}")
-        return idx
+    # pylint: disable=global-statement
+    global _TABLE_STYLE
+    if clak_colors is False:
+        return _PLAIN_TABLE_STYLE
+    if _TABLE_STYLE is None:
+        _TABLE_STYLE = TableStyle.from_table(new_table())
+    return _TABLE_STYLE
+
 
-    raise TypeError(f"Column must be a string or int, got {type(col).__name__}")
+def resolve_table_backend(value=None):
+    """Resolve ``native`` / ``prettytable``.
 
+    Explicit *value* wins; otherwise ``CLAK_TABLE_BACKEND``; unset is prettytable.
+    """
+    if value is None:
+        value = os.environ.get(CLAK_TABLE_BACKEND_ENV) or DEFAULT_TABLE_BACKEND
+    if not isinstance(value, str):
+        raise TypeError(f"table_backend must be a string, got {type(value).__name__}")
+    backend = value.strip().lower()
+    if backend not in TABLE_BACKENDS:
+        raise ValueError(
+            f"table_backend must be one of {sorted(TABLE_BACKENDS)}, got {value!r}"
+        )
+    return backend
 
-def resolve_sort_column_index(col, headers):
-    """Alias for :func:`resolve_column_index` (sort uses the same rules)."""
-    return resolve_column_index(col, headers)
+
+################## Parent class
 
 
 def resolve_column_keys(columns, headers, *, strict_names=True):
@@ -136,258 +158,209 @@ def resolve_column_keys(columns, headers, *, strict_names=True):
     return resolved
 
 
-def _cell_sort_key(value):
-    """Sort key: numbers before strings; digit strings compare as ints."""
-    if isinstance(value, bool):
-        return (2, str(value))
-    if isinstance(value, (int, float)):
-        return (0, value)
-    text = "" if value is None else str(value)
-    if text.isdigit() or (text.startswith("-") and text[1:].isdigit()):
-        return (0, int(text))
-    return (1, text.lower())
+def more_rows_marker(remaining=None):
+    """Trailing note for rows cut by ``limit`` (*remaining* None: unknown)."""
+    if remaining is None:
+        return "... more rows"
+    return f"... {remaining} more row" + ("" if remaining == 1 else "s")
 
 
-def sort_table_rows(rows, headers, sort_columns, sort_mode="asc"):
-    """Sort tabular rows by one or more header names or indexes."""
-    if not sort_columns or not rows:
-        return rows
+def render_native_table(rows, headers, clak_colors=None, **width_options):
+    """Render rows as a table string without PrettyTable.
 
-    reverse = normalize_sort_mode(sort_mode)
-    indexes = [resolve_sort_column_index(col, headers) for col in sort_columns]
+    Cells are stringified and measured once per distinct value and column
+    (see :mod:`clak.views.table_cells`), widths are fitted with
+    :func:`fit_table_widths`, and the lines are joined once.
+    """
+    headers = [str(header) for header in headers]
+    caches = cell_caches(len(headers))
+    formatted = [format_cached_row(row, caches) for row in rows]
+    widths = fit_table_widths(
+        headers,
+        cached_widths(headers, caches),
+        has_rows=bool(formatted),
+        **width_options,
+    )
+    style = table_style(clak_colors)
+    return "\n".join(iter_table_lines(headers, formatted, widths, style))
+
+
+def iter_table_view(
+    rows,
+    headers,
+    *,
+    sample=DEFAULT_STREAM_SAMPLE,
+    overflow=DEFAULT_STREAM_OVERFLOW,
+    clak_colors=None,
+    **width_options,
+):
+    """Yield a table for lazy *rows*, sized from the first *sample* rows.
 
-    def key_fn(row):
-        return [_cell_sort_key(row[idx] if idx < len(row) else "") for idx in indexes]
+    Rows past the sample that do not fit their column are wrapped or
+    truncated according to *overflow*.
+    """
+    if sample is None:
+        sample = DEFAULT_STREAM_SAMPLE
+    if isinstance(sample, bool) or not isinstance(sample, int) or sample <= 0:
+        raise ValueError(f"stream sample must be a positive int, got {sample!r}")
+    headers = [str(header) for header in headers]
+    rows = iter(rows)
+    caches = cell_caches(len(headers))
+    head = [format_cached_row(row, caches) for row in islice(rows, sample)]
+    widths = fit_table_widths(
+        headers,
+        cached_widths(headers, caches),
+        has_rows=bool(head),
+        **width_options,
+    )
+    lines = iter_table_lines(
+        headers,
+        chain(head, (format_cached_row(row, caches, False) for row in rows)),
+        widths,
+        table_style(clak_colors),
+        overflow or DEFAULT_STREAM_OVERFLOW,
+    )
+    first = True
+    for line in lines:
+        yield line if first else "\n" + line
+        first = False
 
-    return sorted(rows, key=key_fn, reverse=reverse)
 
+def render_table(rows, headers, table_backend=None, clak_colors=None, **width_options):
+    """Render rows as a table string with the PrettyTable or native backend.
 
-def default_sort_columns(headers):
-    """Default: sort by the first displayed column, ascending."""
-    if not headers:
-        return None
-    return [1]
+    *width_options* are ``width``, ``wrap``, ``wrap_min``, ``term_width``
+    and ``stdout_tty`` (see :func:`fit_table_widths`).
+    """
+    if width_options.get("width") is None:
+        width_options["width"] = DEFAULT_WIDTH_MODE
+    if width_options.get("wrap") is None:
+        width_options["wrap"] = "last"
+    if resolve_table_backend(table_backend) == "native":
+        return render_native_table(
+            rows, headers, clak_colors=clak_colors, **width_options
+        )
 
+    # Prepare table
+    # table = ColorTable(theme=Themes.GLARE_REDUCTION)
+    # table = ColorTable(theme=Themes.PASTEL)
+    # table = PrettyTable()
+    table = new_table(clak_colors)
+    table.field_names = headers
+    table.align = "l"
+    for line in rows:
+        table.add_row(line)
+    apply_prettytable_width(table, **width_options)
+    return table.get_string()
+
+
+@dataclass(slots=True)
+class _RowOutput:
+    """How prepared rows are written: format, render and stream options."""
+
+    fmt: str = "view"
+    render_options: dict = field(default_factory=dict)
+    sample: Optional[int] = None
+    overflow: Optional[str] = None
+
+    @classmethod
+    def pop_from(cls, options):
+        """Pop the output settings from view *options*."""
+        return cls(
+            fmt=options.pop("format", "view") or "view",
+            render_options={key: options.pop(key, None) for key in RENDER_OPTION_KEYS},
+            sample=options.pop("stream_sample", None),
+            overflow=options.pop("stream_overflow", None),
+        )
 
-def format_structured(rows, headers, fmt):
-    """Render tabular rows as yaml, json, or csv."""
-    # Late import: OUTPUT_FORMATS lives in clak.views.base (avoids circular import)
-    from clak.views.base import (  # pylint: disable=import-outside-toplevel
-        OUTPUT_FORMATS,
-    )
+    def render(self, rows, headers, remaining=0):
+        """Prepared *rows* as one text, see :meth:`_TableFormatter.render_rows`."""
+        return _TableFormatter.render_rows(
+            rows, headers, remaining, fmt=self.fmt, **self.render_options
+        )
 
-    if fmt not in OUTPUT_FORMATS - {"view"}:
-        raise ValueError(
-            f"Unsupported format {fmt!r}, choose one of: {sorted(OUTPUT_FORMATS)}"
+    def stream(self, rows, headers):
+        """Chunks for lazy *rows*: structured records, or a sample-sized table."""
+        options = dict(self.render_options)
+        ndjson_batch = options.pop("ndjson_batch", None)
+        options.pop("table_backend", None)
+        if self.fmt != "view":
+            return iter_structured(rows, headers, self.fmt, ndjson_batch=ndjson_batch)
+        return iter_table_view(
+            rows, headers, sample=self.sample, overflow=self.overflow, **options
         )
 
-    if fmt == "json":
-        records = [dict(zip(headers, row)) for row in rows]
-        return json.dumps(records, indent=2, default=str) + "\n"
 
-    if fmt == "yaml":
-        yaml = require_yaml()
-        records = [dict(zip(headers, row)) for row in rows]
-        return yaml.safe_dump(records, sort_keys=False, default_flow_style=False)
+def _pop_row_sort(options):
+    """Pop the sort settings from view *options* as a :class:`RowSort`."""
+    return RowSort(
+        options.pop("sort_columns", None),
+        options.pop("sort_mode", None),
+        presorted=bool(options.pop("presorted", False)),
+        buffer=options.pop("sort_buffer", None),
+    )
 
-    if fmt == "csv":
-        buf = io.StringIO()
-        writer = csv.writer(buf)
-        writer.writerow(headers)
-        writer.writerows(rows)
-        return buf.getvalue()
 
-    raise ValueError(f"Unsupported format {fmt!r}")
+def _pop_row_window(options):
+    """Pop ``offset`` / ``limit`` from view *options* as a :class:`RowWindow`."""
+    return RowWindow.of(options.pop("offset", None), options.pop("limit", None))
 
 
-def _apply_prettytable_width(  # pylint: disable=too-many-arguments,too-many-positional-arguments
-    table,
-    width=DEFAULT_WIDTH_MODE,
-    term_width=None,
-    stdout_tty=None,
-    wrap="last",
-    wrap_min=None,
-):
-    """Apply content/fit/terminal width modes to a PrettyTable instance."""
-    # Late import avoids circular dependency with clak.views.table
-    from clak.views.base import (  # pylint: disable=import-outside-toplevel
-        DEFAULT_WRAP_MODE,
-        resolve_view_width,
-    )
-    from clak.views.table import (  # pylint: disable=import-outside-toplevel
-        normalize_wrap,
-        normalize_wrap_min,
-    )
+def _iter_more_marker(chunks, items, window):
+    """Yield table chunks, then the marker if *window* cut the *items* stream."""
+    yield from chunks
+    if window.has_more(items):
+        yield "\n" + more_rows_marker()
 
-    mode, term_budget = resolve_view_width(
-        width=width, term_width=term_width, stdout_tty=stdout_tty
-    )
-    if mode == "content" or term_budget is None:
-        return
-
-    wrap_spec = normalize_wrap(wrap if wrap is not None else DEFAULT_WRAP_MODE)
-    if wrap_spec is None:
-        wrap_spec = DEFAULT_WRAP_MODE
-    wrap_min = normalize_wrap_min(wrap_min)
-
-    if isinstance(wrap_spec, str) and wrap_spec == "all":
-        if mode == "fit":
-            table.max_table_width = term_budget
-        elif mode == "terminal":
-            table.min_table_width = term_budget
-            table.max_table_width = term_budget
-        return
-
-    wrap_fields = _resolve_wrap_fields(wrap_spec, list(table.field_names))
-    _apply_column_wrap(
-        table,
-        mode=mode,
-        term_width=term_budget,
-        wrap_fields=wrap_fields,
-        wrap_min=wrap_min,
-    )
 
+def _iter_sorted_stream(rows, headers, sort, window, output):
+    """Sort streamed rows without holding more than needed in memory.
 
-def _resolve_wrap_fields(wrap_spec, headers):
-    """Resolve wrap keyword or column specs to displayed header names."""
-    if not headers:
-        return []
-    if isinstance(wrap_spec, str):
-        key = wrap_spec.lower()
-        if key == "last":
-            return [headers[-1]]
-        if key == "first":
-            return [headers[0]]
-        raise ValueError(
-            f"wrap must be last, first, all, or column specs, got {wrap_spec!r}"
-        )
+    With a ``limit``, only the first ``offset + limit`` rows are kept
+    (heap). Otherwise rows are sorted in memory up to ``sort.buffer``
+    rows; larger streams spill sorted runs to disk and the merged rows
+    are rendered lazily, like an unsorted stream. Rows carry the
+    ``sort.hidden`` sort-only cells after the *headers* ones until
+    rendered by *output*.
+    """
 
-    fields = []
-    seen = set()
-    for col in wrap_spec:
-        field = headers[resolve_column_index(col, headers)]
-        if field in seen:
-            continue
-        seen.add(field)
-        fields.append(field)
-    return fields
-
-
-def _resolve_wrap_min_map(wrap_min, headers):
-    """Resolve wrap_min to a field-name map, or a global int, or None."""
-    if wrap_min is None or isinstance(wrap_min, int):
-        return wrap_min
-    resolved = {}
-    for key, val in wrap_min.items():
-        field = headers[resolve_column_index(key, headers)]
-        resolved[field] = val
-    return resolved
+    first = list(islice(rows, 1))
+    if not first:
+        return iter((output.render([], headers),))
 
+    rows = chain(first, rows)
+    key_fn = sort.key(headers)
+    shown = len(headers)
 
-def _wrap_column_floor(field, natural_width, wrap_min):
-    """Sequential-shrink floor: max(header, wrap_min, 1), capped at natural."""
-    header_len = len(str(field))
-    requested = None
-    if isinstance(wrap_min, int):
-        requested = wrap_min
-    elif isinstance(wrap_min, Mapping):
-        requested = wrap_min.get(field)
-    floor = max(header_len, requested if requested is not None else 0, 1)
-    return min(floor, natural_width)
-
-
-def _shrink_wrap_widths(widths, wrap_fields, wrap_min, overflow):
-    """Shrink wrap columns in order down to floor, then dump leftover."""
-    if overflow <= 0:
-        return
-    for field in wrap_fields:
-        if overflow <= 0:
-            break
-        floor = _wrap_column_floor(field, widths[field], wrap_min)
-        reducible = widths[field] - floor
-        if reducible <= 0:
-            continue
-        take = min(overflow, reducible)
-        widths[field] -= take
-        overflow -= take
-    if overflow > 0:
-        last = wrap_fields[-1]
-        widths[last] = max(1, widths[last] - overflow)
-
-
-def _pin_column_widths(field_names, natural_widths, widths, wrap_fields):
-    """Build PrettyTable min/max maps: wrap cols use computed width, others frozen."""
-    wrap_set = set(wrap_fields)
-    min_width = {}
-    max_width = {}
-    for field, col_width in zip(field_names, natural_widths):
-        pinned = widths[field] if field in wrap_set else col_width
-        min_width[field] = pinned
-        max_width[field] = pinned
-    return min_width, max_width
-
-
-def _apply_column_wrap(
-    table, mode, term_width, wrap_fields, wrap_min
-):  # pylint: disable=too-many-locals
-    """Fit table by shrinking wrap columns in order, then dumping leftover."""
-    if not table.field_names or not wrap_fields:
-        return
-
-    measured = table.get_string()
-    natural_widths = list(table._widths)  # pylint: disable=protected-access
-    if not natural_widths:
-        return
-
-    plain = strip_ansi(measured)
-    border_line = plain.splitlines()[0] if plain else ""
-    natural_border = len(border_line)
-
-    if mode == "fit" and natural_border <= term_width:
-        return
-
-    widths = dict(zip(table.field_names, natural_widths))
-    min_map = _resolve_wrap_min_map(wrap_min, list(table.field_names))
-    _shrink_wrap_widths(widths, wrap_fields, min_map, natural_border - term_width)
-    min_width, max_width = _pin_column_widths(
-        table.field_names, natural_widths, widths, wrap_fields
-    )
+    def visible(rows):
+        return (row[:shown] for row in rows) if sort.hidden else rows
 
-    if mode == "terminal":
-        decorations = natural_border - sum(natural_widths)
-        current = decorations + sum(widths[field] for field in table.field_names)
-        pad = term_width - current
-        if pad > 0:
-            first = wrap_fields[0]
-            widths[first] += pad
-            min_width[first] = widths[first]
-            max_width[first] = widths[first]
-
-    # PrettyTable 3.x min_width/max_width setters take a single int;
-    # per-column dicts go on the private maps. Table-level min/max stay on
-    # wrap=all only; pins already encode the budget here.
-    table._min_width = min_width  # pylint: disable=protected-access
-    table._max_width = max_width  # pylint: disable=protected-access
-
-    if mode != "terminal":
-        return
-
-    rendered = strip_ansi(table.get_string())
-    border_line = rendered.splitlines()[0] if rendered else ""
-    delta = term_width - len(border_line)
-    if delta <= 0:
-        return
-    first = wrap_fields[0]
-    widths[first] += delta
-    min_width[first] = widths[first]
-    max_width[first] = widths[first]
-    table._min_width = min_width  # pylint: disable=protected-access
-    table._max_width = max_width  # pylint: disable=protected-access
+    if window.limit is not None:
+        counter = count()
+        top = sort_rows(
+            (row for row, _ in zip(rows, counter)),
+            key_fn,
+            reverse=sort.reverse,
+            limit=window.stop,
+        )
+        selected = list(visible(window.take(top)))
+        remaining = window.remaining(next(counter), len(selected))
+        return iter((output.render(selected, headers, remaining),))
+
+    ordered = external_sort(rows, key_fn, reverse=sort.reverse, buffer_rows=sort.buffer)
+    if isinstance(ordered, list):
+        return iter((output.render(list(visible(window.take(ordered))), headers),))
+    return output.stream(visible(window.iter_take(ordered)), headers)
 
 
 class _TableFormatter(ABC):
     "Table view"
 
+    # Whether render() accepts one-shot iterables (see iter_render)
+    accepts_streams = False
+    # Whether render() accepts column-oriented payloads (see Columns)
+    accepts_columns = False
+
     view_options = {
         "columns": None,
         "format": "view",
@@ -396,6 +369,8 @@ class _TableFormatter(ABC):
         "width": DEFAULT_WIDTH_MODE,
         "wrap": "last",
         "wrap_min": None,
+        "table_backend": None,
+        "presorted": False,
     }
 
     def __init__(self, data=None, columns=None, **view_options):
@@ -411,68 +386,113 @@ class _TableFormatter(ABC):
     def render(self, data, stdout=False, **kwargs):
         "Render data, return or print"
 
-        if not isinstance(data, (list, dict)):
+        columnar = as_columns(data) if self.accepts_columns else None
+        if columnar is not None:
+            data = columnar
+        elif self.accepts_streams and is_stream_payload(data):
+            chunks = self.iter_render(data, **kwargs)
+            return output_stream(chunks, source=data, stdout=stdout)
+
+        elif not isinstance(data, (list, dict)):
             raise ValueError(
                 f"Data must be a list or dict, got {type(data).__name__}: {data}"
             )
 
         out = self.table_render_show(data, **kwargs)
         if stdout:
-            print(out)
+            current_sink().write_chunks((out,))
         return out
 
-    def table_render_show(
-        self, data, **view_options
-    ):  # pylint: disable=too-many-locals
-        "Create a PrettyTable instance, configure it and print it"
+    def iter_render(self, data, **view_options):
+        "Render *data* as an iterator of text chunks (one chunk unless overridden)"
+        return iter((self.table_render_show(data, **view_options),))
+
+    def table_render_show(self, data, **view_options):
+        "Process, sort and render data as a table (or a structured format)"
 
         _view_options = dict(self.view_options)
         _view_options.update(view_options)
 
-        fmt = _view_options.pop("format", "view") or "view"
-        sort_columns = _view_options.pop("sort_columns", None)
-        sort_mode = _view_options.pop("sort_mode", "asc") or "asc"
-        width = _view_options.pop("width", DEFAULT_WIDTH_MODE)
-        wrap = _view_options.pop("wrap", "last")
-        wrap_min = _view_options.pop("wrap_min", None)
-        term_width = _view_options.pop("term_width", None)
-        stdout_tty = _view_options.pop("stdout_tty", None)
+        output = _RowOutput.pop_from(_view_options)
+        sort = _pop_row_sort(_view_options)
+        window = _pop_row_window(_view_options)
+        data_table, headers, remaining = self.prepare_rows(
+            data, sort, window, **_view_options
+        )
+        return output.render(data_table, headers, remaining)
 
-        data_table, headers = self.process_table(data, **_view_options)
-        self.validate_table_data(data_table)
+    @staticmethod
+    def render_rows(
+        rows, headers, remaining=0, *, fmt="view", ndjson_batch=None, **table_options
+    ):
+        """Render prepared rows; a view table ends with a "more rows" marker.
 
-        if not sort_columns and headers:
-            sort_columns = default_sort_columns(headers)
+        *remaining* counts rows cut by ``limit`` (None when unknown).
+        *table_options* go to :func:`render_table`; ``clak_colors`` False
+        renders plain borders whatever ``CLAK_COLORS``.
+        """
 
-        if sort_columns:
-            data_table = sort_table_rows(
-                data_table, headers, sort_columns, sort_mode=sort_mode
+        if fmt != "view":
+            return "".join(
+                iter_structured(rows, headers, fmt, ndjson_batch=ndjson_batch)
             )
 
-        if fmt != "view":
-            return format_structured(data_table, headers, fmt)
-
-        # Prepare table
-        # table = ColorTable(theme=Themes.GLARE_REDUCTION)
-        # table = ColorTable(theme=Themes.PASTEL)
-        # table = PrettyTable()
-        table = table_cls(**table_kwargs)
-        table.field_names = headers
-        table.align = "l"
-        for line in data_table:
-            table.add_row(line)
-
-        _apply_prettytable_width(
-            table,
-            width=width,
-            term_width=term_width,
-            stdout_tty=stdout_tty,
-            wrap=wrap,
-            wrap_min=wrap_min,
-        )
+        rendered = render_table(rows, headers, **table_options)
 
         # Report output
-        return table.get_string()
+        if remaining or remaining is None:
+            rendered += "\n" + more_rows_marker(remaining)
+        return rendered
+
+    def prepare_rows(self, data, sort=RowSort(), window=RowWindow(), **process_options):
+        """Process, validate, sort and window rows before any stringification.
+
+        Returns ``(rows, headers, remaining)``; *remaining* counts rows cut
+        after the :class:`RowWindow`. With a ``limit`` only the window's
+        rows are selected (heap), not the whole table sorted. The
+        ``sort.hidden`` columns are the last processed ones, extracted to
+        sort on and dropped from the returned rows.
+        """
+
+        data_table, headers = self.process_table(data, **process_options)
+        self.validate_table_data(data_table)
+        total = len(data_table)
+        if sort.hidden:
+            headers = headers[: len(headers) - len(sort.hidden)]
+
+        data_table = sort.apply(data_table, headers, limit=window.stop)
+        remaining = 0
+        if window.active:
+            data_table = window.take(data_table)
+            remaining = window.remaining(total, len(data_table))
+        if sort.hidden:
+            shown = len(headers)
+            data_table = [row[:shown] for row in data_table]
+        return data_table, headers, remaining
+
+    def natural_width(self, data, **view_options):
+        """Outer border width of the table at content width, without rendering.
+
+        Rows are processed and measured only; sorting (unless a ``limit`` /
+        ``offset`` window needs it) and width fitting do not change the
+        natural column widths.
+        """
+
+        _view_options = dict(self.view_options)
+        _view_options.update(view_options)
+        sort = _pop_row_sort(_view_options)
+        window = _pop_row_window(_view_options)
+        if not window.active:
+            # Row order does not change the natural widths
+            sort = RowSort(presorted=True)
+        data_table, headers, _ = self.prepare_rows(data, sort, window, **_view_options)
+
+        headers = [str(header) for header in headers]
+        caches = cell_caches(len(headers))
+        for row in data_table:
+            format_cached_row(row, caches)
+        widths = cached_widths(headers, caches)
+        return sum(widths) + 3 * len(widths) + 1
 
     def validate_table_data(self, data):
         "Validate table data of raise exception"
@@ -480,18 +500,18 @@ class _TableFormatter(ABC):
         if not isinstance(data, Sequence):
             raise ValueError(f"Data must be a list of lists, got {type(data)}")
 
-        count = None
+        expected = None
         for idx, line in enumerate(data):
 
             if not isinstance(line, Sequence):
                 raise ValueError(f"Line {idx} must be a list, got {type(line)}")
 
-            if count is None:
-                count = len(line)
-            elif count != len(line):
+            if expected is None:
+                expected = len(line)
+            elif expected != len(line):
                 raise ValueError(
                     f"All lines must have the same number of columns, "
-                    f"got {count} vs current line {idx}: {len(line)}"
+                    f"got {expected} vs current line {idx}: {len(line)}"
                 )
 
     @abstractmethod
@@ -516,6 +536,8 @@ class TableShowFormatter(_TableFormatter):
         "width": DEFAULT_WIDTH_MODE,
         "wrap": "last",
         "wrap_min": None,
+        "table_backend": None,
+        "presorted": False,
     }
 
     def process_table(self, data, columns=None, add_index=True, remove_tabs=True, **_):
@@ -563,9 +585,88 @@ class TableShowFormatter(_TableFormatter):
         return ret, columns
 
 
+_KEY_VALUE_HEADERS = ["Key", "Value"]
+
+
+def _key_value_rows(data, remove_tabs=True):
+    "Rows of a list payload that is not expanded: ``[key, value]`` pairs"
+    if isinstance(data, Mapping):
+        return ([idx, value] for idx, value in data.items())
+    if isinstance(data, Sequence) or is_stream_payload(data):
+        if remove_tabs is not False:
+            return (
+                [idx, replace_tabs(value, remove_tabs)]
+                for idx, value in enumerate(data)
+            )
+        return ([idx, value] for idx, value in enumerate(data))
+    raise ValueError(f"Data must be a list of dictionaries or lists, got {type(data)}")
+
+
+def _indexed_items(data):
+    "``(key, item)`` pairs of a list payload, dict values made row mappings"
+    if isinstance(data, Mapping):
+        return (
+            (idx, _explode_mapping_value(idx, value)) for idx, value in data.items()
+        )
+    if isinstance(data, Sequence) or is_stream_payload(data):
+        return enumerate(data)
+    raise ValueError(f"Data must be a list of dictionaries or lists, got {type(data)}")
+
+
+def _item_columns(item, columns, remove_tabs=True):
+    "Resolve *columns* against the fields of the first *item*"
+    if isinstance(item, Mapping):
+        available = list(item.keys())
+    else:
+        if isinstance(item, str) and remove_tabs is not False:
+            item = replace_tabs(item, remove_tabs)
+        available = list(range(0, len(item)))
+    if columns is None:
+        return available
+    return resolve_column_keys(columns, available, strict_names=False)
+
+
+def _explode_mapping_value(idx, value):
+    "Turn a dict payload value into a row mapping"
+    if isinstance(value, Mapping):
+        return value
+    if hasattr(value, "__dict__"):
+        # Automatically explode object with __dict__ method
+        return value.__dict__
+    return {
+        "Key": idx,
+        "Value": value,
+    }
+
+
+def _expanded_row(idx, item, columns, add_index, remove_tabs):
+    "Build one table row from an item and resolved columns"
+    tabs = remove_tabs is not False
+    if isinstance(item, Mapping):
+        get = item.get
+        cells = [get(key, "-") for key in columns]
+    else:
+        if tabs and isinstance(item, str):
+            # Tabs are replaced in the whole string, before indexing
+            item = replace_tabs(item, remove_tabs)
+            tabs = False
+        cells = []
+        for key in columns:
+            try:
+                cells.append(item[key])
+            except (IndexError, KeyError, TypeError):
+                cells.append("-")
+    if tabs:
+        cells = [replace_tabs(value, remove_tabs) for value in cells]
+    return [idx] + cells if add_index else cells
+
+
 class TableListFormatter(_TableFormatter):
     "Table list items"
 
+    accepts_streams = True
+    accepts_columns = True
+
     view_options = {
         "add_index": None,
         "columns": None,
@@ -577,98 +678,186 @@ class TableListFormatter(_TableFormatter):
         "width": DEFAULT_WIDTH_MODE,
         "wrap": "last",
         "wrap_min": None,
+        "table_backend": None,
+        "presorted": False,
+        "stream_sample": DEFAULT_STREAM_SAMPLE,
+        "stream_overflow": DEFAULT_STREAM_OVERFLOW,
+        "offset": None,
+        "limit": None,
+        "sort_buffer": None,
     }
 
-    # pylint: disable=too-many-branches,too-many-arguments,too-many-positional-arguments,too-many-statements
-    def process_table(
-        self,
-        data,
-        columns=None,
-        add_index=None,
-        expand_keys=True,
-        remove_tabs=True,
-        **_,
-    ):
+    def process_table(self, data, **kwargs):
         "Restructure data to fit to list view"
 
-        add_index = add_index if isinstance(add_index, bool) else not expand_keys
+        rows, headers = self.iter_table(data, **kwargs)
+        return list(rows), headers
+
+    def prepare_rows(self, data, sort=RowSort(), window=RowWindow(), **process_options):
+        """Like :meth:`_TableFormatter.prepare_rows`, with columnar payloads.
+
+        Only the displayed columns, plus sort columns the ``columns``
+        projection leaves out, are extracted from each row. A
+        :class:`~clak.views.table_columnar.Columns` payload is projected
+        and sorted per column; rows are only built for the window.
+        """
+
+        columns = process_options.get("columns")
+        if not isinstance(data, Columns):
+            sort = sort.with_hidden(columns)
+            if sort.hidden:
+                process_options["columns"] = list(columns) + list(sort.hidden)
+            return super().prepare_rows(data, sort, window, **process_options)
+
+        keys, headers = self.columnar_keys(data, **process_options)
+        sort, hidden_keys = self.columnar_hidden(data, sort, columns)
+        indexes, remaining = self.columnar_order(
+            data.num_rows, keys + hidden_keys, headers, sort, window
+        )
+        remove_tabs = process_options.get("remove_tabs", True)
+        return take_rows(keys, indexes, remove_tabs), headers, remaining
 
-        if not expand_keys and columns is not None:
-            raise ValueError(
-                f"Cannot specify columns when expand_keys is False: {columns}"
+    @staticmethod
+    def columnar_keys(data, columns=None, add_index=None, expand_keys=True, **_):
+        """Column values and headers of a columnar payload after projection.
+
+        Unknown column names give None (cells shown as ``"-"``); the Index
+        column is the row number. Rows are always expanded: *expand_keys*
+        only changes the *add_index* default.
+        """
+
+        add_index = add_index if isinstance(add_index, bool) else not expand_keys
+        names = data.names
+        if columns is not None:
+            names = resolve_column_keys(columns, names, strict_names=False)
+        keys = [data.column(name) for name in names]
+        headers = list(names)
+        if add_index:
+            keys.insert(0, range(data.num_rows))
+            headers.insert(0, "Index")
+        return keys, headers
+
+    @staticmethod
+    def columnar_hidden(data, sort, columns=None):
+        """Sort columns the *columns* projection leaves out, and their values.
+
+        Returns *sort* carrying those names as ``hidden``, and their value
+        columns, to append after the displayed ones. Unknown names are
+        skipped (sorting on them raises KeyError).
+        """
+        hidden = {}
+        for name in sort.with_hidden(columns).hidden:
+            values = data.column(name)
+            if values is not None:
+                hidden[name] = values
+        return replace(sort, hidden=tuple(hidden)), list(hidden.values())
+
+    @staticmethod
+    def columnar_order(num_rows, keys, headers, sort, window):
+        """Row numbers to display, and the count of rows cut by the window.
+
+        *sort* is a :class:`RowSort`, with the same defaults as the row
+        path: *keys* holds the value columns of *headers*, then those of the
+        ``sort.hidden`` columns. *window* is a :class:`RowWindow`.
+        """
+
+        if sort.resolve(headers):
+            order = sort_order(
+                [keys[idx] for idx in sort.indexes(headers)],
+                num_rows,
+                reverse=sort.reverse,
+                limit=window.stop,
             )
+        else:
+            order = range(num_rows)
 
-        ret = []
-        columns_resolved = False
-
-        def _process_expanded_item(idx, item, columns):
-            row = [idx] if add_index else []
-
-            for field in columns:
-                if isinstance(item, Mapping):
-                    value = item.get(field, "-")
-                else:
-                    try:
-                        value = item[field]
-                    except (IndexError, KeyError, TypeError):
-                        value = "-"
-                if remove_tabs is not False:
-                    value = replace_tabs(value, remove_tabs)
-                row.append(value)
-            ret.append(row)
-
-        def _resolve_item_columns(item, cols):
-            nonlocal columns_resolved
-            if columns_resolved:
-                return cols
-            if isinstance(item, Mapping):
-                available = list(item.keys())
-            else:
-                available = list(range(0, len(item)))
-            columns_resolved = True
-            if cols is None:
-                return available
-            return resolve_column_keys(cols, available, strict_names=False)
+        indexes = window.take(order)
+        remaining = window.remaining(num_rows, len(indexes)) if window.active else 0
+        return indexes, remaining
 
-        _default_columns = ["Key", "Value"]
-        if isinstance(data, Mapping):
-            for idx, value in data.items():
-                if not expand_keys:
-                    ret.append([idx, value])
-                else:
-                    if not isinstance(value, Mapping):
-                        if hasattr(value, "__dict__"):
-                            # Automatically explode object with __dict__ method
-                            value = value.__dict__
-                        else:
-                            value = {
-                                "Key": idx,
-                                "Value": value,
-                            }
-
-                    columns = _resolve_item_columns(value, columns)
-                    _process_expanded_item(idx, value, columns)
-
-            if expand_keys and add_index:
-                columns = ["Index"] + columns
+    def natural_width(self, data, **view_options):
+        """Like :meth:`_TableFormatter.natural_width`, measured per column.
 
-        elif isinstance(data, Sequence):
-            for idx, value in enumerate(data):
-                if remove_tabs is not False:
-                    value = replace_tabs(value, remove_tabs)
-                if not expand_keys:
-                    ret.append([idx, value])
-                else:
-                    columns = _resolve_item_columns(value, columns)
-                    _process_expanded_item(idx, value, columns)
-
-            if expand_keys and add_index:
-                columns = ["Index"] + columns
+        Columnar payloads without a window are measured column by column,
+        without building rows.
+        """
 
-        else:
-            raise ValueError(
-                f"Data must be a list of dictionaries or lists, got {type(data)}"
-            )
+        columnar = as_columns(data)
+        _view_options = dict(self.view_options)
+        _view_options.update(view_options)
+        window = RowWindow.of(_view_options.get("offset"), _view_options.get("limit"))
+        if columnar is None or window.active:
+            return super().natural_width(columnar or data, **view_options)
+
+        keys, headers = self.columnar_keys(columnar, **_view_options)
+        remove_tabs = _view_options.get("remove_tabs", True)
+        widths = [
+            max(text_width(str(header)), column_width(values, remove_tabs))
+            for header, values in zip(headers, keys)
+        ]
+        return sum(widths) + 3 * len(widths) + 1
+
+    @staticmethod
+    def iter_table(
+        data, columns=None, add_index=None, expand_keys=True, remove_tabs=True, **_
+    ):
+        """Like process_table, but return a lazy row iterator and headers.
 
-        out = (ret, columns or _default_columns)
-        return out
+        *data* may also be a stream (generator, cursor): only its first item
+        is consumed up front, to resolve the columns.
+        """
+
+        if not expand_keys:
+            if columns is not None:
+                raise ValueError(
+                    f"Cannot specify columns when expand_keys is False: {columns}"
+                )
+            return _key_value_rows(data, remove_tabs), _KEY_VALUE_HEADERS
+
+        items = _indexed_items(data)
+        first = next(items, None)
+        if first is None:
+            return iter(()), columns or _KEY_VALUE_HEADERS
+
+        columns = _item_columns(first[1], columns, remove_tabs)
+        add_index = add_index if isinstance(add_index, bool) else not expand_keys
+        rows = (
+            _expanded_row(idx, item, columns, add_index, remove_tabs)
+            for idx, item in chain((first,), items)
+        )
+        headers = ["Index"] + columns if add_index else columns
+        return rows, headers or _KEY_VALUE_HEADERS
+
+    def iter_render(self, data, **view_options):
+        """Render *data* (list, dict, or stream) as an iterator of text chunks.
+
+        Without an explicit sort, streams are consumed lazily: yaml/json/csv
+        rows are emitted as they come and the view format sizes columns from
+        the first ``stream_sample`` rows. A ``limit`` stops reading the
+        stream once the window is full. An explicit ``sort_columns`` needs
+        every row: see :func:`_iter_sorted_stream`.
+        """
+
+        if not is_stream_payload(data):
+            return super().iter_render(data, **view_options)
+
+        _view_options = dict(self.view_options)
+        _view_options.update(view_options)
+
+        output = _RowOutput.pop_from(_view_options)
+        sort = _pop_row_sort(_view_options)
+        window = _pop_row_window(_view_options)
+
+        if sort.columns:
+            columns = _view_options.get("columns")
+            sort = sort.with_hidden(columns)
+            if sort.hidden:
+                _view_options["columns"] = list(columns) + list(sort.hidden)
+            rows, headers = self.iter_table(data, **_view_options)
+            if sort.hidden:
+                headers = headers[: len(headers) - len(sort.hidden)]
+            return _iter_sorted_stream(rows, headers, sort, window, output)
+
+        items = iter(data)
+        rows, headers = self.iter_table(window.iter_take(items), **_view_options)
+        return _iter_more_marker(output.stream(rows, headers), items, window)
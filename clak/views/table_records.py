@@ -0,0 +1,98 @@
+"""Structured output of table rows: json, ndjson, yaml and csv.
+
+Rows (lists of cells, possibly a lazy iterator) are paired with their
+headers and written chunk by chunk, so a stream is never held in memory.
+"""
+
+import csv
+
+from clak.views.base import DEFAULT_NDJSON_BATCH, OUTPUT_FORMATS
+from clak.views.serializers import get_serializer, require_yaml
+
+
+class _ChunkWriter(list):
+    """File-like target for csv.writer that collects written text."""
+
+    write = list.append
+
+
+def iter_json_records(records):
+    """Yield a JSON array (indent=2) chunk by chunk, one record per chunk.
+
+    Joined output equals ``json.dumps(list(records), indent=2) + "\\n"``.
+    """
+    dump = get_serializer("json").dump
+    first = True
+    for record in records:
+        text = dump(record, indent=2).replace("\n", "\n  ")
+        yield ("[\n  " if first else ",\n  ") + text
+        first = False
+    yield "[]\n" if first else "\n]\n"
+
+
+def iter_ndjson_records(records, batch=DEFAULT_NDJSON_BATCH):
+    """Yield JSON Lines text: one compact record per line, *batch* lines per chunk."""
+    if batch is None:
+        batch = DEFAULT_NDJSON_BATCH
+    if isinstance(batch, bool) or not isinstance(batch, int) or batch <= 0:
+        raise ValueError(f"ndjson batch must be a positive int, got {batch!r}")
+    dump = get_serializer("json").dump
+    lines = []
+    for record in records:
+        lines.append(dump(record, indent=None, compact=True) + "\n")
+        if len(lines) >= batch:
+            yield "".join(lines)
+            lines.clear()
+    if lines:
+        yield "".join(lines)
+
+
+def iter_yaml_records(records):
+    """Yield a YAML sequence chunk by chunk, one record per chunk."""
+    require_yaml()
+    dump = get_serializer("yaml").dump
+    empty = True
+    for record in records:
+        empty = False
+        yield dump([record])
+    if empty:
+        yield "[]\n"
+
+
+def iter_csv_rows(rows, headers, batch=256):
+    """Yield CSV text (header line first) in batches of *batch* rows."""
+    buf = _ChunkWriter()
+    writer = csv.writer(buf)
+    writer.writerow(headers)
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+        if count >= batch:
+            yield "".join(buf)
+            buf.clear()
+            count = 0
+    yield "".join(buf)
+
+
+def iter_structured(rows, headers, fmt, ndjson_batch=None):
+    """Yield tabular rows as yaml, json, ndjson, or csv chunks (rows may be lazy)."""
+    if fmt not in OUTPUT_FORMATS - {"view"}:
+        raise ValueError(
+            f"Unsupported format {fmt!r}, choose one of: {sorted(OUTPUT_FORMATS)}"
+        )
+
+    if fmt == "json":
+        return iter_json_records(dict(zip(headers, row)) for row in rows)
+    if fmt == "yaml":
+        return iter_yaml_records(dict(zip(headers, row)) for row in rows)
+    if fmt == "ndjson":
+        return iter_ndjson_records(
+            (dict(zip(headers, row)) for row in rows), batch=ndjson_batch
+        )
+    return iter_csv_rows(rows, headers)
+
+
+def format_structured(rows, headers, fmt):
+    """Render tabular rows as yaml, json, ndjson, or csv."""
+    return "".join(iter_structured(rows, headers, fmt))
@@ -0,0 +1,376 @@
+"""Row sorting for table views: cached cell keys, top-k, external merge sort.
+
+Sort keys are built once per row, from cell keys cached per column and
+distinct value (:class:`~clak.views.table_cells.CellCache`). With a
+``limit`` only the first rows are selected (heap, ``O(n log k)``). Streams
+larger than the row buffer are sorted in runs spilled to the XDG cache
+directory, then merged lazily.
+
+Sort options (:class:`RowSort`), column specs (names, 1-based and
+negative indexes) and the ``offset`` / ``limit`` row window
+(:class:`RowWindow`) are resolved here too.
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import os
+import pickle
+import tempfile
+from collections.abc import Sequence
+from dataclasses import dataclass, replace
+from itertools import chain, islice
+from operator import itemgetter
+from typing import Optional
+
+from clak.views.table_cells import CellCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SORT_BUFFER = 100_000
+SORT_MODES = frozenset({"asc", "desc"})
+SORT_SPILL_SUBDIR = os.path.join("clak", "sort")
+
+_first = itemgetter(0)
+_NO_ITEM = object()
+
+
+def column_sort_keys(values):
+    """Sort keys of every cell of one column, in row order."""
+    sort_key = CellCache().sort_key
+    return [sort_key(value) for value in values]
+
+
+def row_sort_key(indexes):
+    """Key function for rows sorted on column *indexes* (0-based).
+
+    Cell keys are cached per column, see :class:`CellCache`.
+    """
+    columns = [(idx, CellCache().sort_key) for idx in indexes]
+
+    def key_fn(row):
+        size = len(row)
+        return [sort_key(row[idx] if idx < size else "") for idx, sort_key in columns]
+
+    return key_fn
+
+
+def sort_rows(rows, key_fn, reverse=False, limit=None):
+    """Sort *rows*; with *limit*, return only the first *limit* rows.
+
+    Same result as ``sorted(rows, key=key_fn, reverse=reverse)[:limit]``.
+    """
+    if limit is None:
+        return sorted(rows, key=key_fn, reverse=reverse)
+    if reverse:
+        return heapq.nlargest(limit, rows, key=key_fn)
+    return heapq.nsmallest(limit, rows, key=key_fn)
+
+
+def sort_spill_dir():
+    """Directory for sort runs: ``$XDG_CACHE_HOME/clak/sort``."""
+    # Late import: clak.comp imports clak.views
+    from clak.comp.config import xdg_dir  # pylint: disable=import-outside-toplevel
+
+    return os.path.join(xdg_dir("XDG_CACHE_HOME"), SORT_SPILL_SUBDIR)
+
+
+def _spill_run(decorated, directory):
+    """Write one sorted run of ``(key, row)`` pairs; return its path."""
+    handle = tempfile.NamedTemporaryFile(  # pylint: disable=consider-using-with
+        mode="wb", dir=directory, prefix="run-", suffix=".pickle", delete=False
+    )
+    try:
+        with handle:
+            pickler = pickle.Pickler(handle, protocol=pickle.HIGHEST_PROTOCOL)
+            for item in decorated:
+                pickler.dump(item)
+    except BaseException:
+        os.unlink(handle.name)
+        raise
+    return handle.name
+
+
+def _read_run(path):
+    with open(path, "rb") as handle:
+        unpickler = pickle.Unpickler(handle)
+        while True:
+            try:
+                yield unpickler.load()
+            except EOFError:
+                return
+
+
+def _remove_runs(paths, directory):
+    for path in paths:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+    try:
+        os.rmdir(directory)
+    except OSError:
+        pass
+
+
+def _iter_merged(paths, tail, reverse, directory):
+    """Merge spilled runs and the in-memory *tail* run, then clean up."""
+    try:
+        runs = [_read_run(path) for path in paths] + [iter(tail)]
+        for _key, row in heapq.merge(*runs, key=_first, reverse=reverse):
+            yield row
+    finally:
+        _remove_runs(paths, directory)
+
+
+def external_sort(rows, key_fn, reverse=False, buffer_rows=None, spill_dir=None):
+    """Sort a row iterator that may not fit in memory.
+
+    Up to *buffer_rows* rows are sorted in memory; if the input fits, the
+    sorted list is returned. Otherwise each full buffer is sorted and
+    written as a run under *spill_dir* (default :func:`sort_spill_dir`),
+    and a lazy iterator merging the runs is returned (stable, same order
+    as :func:`sorted`). Runs are deleted when the iterator is exhausted
+    or closed. Rows that cannot be pickled are kept in memory.
+    """
+    if buffer_rows is None:
+        buffer_rows = DEFAULT_SORT_BUFFER
+    if isinstance(buffer_rows, bool) or not isinstance(buffer_rows, int):
+        raise TypeError(f"sort buffer must be an int, got {buffer_rows!r}")
+    if buffer_rows <= 0:
+        raise ValueError(f"sort buffer must be > 0, got {buffer_rows}")
+
+    rows = iter(rows)
+    buffer = list(islice(rows, buffer_rows))
+    peek = list(islice(rows, 1))
+    if not peek:
+        return sorted(buffer, key=key_fn, reverse=reverse)
+    rows = chain(peek, rows)
+
+    base = spill_dir or sort_spill_dir()
+    os.makedirs(base, exist_ok=True)
+    directory = tempfile.mkdtemp(prefix="sort-", dir=base)
+    paths = []
+    tail = []
+    try:
+        while buffer:
+            run = sorted(
+                ((key_fn(row), row) for row in buffer), key=_first, reverse=reverse
+            )
+            try:
+                paths.append(_spill_run(run, directory))
+            except (pickle.PicklingError, TypeError, AttributeError) as err:
+                logger.warning("Cannot spill sort run, sorting in memory: %s", err)
+                tail = run + [(key_fn(row), row) for row in rows]
+                tail.sort(key=_first, reverse=reverse)
+                break
+            logger.debug("Spilled sort run %s (%s rows)", paths[-1], len(run))
+            buffer = list(islice(rows, buffer_rows))
+    except BaseException:
+        _remove_runs(paths, directory)
+        raise
+    return _iter_merged(paths, tail, reverse, directory)
+
+
+def normalize_sort_mode(mode, default="asc"):
+    """Return True when sort order is descending."""
+    if mode is None:
+        mode = default
+    if not isinstance(mode, str):
+        raise TypeError(f"sort_mode must be a string, got {type(mode).__name__}")
+    mode = mode.lower()
+    if mode not in SORT_MODES:
+        raise ValueError(f"sort_mode must be one of {sorted(SORT_MODES)}, got {mode!r}")
+    return mode == "desc"
+
+
+def resolve_column_index(col, headers):
+    """Resolve a column spec to a 0-based index in *headers*.
+
+    - str: header name
+    - int < 0: index from end (-1 = last column)
+    - int > 0: 1-based index (1 = first column)
+    - int == 0: rejected
+    """
+    if isinstance(col, str):
+        try:
+            return headers.index(col)
+        except ValueError as err:
+            choices = ", ".join(str(header) for header in headers)
+            raise KeyError(
+                f"Column {col!r} not found in headers, choices: {choices}"
+            ) from err
+
+    if isinstance(col, int):
+        if col == 0:
+            raise KeyError(
+                "Column index 0 is invalid; use 1 for first column or -1 for last"
+            )
+        if col < 0:
+            idx = len(headers) + col
+        else:
+            idx = col - 1
+        if idx < 0 or idx >= len(headers):
+            choices = ", ".join(str(header) for header in headers)
+            raise KeyError(f"Column index {col} out of range, choices: {choices}")
+        return idx
+
+    raise TypeError(f"Column must be a string or int, got {type(col).__name__}")
+
+
+def resolve_sort_column_index(col, headers):
+    """Alias for :func:`resolve_column_index` (sort uses the same rules)."""
+    return resolve_column_index(col, headers)
+
+
+def hidden_sort_columns(sort_columns, columns):
+    """Sort column names that the *columns* projection does not display.
+
+    They are extracted with the displayed cells, for sorting only. Indexes
+    always refer to displayed columns; without a projection every field is
+    displayed, so nothing is hidden.
+    """
+    if not sort_columns or columns is None:
+        return []
+    hidden = []
+    for col in sort_columns:
+        if isinstance(col, str) and col not in columns and col not in hidden:
+            hidden.append(col)
+    return hidden
+
+
+def sort_column_indexes(sort_columns, headers, hidden=()):
+    """0-based cell indexes of *sort_columns* in rows shaped like *headers*.
+
+    Rows may carry *hidden* sort-only cells after the *headers* ones (see
+    :func:`hidden_sort_columns`).
+    """
+    indexes = []
+    for col in sort_columns:
+        if isinstance(col, str) and col in hidden and col not in headers:
+            indexes.append(len(headers) + list(hidden).index(col))
+        else:
+            indexes.append(resolve_sort_column_index(col, headers))
+    return indexes
+
+
+def sort_table_rows(rows, headers, sort_columns, sort_mode="asc", limit=None):
+    """Sort tabular rows by one or more header names or indexes.
+
+    With *limit*, only the first *limit* rows of the sorted result are
+    selected and returned (heap selection instead of a full sort).
+    """
+    return RowSort(sort_columns, sort_mode, presorted=True).apply(rows, headers, limit)
+
+
+def default_sort_columns(headers):
+    """Default: sort by the first displayed column, ascending."""
+    if not headers:
+        return None
+    return [1]
+
+
+@dataclass(frozen=True, slots=True)
+class RowSort:
+    """Sort options of a table: column specs, direction, presorted rows.
+
+    Without *columns*, rows are sorted on the first column unless
+    *presorted*. *hidden* names sort-only cells carried after the displayed
+    cells (see :func:`hidden_sort_columns`). Streams sort in memory up to
+    *buffer* rows (see :func:`external_sort`).
+    """
+
+    columns: Optional[Sequence] = None
+    mode: Optional[str] = "asc"
+    presorted: bool = False
+    hidden: tuple = ()
+    buffer: Optional[int] = None
+
+    @property
+    def reverse(self):
+        """True for a descending sort (validates *mode*)."""
+        return normalize_sort_mode(self.mode)
+
+    def resolve(self, headers):
+        """Column specs to sort rows shaped like *headers* on, or None."""
+        if not self.columns and headers and not self.presorted:
+            return default_sort_columns(headers)
+        return self.columns
+
+    def indexes(self, headers):
+        """0-based cell indexes of the resolved sort columns."""
+        return sort_column_indexes(self.resolve(headers), headers, self.hidden)
+
+    def key(self, headers):
+        """Key function for rows shaped like *headers* (see :func:`row_sort_key`)."""
+        return row_sort_key(self.indexes(headers))
+
+    def with_hidden(self, columns):
+        """Same sort, carrying the sort columns the *columns* projection hides."""
+        return replace(self, hidden=tuple(hidden_sort_columns(self.columns, columns)))
+
+    def apply(self, rows, headers, limit=None):
+        """Sorted *rows*, or only the first *limit* ones (heap selection).
+
+        Rows are returned unchanged when there is nothing to sort on.
+        """
+        if not rows or not self.resolve(headers):
+            return rows
+        return sort_rows(rows, self.key(headers), reverse=self.reverse, limit=limit)
+
+
+@dataclass(frozen=True, slots=True)
+class RowWindow:
+    """``offset`` / ``limit`` window over sorted rows.
+
+    *offset* rows are skipped, then at most *limit* rows are kept (None:
+    all). Both are non-negative ints; build one from unset CLI values with
+    :meth:`of`.
+    """
+
+    offset: int = 0
+    limit: Optional[int] = None
+
+    def __post_init__(self):
+        for name in ("offset", "limit"):
+            value = getattr(self, name)
+            if value is None and name == "limit":
+                continue
+            if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+                raise ValueError(f"{name} must be a non-negative int, got {value!r}")
+
+    @classmethod
+    def of(cls, offset=None, limit=None):
+        """Window for ``--offset`` / ``--limit`` values; unset offset is 0."""
+        return cls(0 if offset is None else offset, limit)
+
+    @property
+    def active(self):
+        """True when the window may cut rows."""
+        return bool(self.offset) or self.limit is not None
+
+    @property
+    def stop(self):
+        """Rows needed from the start, ``offset + limit`` (None: all)."""
+        return None if self.limit is None else self.offset + self.limit
+
+    def take(self, rows):
+        """Rows of the window, from a sorted sequence."""
+        return rows[self.offset : self.stop]
+
+    def iter_take(self, items):
+        """Items of the window, read lazily from an iterable."""
+        return islice(items, self.offset, self.stop)
+
+    def remaining(self, total, kept):
+        """Rows after the window, out of *total*, when *kept* were shown."""
+        return max(total - self.offset - kept, 0)
+
+    def has_more(self, items):
+        """True when the *items* iterator, read up to the window, goes on.
+
+        Peeks (consumes) one item; a stream cut by ``limit`` is not read
+        any further.
+        """
+        return self.stop is not None and next(items, _NO_ITEM) is not _NO_ITEM
@@ -0,0 +1,282 @@
+"""Column width fitting for table views.
+
+Applies the ``content`` / ``fit`` / ``terminal`` width modes and the
+``wrap`` / ``wrap_min`` column options, either to a PrettyTable instance
+(:func:`apply_prettytable_width`) or to measured natural widths for the
+line renderer (:func:`fit_table_widths`). Both follow the same rules.
+"""
+
+from collections.abc import Mapping
+
+from clak.views.base import (
+    DEFAULT_WIDTH_MODE,
+    DEFAULT_WRAP_MODE,
+    resolve_view_width,
+    strip_ansi,
+)
+from clak.views.table_engine import text_width
+from clak.views.table_sort import resolve_column_index
+
+
+def apply_prettytable_width(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    table,
+    width=DEFAULT_WIDTH_MODE,
+    term_width=None,
+    stdout_tty=None,
+    wrap="last",
+    wrap_min=None,
+):
+    """Apply content/fit/terminal width modes to a PrettyTable instance."""
+    # Late import avoids circular dependency with clak.views.table
+    from clak.views.table import (  # pylint: disable=import-outside-toplevel
+        normalize_wrap,
+        normalize_wrap_min,
+    )
+
+    mode, term_budget = resolve_view_width(
+        width=width, term_width=term_width, stdout_tty=stdout_tty
+    )
+    if mode == "content" or term_budget is None:
+        return
+
+    wrap_spec = normalize_wrap(wrap if wrap is not None else DEFAULT_WRAP_MODE)
+    if wrap_spec is None:
+        wrap_spec = DEFAULT_WRAP_MODE
+    wrap_min = normalize_wrap_min(wrap_min)
+
+    if isinstance(wrap_spec, str) and wrap_spec == "all":
+        if mode == "fit":
+            table.max_table_width = term_budget
+        elif mode == "terminal":
+            table.min_table_width = term_budget
+            table.max_table_width = term_budget
+        return
+
+    wrap_fields = _resolve_wrap_fields(wrap_spec, list(table.field_names))
+    _apply_column_wrap(
+        table,
+        mode=mode,
+        term_width=term_budget,
+        wrap_fields=wrap_fields,
+        wrap_min=wrap_min,
+    )
+
+
+def _resolve_wrap_fields(wrap_spec, headers):
+    """Resolve wrap keyword or column specs to displayed header names."""
+    if not headers:
+        return []
+    if isinstance(wrap_spec, str):
+        key = wrap_spec.lower()
+        if key == "last":
+            return [headers[-1]]
+        if key == "first":
+            return [headers[0]]
+        raise ValueError(
+            f"wrap must be last, first, all, or column specs, got {wrap_spec!r}"
+        )
+
+    fields = []
+    seen = set()
+    for col in wrap_spec:
+        field = headers[resolve_column_index(col, headers)]
+        if field in seen:
+            continue
+        seen.add(field)
+        fields.append(field)
+    return fields
+
+
+def _resolve_wrap_min_map(wrap_min, headers):
+    """Resolve wrap_min to a field-name map, or a global int, or None."""
+    if wrap_min is None or isinstance(wrap_min, int):
+        return wrap_min
+    resolved = {}
+    for key, val in wrap_min.items():
+        field = headers[resolve_column_index(key, headers)]
+        resolved[field] = val
+    return resolved
+
+
+def _wrap_column_floor(field, natural_width, wrap_min):
+    """Sequential-shrink floor: max(header, wrap_min, 1), capped at natural."""
+    header_len = len(str(field))
+    requested = None
+    if isinstance(wrap_min, int):
+        requested = wrap_min
+    elif isinstance(wrap_min, Mapping):
+        requested = wrap_min.get(field)
+    floor = max(header_len, requested if requested is not None else 0, 1)
+    return min(floor, natural_width)
+
+
+def _shrink_wrap_widths(widths, wrap_fields, wrap_min, overflow):
+    """Shrink wrap columns in order down to floor, then dump leftover."""
+    if overflow <= 0:
+        return
+    for field in wrap_fields:
+        if overflow <= 0:
+            break
+        floor = _wrap_column_floor(field, widths[field], wrap_min)
+        reducible = widths[field] - floor
+        if reducible <= 0:
+            continue
+        take = min(overflow, reducible)
+        widths[field] -= take
+        overflow -= take
+    if overflow > 0:
+        last = wrap_fields[-1]
+        widths[last] = max(1, widths[last] - overflow)
+
+
+def _pin_column_widths(field_names, natural_widths, widths, wrap_fields):
+    """Build PrettyTable min/max maps: wrap cols use computed width, others frozen."""
+    wrap_set = set(wrap_fields)
+    min_width = {}
+    max_width = {}
+    for field, col_width in zip(field_names, natural_widths):
+        pinned = widths[field] if field in wrap_set else col_width
+        min_width[field] = pinned
+        max_width[field] = pinned
+    return min_width, max_width
+
+
+def _apply_column_wrap(
+    table, mode, term_width, wrap_fields, wrap_min
+):  # pylint: disable=too-many-locals
+    """Fit table by shrinking wrap columns in order, then dumping leftover."""
+    if not table.field_names or not wrap_fields:
+        return
+
+    measured = table.get_string()
+    natural_widths = list(table._widths)  # pylint: disable=protected-access
+    if not natural_widths:
+        return
+
+    plain = strip_ansi(measured)
+    border_line = plain.splitlines()[0] if plain else ""
+    natural_border = len(border_line)
+
+    if mode == "fit" and natural_border <= term_width:
+        return
+
+    widths = dict(zip(table.field_names, natural_widths))
+    min_map = _resolve_wrap_min_map(wrap_min, list(table.field_names))
+    _shrink_wrap_widths(widths, wrap_fields, min_map, natural_border - term_width)
+    min_width, max_width = _pin_column_widths(
+        table.field_names, natural_widths, widths, wrap_fields
+    )
+
+    if mode == "terminal":
+        decorations = natural_border - sum(natural_widths)
+        current = decorations + sum(widths[field] for field in table.field_names)
+        pad = term_width - current
+        if pad > 0:
+            first = wrap_fields[0]
+            widths[first] += pad
+            min_width[first] = widths[first]
+            max_width[first] = widths[first]
+
+    # PrettyTable 3.x min_width/max_width setters take a single int;
+    # per-column dicts go on the private maps. Table-level min/max stay on
+    # wrap=all only; pins already encode the budget here.
+    table._min_width = min_width  # pylint: disable=protected-access
+    table._max_width = max_width  # pylint: disable=protected-access
+
+    if mode != "terminal":
+        return
+
+    rendered = strip_ansi(table.get_string())
+    border_line = rendered.splitlines()[0] if rendered else ""
+    delta = term_width - len(border_line)
+    if delta <= 0:
+        return
+    first = wrap_fields[0]
+    widths[first] += delta
+    min_width[first] = widths[first]
+    max_width[first] = widths[first]
+    table._min_width = min_width  # pylint: disable=protected-access
+    table._max_width = max_width  # pylint: disable=protected-access
+
+
+def _fit_all_widths(widths, mode, term_width):
+    """wrap=all: scale every column like PrettyTable max/min_table_width."""
+    count = len(widths)
+    fitted = list(widths)
+    table_width = sum(widths) + 3 * count + 1
+    if table_width > term_width:
+        markup = 3 * count - 1
+        scale = (term_width - markup) / (table_width - markup)
+        fitted = [max(1, int(col * scale)) for col in widths]
+    if mode == "terminal":
+        min_width = term_width - 3 * count - 1
+        content = sum(widths) or 1
+        if content < min_width:
+            scale = min_width / content
+            fitted = [int(col * scale) for col in widths]
+            if sum(fitted) < min_width:
+                fitted[-1] += min_width - sum(fitted)
+    return fitted
+
+
+def fit_table_widths(  # pylint: disable=too-many-arguments,too-many-locals
+    headers,
+    natural,
+    *,
+    has_rows=True,
+    width=DEFAULT_WIDTH_MODE,
+    term_width=None,
+    stdout_tty=None,
+    wrap="last",
+    wrap_min=None,
+):
+    """Column widths for the line renderer, same rules as the PrettyTable path.
+
+    Works on measured natural widths only: a framed table is
+    ``sum(widths) + 3 * len(widths) + 1`` cells wide, so no trial render
+    is needed.
+    """
+    # Late import avoids circular dependency with clak.views.table
+    from clak.views.table import (  # pylint: disable=import-outside-toplevel
+        normalize_wrap,
+        normalize_wrap_min,
+    )
+
+    widths = list(natural)
+    mode, term_budget = resolve_view_width(
+        width=width, term_width=term_width, stdout_tty=stdout_tty
+    )
+    if mode == "content" or term_budget is None or not widths:
+        return widths
+
+    wrap_spec = normalize_wrap(wrap if wrap is not None else DEFAULT_WRAP_MODE)
+    if wrap_spec is None:
+        wrap_spec = DEFAULT_WRAP_MODE
+    if isinstance(wrap_spec, str) and wrap_spec == "all":
+        return _fit_all_widths(widths, mode, term_budget)
+
+    # PrettyTable ignores per-column pins on an empty table
+    wrap_fields = _resolve_wrap_fields(wrap_spec, list(headers))
+    if not has_rows or not wrap_fields:
+        return widths
+
+    decorations = 3 * len(widths) + 1
+    natural_border = sum(widths) + decorations
+    if mode == "fit" and natural_border <= term_budget:
+        return widths
+
+    by_field = dict(zip(headers, widths))
+    min_map = _resolve_wrap_min_map(normalize_wrap_min(wrap_min), list(headers))
+    _shrink_wrap_widths(by_field, wrap_fields, min_map, natural_border - term_budget)
+    wrap_set = set(wrap_fields)
+    fitted = [
+        by_field[field] if field in wrap_set else col
+        for field, col in zip(headers, widths)
+    ]
+    if mode == "terminal":
+        pad = term_budget - (sum(fitted) + decorations)
+        if pad > 0:
+            fitted[list(headers).index(wrap_fields[0])] += pad
+
+    # Header cells never shrink below their own width
+    return [max(col, text_width(field)) for col, field in zip(fitted, headers)]
@@ -52,6 +52,54 @@ def test_composite_view_shared_table_width_min():
     assert widths[0] == widths[1]
 
 
+def test_composite_view_renders_each_table_once(monkeypatch):
+    from clak.views import CompositeView
+
+    calls = []
+    original = ListView.render
+
+    def counting_render(self, *args, **kwargs):
+        calls.append(self)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(ListView, "render", counting_render)
+    out = CompositeView(
+        [
+            ("primary", ListView([{"name": "a", "city": "London"}])),
+            ("secondary", ListView([{"n": "x"}])),
+        ],
+        width="min",
+    ).render(stdout=False)
+
+    assert len(calls) == 2
+    widths = [len(block.splitlines()[0]) for block in out.split("\n\n")]
+    assert widths[0] == widths[1]
+
+
+def test_table_view_natural_width_matches_rendered_border():
+    from clak.views.base import strip_ansi
+
+    views = [
+        ListView([{"name": "ada", "note": "line1\nlonger line2"}]),
+        ListView({"x": {"a": 1}, "y": {"a": "日本語"}}),
+        ListView([]),
+        ShowView({"key": "v\tx", "other": 3}),
+    ]
+    for view in views:
+        text = view.render(stdout=False, width="min")
+        border = strip_ansi(text.splitlines()[0])
+        assert view.natural_width(width="min") == len(border)
+
+    assert ListView(iter([{"a": 1}])).natural_width() is None
+
+
+def test_table_view_without_formatter_has_no_natural_width():
+    from clak.views.table import TableView
+
+    with pytest.raises(NotImplementedError, match="make_formatter"):
+        TableView([{"a": 1}]).natural_width()
+
+
 def test_composite_format_scope_first_json_matches_primary():
     from clak.views import CompositeView
 
@@ -88,6 +136,23 @@ def test_composite_format_scope_all_envelope_json():
     }
 
 
+def test_composite_format_scope_all_ndjson_one_line_per_section():
+    from clak.views import CompositeView
+
+    out = CompositeView(
+        [
+            ("users", ListView([{"name": "ada"}])),
+            ("notes", RawView("## Notes")),
+        ],
+        format="ndjson",
+        format_scope="all",
+    ).render(stdout=False)
+    assert out.splitlines() == [
+        '{"name":"users","kind":"list","data":[{"name":"ada"}]}',
+        '{"name":"notes","kind":"raw","data":"## Notes"}',
+    ]
+
+
 def test_composite_format_scope_all_csv_blocks():
     from clak.views import CompositeView
 
@@ -8,13 +8,21 @@ import pytest
 from clak import Parser
 from clak.comp import config as config_mod
 from clak.comp.config import (
+    ConfigSection,
+    LayeredConfig,
+    LazyConfig,
     XDGConfigMixin,
+    config_cache_path,
+    env_layer,
+    file_layer,
+    load_config_cached,
     load_config_file,
     resolve_xdg_paths,
     sanitize_xdg_app_name,
     xdg_dir,
 )
 from clak.exception import ClakUserError
+from clak.views.serializers import register_serializer, unregister_serializer
 
 pytestmark = pytest.mark.tags("unit-tests")
 
@@ -120,6 +128,23 @@ def test_load_config_file_unknown_suffix(tmp_path):
         load_config_file(path)
 
 
+def test_load_config_file_registered_suffix(tmp_path):
+    register_serializer(
+        "ini-lines",
+        load=lambda text: dict(line.split("=", 1) for line in text.splitlines()),
+        suffixes=(".lines",),
+    )
+    try:
+        path = tmp_path / "app.lines"
+        path.write_text("name=demo\n", encoding="utf-8")
+        assert load_config_file(path) == {"name": "demo"}
+        path.write_text("broken\n", encoding="utf-8")
+        with pytest.raises(ClakUserError, match="Invalid INI-LINES"):
+            load_config_file(path)
+    finally:
+        unregister_serializer("ini-lines")
+
+
 def test_load_config_file_yaml_missing_pyyaml(tmp_path, monkeypatch):
     monkeypatch.setattr(config_mod, "_yaml", None)
     path = tmp_path / "app.yaml"
@@ -192,3 +217,237 @@ def test_hook_config_required_missing_file(tmp_path):
     missing = tmp_path / "nope.json"
     with pytest.raises(ClakUserError, match="not found"):
         app.cli_execute({"xdg_config": str(missing), "__cli_self__": app})
+
+
+def test_lazy_config_loads_once_on_first_access():
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return {"db": {"host": "localhost"}, "port": 8080}
+
+    config = LazyConfig(loader)
+    assert not config.loaded
+    assert "not loaded" in repr(config)
+    assert not calls
+    assert config.port == 8080
+    assert config["db"] == {"host": "localhost"}
+    assert dict(config) == {"db": {"host": "localhost"}, "port": 8080}
+    assert calls == [1]
+
+
+def test_config_section_wraps_nested_mappings_on_attribute_access():
+    config = ConfigSection({"db": {"host": "localhost"}, "tags": ["a"]})
+    assert isinstance(config.db, ConfigSection)
+    assert config.db.host == "localhost"
+    assert config.db.missing is None
+    assert type(config["db"]) is dict
+    assert config.tags == ["a"]
+    config.debug = True
+    assert config["debug"] is True
+    with pytest.raises(AttributeError):
+        config._private  # pylint: disable=pointless-statement
+
+
+def test_hook_parses_config_only_when_read(tmp_path, monkeypatch):
+    conf = tmp_path / "settings.json"
+    conf.write_text("{ invalid", encoding="utf-8")
+
+    class App(XDGConfigMixin, Parser):
+        def cli_run(self, ctx=None, **_):
+            if ctx.args.read:
+                return ctx.config.get("port")
+            return "skipped"
+
+    app = App(parse=False)
+    args = {"xdg_config": str(conf), "read": False, "__cli_self__": app}
+    assert app.cli_execute(args) == "skipped"
+    assert not app.config.loaded
+
+    app = App(parse=False)
+    with pytest.raises(ClakUserError, match="Invalid JSON"):
+        app.cli_execute(dict(args, read=True))
+
+
+################## Parsed config cache
+
+
+def _settled_config(tmp_path, data=None):
+    """A JSON config file last modified a minute ago."""
+    path = tmp_path / "big.json"
+    path.write_text(json.dumps(data or {"port": 8080}), encoding="utf-8")
+    past = os.stat(path).st_mtime_ns - 60 * 1_000_000_000
+    os.utime(path, ns=(past, past))
+    return path
+
+
+def _no_parse(path):
+    raise AssertionError(f"{path} parsed instead of read from cache")
+
+
+def test_config_cache_reuses_parsed_data(tmp_path, monkeypatch):
+    path = _settled_config(tmp_path)
+    cache_dir = tmp_path / "cache"
+    assert load_config_cached(path, cache_dir, min_size=0) == {"port": 8080}
+    entry = config_cache_path(path, cache_dir)
+    assert os.listdir(cache_dir / "config") == [os.path.basename(entry)]
+
+    monkeypatch.setattr(config_mod, "load_config_file", _no_parse)
+    assert load_config_cached(path, cache_dir, min_size=0) == {"port": 8080}
+
+
+def test_config_cache_invalidated_by_file_change(tmp_path):
+    path = _settled_config(tmp_path)
+    cache_dir = tmp_path / "cache"
+    load_config_cached(path, cache_dir, min_size=0)
+    _settled_config(tmp_path, {"port": 9090, "debug": True})
+    assert load_config_cached(path, cache_dir, min_size=0) == {
+        "port": 9090,
+        "debug": True,
+    }
+
+
+def test_config_cache_replaces_corrupt_entry(tmp_path):
+    path = _settled_config(tmp_path)
+    cache_dir = tmp_path / "cache"
+    entry = config_cache_path(path, cache_dir)
+    os.makedirs(os.path.dirname(entry))
+    with open(entry, "wb") as handle:
+        handle.write(b"not a pickle")
+    assert load_config_cached(path, cache_dir, min_size=0) == {"port": 8080}
+    with open(entry, "rb") as handle:
+        assert handle.read() != b"not a pickle"
+
+
+def test_config_cache_skips_small_recent_or_disabled(tmp_path):
+    cache_dir = tmp_path / "cache"
+    path = _settled_config(tmp_path)
+    assert load_config_cached(path, cache_dir) == {"port": 8080}
+    assert load_config_cached(path, None, min_size=0) == {"port": 8080}
+    recent = tmp_path / "recent.json"
+    recent.write_text("{}", encoding="utf-8")
+    assert load_config_cached(recent, cache_dir, min_size=0) == {}
+    assert not cache_dir.exists()
+
+
+@pytest.mark.parametrize("no_cache", [False, True])
+def test_hook_config_cache_flag(tmp_path, monkeypatch, no_cache):
+    monkeypatch.setattr(config_mod, "CONFIG_CACHE_MIN_BYTES", 0)
+    path = _settled_config(tmp_path)
+    cache_dir = tmp_path / "cache"
+
+    class App(XDGConfigMixin, Parser):
+        def cli_run(self, ctx=None, **_):
+            return dict(ctx.config)
+
+    app = App(parse=False)
+    args = {
+        "xdg_config": str(path),
+        "xdg_cache_dir": str(cache_dir),
+        "xdg_no_config_cache": no_cache,
+        "__cli_self__": app,
+    }
+    assert app.cli_execute(args) == {"port": 8080}
+    assert os.path.isfile(config_cache_path(path, cache_dir)) is not no_cache
+
+
+################## Config layers
+
+
+def _layer_file(tmp_path, name, data):
+    path = tmp_path / f"{name}.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+def _counting_load(calls):
+    def load(path):
+        calls.append(os.path.basename(path))
+        return load_config_file(path)
+
+    return load
+
+
+def test_layered_config_skips_lower_layers_for_scalars(tmp_path):
+    system = _layer_file(tmp_path, "system", {"port": 1, "debug": True})
+    user = _layer_file(tmp_path, "user", {"port": 2})
+    calls = []
+    load = _counting_load(calls)
+    config = LayeredConfig(
+        [
+            file_layer("system", lambda: [system], load),
+            file_layer("user", lambda: [tmp_path / "nope.json", user], load),
+        ]
+    )
+
+    assert config["port"] == 2
+    assert calls == ["user.json"]
+    assert config.provenance("port") == [("user", str(user))]
+
+    assert config.debug is True
+    assert calls == ["user.json", "system.json"]
+    assert config.missing is None
+    assert dict(config) == {"port": 2, "debug": True}
+
+
+def test_layered_config_merges_mappings_with_provenance(tmp_path):
+    system = _layer_file(tmp_path, "system", {"db": {"host": "a", "port": 1}})
+    user = _layer_file(tmp_path, "user", {"db": {"port": 2}})
+    environ = {"APP_CONFIG__DB__USER": "bob", "APP_CONFIG__DB__POOL": "[1, 2]"}
+    config = LayeredConfig(
+        [
+            file_layer("system", lambda: [system], load_config_file),
+            file_layer("user", lambda: [user], load_config_file),
+            env_layer("APP_CONFIG__", environ=environ),
+        ]
+    )
+
+    assert config.db.host == "a"
+    assert config["db"] == {"host": "a", "port": 2, "user": "bob", "pool": [1, 2]}
+    assert [name for name, _ in config.provenance("db")] == ["env", "user", "system"]
+    assert config.provenance("db")[0] == ("env", "$APP_CONFIG__*")
+    assert config.provenance("unknown") == []
+
+
+def test_layered_config_overrides_and_deletes(tmp_path):
+    user = _layer_file(tmp_path, "user", {"port": 2, "db": {"host": "a"}})
+    config = LayeredConfig([file_layer("user", lambda: [user], load_config_file)])
+
+    config["port"] = 3
+    config.db = {"user": "bob"}
+    assert config["port"] == 3
+    assert config["db"] == {"host": "a", "user": "bob"}
+    assert config.provenance("port") == [("runtime", None)]
+
+    del config["port"]
+    assert "port" not in config
+    assert config.provenance("port") == []
+    assert dict(config) == {"db": {"host": "a", "user": "bob"}}
+    with pytest.raises(KeyError):
+        del config["port"]
+
+
+def test_hook_config_layers(tmp_path, monkeypatch):
+    user = _layer_file(tmp_path, "user", {"port": 2, "name": "user"})
+    project = tmp_path / "work"
+    (project / "sub").mkdir(parents=True)
+    (project / ".layered.json").write_text('{"port": 3}', encoding="utf-8")
+    monkeypatch.chdir(project / "sub")
+    monkeypatch.setenv("LAYERED_CONFIG__NAME", "env")
+
+    class App(XDGConfigMixin, Parser):
+        class Meta:
+            app_name = "layered"
+            config_layers = ("system", "user", "project", "env")
+
+        def cli_run(self, ctx=None, **_):
+            return dict(ctx.config)
+
+    app = App(parse=False)
+    args = {"xdg_config": str(user), "__cli_self__": app}
+    assert app.cli_execute(args) == {"port": 3, "name": "env"}
+    assert app.config.provenance("port")[0][0] == "project"
+
+    App.Meta.config_layers = ("user", "secrets")
+    with pytest.raises(ValueError, match="Unknown config layers"):
+        App(parse=False).cli_execute(args)
@@ -0,0 +1,176 @@
+"""Tests for config reloading of long-running commands."""
+
+import json
+import os
+import threading
+
+import pytest
+
+from clak import Parser
+from clak.comp import config_watch
+from clak.comp.config import (
+    LayeredConfig,
+    LazyConfig,
+    XDGConfigMixin,
+    file_layer,
+    load_config_file,
+)
+from clak.comp.config_layers import diff_config
+from clak.comp.config_watch import ConfigWatcher
+from clak.exception import ClakUserError
+
+pytestmark = pytest.mark.tags("unit-tests")
+
+
+def _write(path, data):
+    """Write *data* as JSON, moving the mtime so a change is always seen."""
+    path.write_text(json.dumps(data), encoding="utf-8")
+    stamp = os.stat(path).st_mtime_ns + 1_000_000
+    os.utime(path, ns=(stamp, stamp))
+
+
+def _lazy(path):
+    return LazyConfig(lambda: load_config_file(path), source=str(path))
+
+
+def test_diff_config_reports_nested_dotted_keys():
+    old = {"port": 1, "db": {"host": "a", "port": 2}, "gone": True}
+    new = {"port": 1, "db": {"host": "b", "port": 2}, "added": [1]}
+    assert diff_config(old, new) == ["db.host", "gone", "added"]
+    assert diff_config(old, old) == []
+
+
+def test_watcher_reloads_lazy_config_and_notifies(tmp_path):
+    path = tmp_path / "app.json"
+    _write(path, {"port": 1, "db": {"host": "a"}})
+    config = _lazy(path)
+    seen = []
+
+    with ConfigWatcher(config, backend="poll") as watcher:
+        watcher.subscribe(lambda cfg, keys: seen.append(keys))
+        assert watcher.paths == []  # not loaded yet
+        assert config["port"] == 1
+        assert watcher.check() == []
+        assert watcher.paths == [str(path)]
+
+        _write(path, {"port": 1, "db": {"host": "b"}})
+        assert watcher.check() == ["db.host"]
+        assert config.db.host == "b"
+        assert seen == [["db.host"]]
+
+
+def test_watcher_reparses_only_the_changed_layer(tmp_path):
+    system = tmp_path / "system.json"
+    user = tmp_path / "user.json"
+    _write(system, {"debug": False, "db": {"host": "a"}})
+    _write(user, {"port": 1, "db": {"port": 5}})
+    loads = []
+
+    def load(source):
+        loads.append(os.path.basename(source))
+        return load_config_file(source)
+
+    config = LayeredConfig(
+        [
+            file_layer("system", lambda: [system], load),
+            file_layer("user", lambda: [user], load),
+        ]
+    )
+    assert config["port"] == 1
+    watcher = ConfigWatcher(config, backend="poll")
+    assert watcher.paths == [str(user)]
+
+    # A scalar change in the user layer needs no lower layer
+    _write(user, {"port": 2, "db": {"port": 5}})
+    assert watcher.check() == ["port"]
+    assert loads == ["user.json", "user.json"]
+
+    # Mappings are merged with the system layer, parsed once
+    _write(user, {"port": 2, "db": {"port": 6}})
+    assert watcher.check() == ["db.port"]
+    assert config["db"] == {"host": "a", "port": 6}
+    assert loads == ["user.json", "user.json", "user.json", "system.json"]
+
+    _write(system, {"debug": False, "db": {"host": "b"}})
+    assert watcher.check() == ["db.host"]
+    assert loads[-1] == "system.json" and loads.count("user.json") == 3
+
+
+def test_watcher_keeps_values_of_invalid_file(tmp_path, caplog):
+    path = tmp_path / "app.json"
+    _write(path, {"port": 1})
+    config = _lazy(path)
+    assert config["port"] == 1
+    watcher = ConfigWatcher(config, backend="poll")
+
+    path.write_text("{ invalid", encoding="utf-8")
+    os.utime(path, ns=(1, 1))
+    assert watcher.check() == []
+    assert config["port"] == 1
+    assert "not reloaded" in caplog.text
+
+    _write(path, {"port": 2})
+    assert watcher.check() == ["port"]
+
+
+@pytest.mark.skipif(
+    config_watch._inotify_libc() is None,  # pylint: disable=protected-access
+    reason="inotify not available",
+)
+def test_inotify_backend_sees_replaced_file(tmp_path):
+    path = tmp_path / "app.json"
+    _write(path, {"port": 1})
+    config = _lazy(path)
+    assert config["port"] == 1
+
+    with ConfigWatcher(config, backend="inotify") as watcher:
+        assert watcher.backend == "inotify"
+        assert watcher.check(timeout=0.05) == []
+        temp = tmp_path / ".app.json.tmp"
+        temp.write_text('{"port": 2}', encoding="utf-8")
+        os.replace(temp, path)
+        assert watcher.check(timeout=2) == ["port"]
+
+
+def test_watcher_thread_calls_back(tmp_path):
+    path = tmp_path / "app.json"
+    _write(path, {"port": 1})
+    config = _lazy(path)
+    assert config["port"] == 1
+    changed = threading.Event()
+
+    with ConfigWatcher(config, interval=0.01, backend="poll") as watcher:
+        watcher.subscribe(lambda cfg, keys: changed.set())
+        watcher.start()
+        _write(path, {"port": 2})
+        assert changed.wait(5)
+    assert config["port"] == 2
+
+
+def test_watcher_rejects_bad_options():
+    config = LazyConfig(dict)
+    with pytest.raises(ValueError, match="Unknown config watch backend"):
+        ConfigWatcher(config, backend="kqueue")
+    with pytest.raises(ValueError, match="interval"):
+        ConfigWatcher(config, interval=0)
+
+
+def test_mixin_watch_config(tmp_path):
+    path = tmp_path / "app.json"
+    _write(path, {"port": 1})
+
+    class App(XDGConfigMixin, Parser):
+        def cli_run(self, ctx=None, **_):
+            watcher = self.watch_config(backend="poll")
+            port = ctx.config["port"]
+            _write(path, {"port": port + 1})
+            return watcher.check(), ctx.config["port"]
+
+    app = App(parse=False)
+    assert app.cli_execute({"xdg_config": str(path), "__cli_self__": app}) == (
+        ["port"],
+        2,
+    )
+
+    with pytest.raises(ClakUserError, match="No config file"):
+        App(parse=False).watch_config()
@@ -77,3 +77,21 @@ def test_cli_group_receives_unpacked_context_kwargs():
     assert seen["ctx"] is app.ctx
     assert seen["cli_root"] is app
     assert seen["runtime"] is seen["ctx"].runtime
+
+
+def test_ctx_attributes_are_plain_dict_entries():
+    args = CliArgs(name="x")
+    assert args.missing is None
+    args.extra = 1
+    assert args.__dict__ == {"name": "x", "extra": 1}
+    assert args.get("extra") == 1 and len(args) == 2
+
+    class App(Parser):
+        def cli_run(self, ctx, **_):
+            ctx.custom = "value"
+            return ctx
+
+    ctx = App(parse=False).dispatch([])
+    assert ctx.as_kwargs()["custom"] == "value"
+    with pytest.raises(AttributeError):
+        ctx.view_settings = {}
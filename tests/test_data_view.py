@@ -81,6 +81,23 @@ def test_format_data_payload_json_pretty_and_compact():
     assert "\n  " not in compact
 
 
+def test_format_data_payload_ndjson_lines():
+    text, fmt = format_data_payload([PAYLOAD, {"name": "bob"}], fmt="ndjson")
+    assert fmt == "ndjson"
+    assert text.splitlines() == [
+        json.dumps(PAYLOAD, separators=(",", ":")),
+        '{"name":"bob"}',
+    ]
+    single, _ = format_data_payload(PAYLOAD, fmt="ndjson")
+    assert single == json.dumps(PAYLOAD, separators=(",", ":")) + "\n"
+
+
+def test_data_view_ndjson_streams_generator(capsys):
+    records = ({"idx": idx} for idx in range(3))
+    assert DataView(records, format="ndjson", color=True).render() is None
+    assert capsys.readouterr().out == '{"idx":0}\n{"idx":1}\n{"idx":2}\n'
+
+
 def test_format_data_payload_yaml_anchors():
     pytest.importorskip("yaml")
     shared = {"x": 1}
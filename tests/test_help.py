@@ -875,3 +875,16 @@ def test_rst_literals_stripped_on_forced_color(monkeypatch):
     stripped = strip_ansi(help_text)
     assert "``" not in stripped
     assert "cmd" in stripped
+
+
+def test_help_records_are_slotted():
+    """Per-argument help records carry no instance __dict__."""
+
+    class App(Parser):
+        name = Argument("--name", help="Name")
+
+    app = App(parse=False)
+    record = next(arg for arg in app.help_args if arg.dest == "name")
+    assert record.option_strings == ("--name",)
+    assert not hasattr(record, "__dict__")
+    assert not hasattr(app.dispatcher, "__dict__")
@@ -335,3 +335,74 @@ def test_intermixed_inherited_flag_among_positionals():
     assert args.pattern == "foo"
     assert args.verbose is True
     assert args.files == ["bar"]
+
+
+def _app_with_groups():
+    class Leaf(Parser):
+        def cli_run(self, **_):
+            return None
+
+    class Group(Parser):
+        one = Command(Leaf, help="One")
+        two = Command(Leaf, help="Two")
+
+    class Renamed(Parser):
+        class Meta:
+            propagate_options_group = "global options"
+
+        one = Command(Leaf, help="One")
+
+    class App(Parser):
+        verbose = Opt("--verbose", action="store_true", help="Verbose mode")
+        group = Command(Group, help="Group")
+        renamed = Command(Renamed, help="Renamed")
+
+    return App(parse=False, add_help=True)
+
+
+def _action(node, option):
+    return node.parser._option_string_actions[option]  # pylint: disable=W0212
+
+
+def test_propagated_copies_shared_across_descendants():
+    """One copy action and HelpArg per ancestor flag and help group."""
+    app = _app_with_groups()
+    group = app.children["group"]
+    one, two = group.children["one"], group.children["two"]
+
+    copy = _action(group, "--verbose")
+    assert copy is not _action(app, "--verbose")
+    assert copy.default is argparse.SUPPRESS
+    assert _action(one, "--verbose") is copy
+    assert _action(two, "--verbose") is copy
+    assert one.help_args[-1] is group.help_args[-1]
+
+    renamed = app.children["renamed"]
+    assert _action(renamed, "--verbose") is not copy
+    assert renamed.help_args[-1].group == "global options"
+    assert _action(renamed.children["one"], "--verbose") is _action(
+        renamed, "--verbose"
+    )
+
+
+def test_shared_copies_parse_and_help_per_node():
+    """Shared copies still parse and render per node."""
+    app = _app_with_groups()
+    assert app.parse_args(["group", "one", "--verbose"]).verbose is True
+    assert app.parse_args(["--verbose", "group", "two"]).verbose is True
+    assert app.parse_args(["group", "two"]).verbose is False
+    one_help = app.children["group"].children["one"].parser.format_help()
+    assert "parent options:" in one_help
+    assert "--verbose" in one_help[one_help.index("parent options:") :]
+    renamed_help = app.children["renamed"].children["one"].parser.format_help()
+    assert "global options:" in renamed_help
+
+
+def test_flag_index_built_from_parent():
+    """Nodes without local flags reuse their parent's flag index."""
+    app = _app_with_groups()
+    group = app.children["group"]
+    assert group.flag_index is app.flag_index
+    assert app.flag_index.dests == {"verbose"}
+    assert "--verbose" in app.flag_index.strings
+    assert [entry[0] for entry in app.flag_index.entries] == ["verbose"]
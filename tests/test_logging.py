@@ -1,6 +1,10 @@
 """Tests for configurable CLI logging."""
 
+import json
 import logging
+import queue
+import sys
+import threading
 from types import SimpleNamespace
 from unittest.mock import patch
 
@@ -9,7 +13,8 @@ import pytest
 from clak import Argument, Parser
 from clak.comp import logging as logging_plugin
 from clak.comp.logging import LoggingOptMixin, get_app_logger
-from clak.exception import ClakAppError
+from clak.exception import ClakAppError, ClakUserError
+from clak.runtime import log_handlers
 from clak.runtime.settings import resolve_log_colors
 
 pytestmark = pytest.mark.tags("unit-tests")
@@ -157,3 +162,375 @@ def test_log_colors_hook_reads_meta_env(monkeypatch):
         App(parse=False, add_help=False).dispatch([])
 
     assert captured.get("colors") is False
+
+
+@pytest.fixture
+def fresh_logging(monkeypatch):
+    "Forget what previous tests installed"
+    monkeypatch.setattr(logging_plugin, "_installed", logging_plugin._logging_state())
+    yield
+    logging_plugin.stop_log_queue()
+    logging_plugin._close_log_file()
+    # capsys streams are closed by now: later tests log to the current stderr
+    handler = logging_plugin._installed.handler
+    if handler is not None:
+        handler.stream = sys.stderr
+
+
+def test_repeated_configuration_only_applies_differences(fresh_logging, capsys):
+    get_app_logger(loggers={"test.incr": {"level": logging.DEBUG}})
+    handler = logging.getLogger().handlers[0]
+    formatter = handler.formatter
+
+    with patch("logging.config.dictConfig", side_effect=AssertionError):
+        get_app_logger(loggers={"test.incr": {"level": logging.INFO}})
+        assert logging.getLogger().handlers == [handler]
+        assert handler.formatter is formatter
+        assert logging.getLogger("test.incr").level == logging.INFO
+
+        get_app_logger(
+            loggers={"test.other": {"level": logging.INFO}},
+            level=logging.NOTSET,
+            formatter="audit",
+        )
+        assert handler.formatter is not formatter
+        assert "%(asctime)s" in handler.formatter._fmt
+        stale = logging.getLogger("test.incr")
+        assert (stale.level, stale.handlers, stale.propagate) == (0, [], True)
+
+    logging.getLogger("test.other").info("visible")
+    assert "visible" in capsys.readouterr().err
+
+
+def test_reconfigured_logging_falls_back_to_dictconfig(fresh_logging):
+    get_app_logger()
+    logging.getLogger().handlers.clear()
+
+    with patch("logging.config.dictConfig", wraps=logging.config.dictConfig) as full:
+        get_app_logger()
+        get_app_logger()
+    assert full.call_count == 1
+    assert full.call_args.args[0]["handlers"]["default"]["level"] == "WARNING"
+
+
+def test_async_logging_writes_from_listener_thread(fresh_logging, capsys):
+    get_app_logger(
+        loggers={"test.async": {"level": logging.INFO}},
+        level=logging.NOTSET,
+        log_async=True,
+        queue_size=10,
+    )
+    front = logging.getLogger("test.async").handlers[0]
+    assert isinstance(front, logging_plugin.LogQueueHandler)
+    assert logging.getLogger().handlers == [front]
+
+    logging.getLogger("test.async").info("queued")
+    front.flush()
+    assert "queued" in capsys.readouterr().err
+
+    # Same settings: the queue is kept; stopping writes directly again
+    get_app_logger(
+        loggers={"test.async": {"level": logging.INFO}},
+        level=logging.NOTSET,
+        log_async=True,
+        queue_size=10,
+    )
+    assert logging.getLogger("test.async").handlers == [front]
+    logging_plugin.stop_log_queue()
+    assert logging.getLogger("test.async").handlers == [
+        logging_plugin._installed.handler
+    ]
+    logging.getLogger("test.async").info("direct")
+    assert "direct" in capsys.readouterr().err
+
+
+def test_async_log_queue_policies():
+    handler = logging_plugin.LogQueueHandler(queue.Queue(maxsize=1), policy="drop")
+    record = logging.makeLogRecord({"msg": "hello"})
+    for _ in range(3):
+        handler.handle(record)
+    assert handler.dropped == 2
+
+    with pytest.raises(ValueError, match="Invalid log queue policy"):
+        get_app_logger(log_async=True, queue_policy="spill")
+    with pytest.raises(ValueError, match="Log queue size"):
+        logging_plugin._start_log_queue(logging.NullHandler(), 0, "block")
+
+
+def test_async_logs_flushed_before_error_report(fresh_logging, capsys):
+    class App(LoggingOptMixin, Parser):
+        class Meta:
+            log_queue_policy = "drop"
+
+        def cli_run(self, **_):
+            assert logging_plugin._installed.listener is not None
+            assert logging_plugin._installed.fronts[0].policy == "drop"
+            raise ClakUserError("boom happened", advice="try again later")
+
+    with pytest.raises(SystemExit):
+        App(parse=False, add_help=False).dispatch(["--log-async", "--no-log-colors"])
+
+    err = capsys.readouterr().err
+    assert err.index("try again later") < err.index("boom happened")
+
+
+def test_log_file_buffers_debug_records_off_stderr(fresh_logging, tmp_path, capsys):
+    path = tmp_path / "logs" / "app.log"
+    get_app_logger(
+        loggers={"test.file": {"level": logging.INFO}},
+        level=logging.NOTSET,
+        log_file=str(path),
+        log_file_options={"format": "json", "buffer": 10},
+    )
+    log = logging.getLogger("test.file")
+    assert log.level == logging.DEBUG
+
+    log.debug("disk only %s", 1)
+    log.info("both")
+    assert not path.exists() or path.read_text() == ""
+    log.warning("flushes")
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [(r["level"], r["message"]) for r in records] == [
+        ("DEBUG", "disk only 1"),
+        ("INFO", "both"),
+        ("WARNING", "flushes"),
+    ]
+    assert records[0]["logger"] == "test.file"
+    err = capsys.readouterr().err
+    assert "both" in err and "flushes" in err
+    assert "disk only" not in err
+
+    # Same file: the handler is kept; no file: loggers go back to stderr levels
+    buffered = log.handlers[1]
+    get_app_logger(
+        loggers={"test.file": {"level": logging.INFO}},
+        level=logging.NOTSET,
+        log_file=str(path),
+        log_file_options={"format": "json", "buffer": 10},
+    )
+    assert log.handlers[1] is buffered
+    get_app_logger(loggers={"test.file": {"level": logging.INFO}})
+    assert log.level == logging.INFO and len(log.handlers) == 1
+
+
+def test_log_file_rotates_text_records(fresh_logging, tmp_path):
+    path = tmp_path / "app.log"
+    get_app_logger(
+        loggers={"test.rotate": {"level": logging.WARNING}},
+        log_file=str(path),
+        log_file_options={"max_bytes": 200, "backups": 2, "buffer": 1},
+    )
+    for idx in range(20):
+        logging.getLogger("test.rotate").debug("record %d", idx)
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "app.log",
+        "app.log.1",
+        "app.log.2",
+    ]
+    assert "[DEBUG] test.rotate: record 19" in path.read_text()
+
+    with pytest.raises(ValueError, match="Invalid log file format"):
+        get_app_logger(log_file=str(path), log_file_options={"format": "xml"})
+
+
+def test_log_file_option_resolves_in_log_dir(fresh_logging, tmp_path):
+    from clak.comp.config import XDGConfigMixin
+
+    class App(XDGConfigMixin, LoggingOptMixin, Parser):
+        class Meta:
+            log_prefix = "test.app"
+            log_file_format = "json"
+
+        def cli_run(self, **_):
+            self.logger.debug("audit trail")
+
+    App(parse=False, add_help=False).dispatch(
+        ["--log-dir", str(tmp_path), "--log-file", "run.log", "--no-log-colors"]
+    )
+    logging_plugin._close_log_file()
+    messages = [
+        json.loads(line)["message"]
+        for line in (tmp_path / "run.log").read_text().splitlines()
+    ]
+    assert "audit trail" in messages
+
+
+def test_trace_points_skip_argument_work_when_disabled(caplog):
+    from clak.core.parser import ParserNode
+    from clak.runtime import TracePoint
+
+    class App(Parser):
+        name = Argument("--name")
+
+    def build():
+        with patch.object(
+            ParserNode, "get_fname", autospec=True, side_effect=ParserNode.get_fname
+        ) as get_fname:
+            App(parse=False)
+        return get_fname.call_count
+
+    trace = TracePoint(logging.getLogger("clak.core.descriptors"))
+    caplog.set_level(logging.INFO, logger="clak")
+    assert not trace
+    assert build() == 0
+
+    caplog.set_level(logging.DEBUG, logger="clak")
+    assert trace and trace.enabled
+    assert build() > 1
+    record = next(r for r in caplog.records if "Create new argument" in r.message)
+    assert record.funcName == "attach_arg_to_parser"
+    assert ".name:" in record.message
+
+
+def test_dispatch_node_traces_follow_level_set_by_hooks(fresh_logging, capsys):
+    class App(LoggingOptMixin, Parser):
+        class Meta:
+            log_prefix = "test.trace"
+
+        def cli_run(self, **_):
+            pass
+
+    logging.getLogger("clak").setLevel(logging.WARNING)
+    App(parse=False, add_help=False).dispatch(["--no-log-colors", "-vv"])
+    # The logging hook of the first node enables the records after it
+    err = capsys.readouterr().err
+    assert "Processing node 0:" not in err
+    assert "Run function execute: 0:" in err
+
+
+def test_stderr_levels_use_nearest_configured_logger():
+    levels = log_handlers.StderrLevels({"": logging.WARNING, "app": logging.DEBUG})
+    assert levels.threshold("app.db") == logging.DEBUG
+    assert levels.threshold("root") == logging.WARNING
+    assert levels.threshold("other") == logging.WARNING
+
+    record = logging.makeLogRecord({"name": "other", "levelno": logging.INFO})
+    assert not levels.filter(record)
+
+
+def test_parse_log_rate():
+    parse = logging_plugin.parse_log_rate
+    assert parse("10/s") == (10.0, 10.0)
+    assert parse("120/m") == (2.0, 120.0)
+    assert parse(0.5) == (0.5, 1.0)
+    assert parse({"rate": "1/h", "burst": 3}) == (1 / 3600, 3.0)
+    assert parse(None) is None
+    for spec in ("10/d", "many/s", 0, {"burst": 2}, {"rate": 1, "burst": 0}):
+        with pytest.raises(ValueError):
+            parse(spec)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_rate_limiter_buckets_per_logger_and_template(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(log_handlers.time, "monotonic", clock)
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    limiter = logging_plugin.LogRateLimiter(
+        {"": "2/s", "test.rate.free": None}, summary=5
+    )
+    limiter.attach(handler)
+    log = logging.getLogger("test.rate")
+    log.handlers, log.propagate = [handler], False
+    log.setLevel(logging.DEBUG)
+    try:
+        for idx in range(5):
+            log.debug("item %d", idx)
+            log.info("other")
+        log.warning("never limited")
+        for idx in range(3):
+            logging.getLogger("test.rate.free").debug("free %d", idx)
+        assert [r.getMessage() for r in records] == [
+            "item 0",
+            "other",
+            "item 1",
+            "other",
+            "never limited",
+            "free 0",
+            "free 1",
+            "free 2",
+        ]
+        assert limiter.suppressed == 6
+
+        # Half a second refills one token of each bucket
+        clock.now += 0.5
+        log.debug("item %d", 5)
+        assert records[-1].getMessage() == "item 5"
+
+        del records[:]
+        clock.now += 5
+        log.debug("item %d", 6)
+        assert [(r.levelno, r.getMessage()) for r in records] == [
+            (logging.DEBUG, "Suppressed 3 similar messages: item %d"),
+            (logging.INFO, "Suppressed 3 similar messages: other"),
+            (logging.DEBUG, "item 6"),
+        ]
+    finally:
+        limiter.detach()
+        log.handlers = []
+    assert limiter not in handler.filters
+
+
+def test_rate_limiter_counts_every_record_across_threads(monkeypatch):
+    monkeypatch.setattr(log_handlers.time, "monotonic", _Clock())
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    limiter = logging_plugin.LogRateLimiter({"": "10/s"}, summary=5)
+    limiter.attach(handler)
+    log = logging.getLogger("test.rate.threads")
+    log.handlers, log.propagate = [handler], False
+    log.setLevel(logging.DEBUG)
+
+    def chatty():
+        for idx in range(500):
+            log.debug("tick %d", idx)
+
+    threads = [threading.Thread(target=chatty) for _ in range(8)]
+    try:
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # The clock stands still: only the burst passes, every other is counted
+        assert len(records) == 10
+        assert limiter.suppressed == 8 * 500 - 10
+    finally:
+        limiter.detach()
+        log.handlers = []
+    assert records[-1].getMessage() == "Suppressed 3990 similar messages: tick %d"
+
+
+def test_log_sample_option_limits_chatty_loggers(fresh_logging, capsys):
+    class App(LoggingOptMixin, Parser):
+        class Meta:
+            log_prefix = "test.sample"
+            log_rate_limits = {"test.sample": "1000/h"}
+
+        def cli_run(self, **_):
+            for idx in range(50):
+                self.logger.info("step %d", idx)
+                logging.getLogger("test.noisy").info("tick %d", idx)
+
+    App(parse=False, add_help=False).dispatch(
+        ["-vvv", "--no-log-colors", "--log-sample", "test.noisy=3/s"]
+    )
+    logging_plugin.summarize_log_rate_limits()
+    err = capsys.readouterr().err
+    assert err.count("] step ") == 50
+    assert err.count("] tick ") == 3
+    assert "Suppressed 47 similar messages: tick %d" in err
+
+    with pytest.raises(SystemExit):
+        App(parse=False, add_help=False).dispatch(["--log-sample", "fast"])
+    assert "Invalid log rate" in capsys.readouterr().err
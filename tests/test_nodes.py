@@ -96,6 +96,24 @@ def test_node_hierarchy():
     assert hierarchy[2] is child2
 
 
+def test_node_ancestors_and_depth():
+    """Attaching a node stores its ancestors tuple and depth."""
+    root = Node(name="root")
+    child1 = Node(name="child1", parent=root)
+    child2 = Node(name="child2", parent=child1)
+
+    assert root.ancestors == () and root.depth == 0
+    assert child2.ancestors == (root, child1)
+    assert child2.depth == 2
+    # get_hierarchy returns a new list each time
+    assert child2.get_hierarchy() is not child2.get_hierarchy()
+
+    other = Node(name="other")
+    child1.parent = other
+    assert child1.ancestors == (other,)
+    assert child1.get_fname() == "other.child1"
+
+
 def test_node_get_name():
     """Test Node get_name method."""
     node = Node(name="test")
@@ -35,6 +35,52 @@ def test_parser_initialization():
     assert isinstance(parser.registry, dict)
 
 
+def test_registry_indexes_the_command_tree():
+    """The registry finds nodes by full name, path, class and prefix."""
+
+    class Leaf(Parser):
+        "Leaf"
+
+    class OtherLeaf(Leaf):
+        "Other leaf"
+
+    class Group(Parser):
+        "Group"
+
+        one = Command(Leaf, help="One")
+        two = Command(OtherLeaf, help="Two")
+
+    class App(Parser):
+        "App"
+
+        group = Command(Group, help="Group")
+        zlast = Command(Leaf, help="Last")
+
+    app = App(parse=False)
+    reg = app.registry
+    group = app.children["group"]
+    one = group.children["one"]
+
+    assert reg[one.fkey] is one
+    assert reg.by_path(()) is app
+    assert reg.by_path(("group", "one")) is reg.by_path("group one") is one
+    assert reg.by_path("group three", default=None) is None
+    with pytest.raises(KeyError):
+        reg.by_path("nope")
+    assert reg.by_class(OtherLeaf) == [group.children["two"]]
+    assert reg.by_class(Leaf) == [one, group.children["two"], app.children["zlast"]]
+    assert reg.by_prefix("group") == [group, one, group.children["two"]]
+    assert [node.key for node in reg.by_prefix(())] == [
+        None,
+        "group",
+        "one",
+        "two",
+        "zlast",
+    ]
+    assert list(reg.leaves()) == [one, group.children["two"], app.children["zlast"]]
+    assert one.ancestors == (app, group) and one.depth == 2
+
+
 def test_parser_with_arguments():
     """Test parser with basic arguments."""
     parser = ParserNode()
@@ -563,7 +609,7 @@ def test_clean_terminate_broken_pipe(caplog, monkeypatch):
 
 
 def test_broken_pipe_during_view_render(caplog, monkeypatch):
-    """Pipe break during view print goes through clean_terminate, not bug path."""
+    """Pipe break during view output goes through clean_terminate, not bug path."""
     from clak.views import ListView
 
     def fake_exit_broken_pipe(rc=1):
@@ -574,10 +620,14 @@ def test_broken_pipe_during_view_render(caplog, monkeypatch):
     def run_cmd(**_):
         return ListView([{"name": "a"}, {"name": "b"}])
 
-    def boom_print(*_args, **_kwargs):
-        raise BrokenPipeError(32, "Broken pipe")
+    class _BrokenStdout:
+        def write(self, _text):
+            raise BrokenPipeError(32, "Broken pipe")
+
+        def flush(self):
+            pass
 
-    monkeypatch.setattr("builtins.print", boom_print)
+    monkeypatch.setattr("sys.stdout", _BrokenStdout())
 
     parser = ParserNode()
     parser.cli_run = run_cmd
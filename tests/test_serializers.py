@@ -0,0 +1,106 @@
+"""Tests for the serializer registry and its backends."""
+
+import json
+
+import pytest
+
+from clak.views import DataView
+from clak.views.data import resolve_data_format
+from clak.views.serializers import (
+    CLAK_SERIALIZER_BACKEND_ENV,
+    get_serializer,
+    register_serializer,
+    resolve_serializer_backend,
+    serializer_backends,
+    serializer_for_suffix,
+    unregister_serializer,
+)
+
+pytestmark = pytest.mark.tags("unit-tests")
+
+PAYLOAD = {"name": "ada", "roles": ["admin", "ops"], "uid": 1000, "ratio": 0.5}
+
+
+def _dump_kv(payload):
+    return "".join(f"{key}={value}\n" for key, value in payload.items())
+
+
+def _load_kv(text):
+    data = {}
+    for line in text.splitlines():
+        if "=" not in line:
+            raise ValueError(f"not a key=value line: {line!r}")
+        key, value = line.split("=", 1)
+        data[key] = value
+    return data
+
+
+@pytest.fixture(name="kv_format")
+def fixture_kv_format():
+    yield register_serializer("kv", dump=_dump_kv, load=_load_kv, suffixes=(".kv",))
+    unregister_serializer("kv")
+
+
+def test_python_json_matches_stdlib():
+    serializer = get_serializer("json", backend="python")
+    assert serializer.dump(PAYLOAD, indent=2) == json.dumps(PAYLOAD, indent=2)
+    assert serializer.dump(PAYLOAD, indent=None) == json.dumps(PAYLOAD)
+    assert serializer.dump(PAYLOAD, indent=None, compact=True) == json.dumps(
+        PAYLOAD, separators=(",", ":")
+    )
+
+
+@pytest.mark.parametrize("options", [{"indent": 2}, {"indent": None, "compact": True}])
+def test_json_backends_same_text_for_ascii_payloads(options):
+    texts = {
+        get_serializer("json", backend=backend).dump(PAYLOAD, **options)
+        for backend in serializer_backends("json")
+    }
+    assert len(texts) == 1
+
+
+def test_yaml_backends_same_text():
+    pytest.importorskip("yaml")
+    shared = ["x"]
+    payloads = [PAYLOAD, {"a": shared, "b": shared}, "scalar", [1, None, True]]
+    for payload in payloads:
+        for anchors in (True, False):
+            texts = {
+                get_serializer("yaml", backend=backend).dump(payload, anchors=anchors)
+                for backend in serializer_backends("yaml")
+            }
+            assert len(texts) == 1
+
+
+def test_yaml_load_errors_are_value_errors():
+    pytest.importorskip("yaml")
+    with pytest.raises(ValueError):
+        get_serializer("yaml").load("key: [unclosed")
+
+
+def test_backend_env_forces_python(monkeypatch):
+    monkeypatch.setenv(CLAK_SERIALIZER_BACKEND_ENV, "python")
+    assert get_serializer("json").backend == "python"
+    monkeypatch.setenv(CLAK_SERIALIZER_BACKEND_ENV, "fastest")
+    with pytest.raises(ValueError, match=CLAK_SERIALIZER_BACKEND_ENV):
+        resolve_serializer_backend("json")
+
+
+def test_unknown_format_raises():
+    with pytest.raises(ValueError, match="Unsupported format"):
+        get_serializer("xml")
+
+
+def test_register_requires_replace_for_existing_names(kv_format):
+    assert get_serializer("kv") is kv_format
+    with pytest.raises(ValueError, match="already registered"):
+        register_serializer("kv", dump=_dump_kv)
+    with pytest.raises(ValueError, match="already registered"):
+        register_serializer("json", dump=_dump_kv)
+
+
+def test_registered_format_in_data_view(kv_format):
+    assert serializer_for_suffix(".KV") is kv_format
+    assert resolve_data_format("kv") == "kv"
+    rendered = DataView({"a": 1}, format="kv", color=False).render(stdout=False)
+    assert rendered == "a=1\n"
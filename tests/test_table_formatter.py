@@ -2,17 +2,31 @@
 Test functions for table formatter classes.
 """
 
+from decimal import Decimal
 from pprint import pprint
 
 import pytest
 
+from clak.views import Columns, ListView
 from clak.views.base import DEFAULT_WIDTH_MODE
+from clak.views.table_cells import CellCache
+from clak.views.table_engine import line_width
 from clak.views.table_formatter import (
+    CLAK_TABLE_BACKEND_ENV,
     TableListFormatter,
     TableShowFormatter,
-    resolve_column_index,
+    more_rows_marker,
     resolve_column_keys,
+    resolve_table_backend,
+)
+from clak.views.table_sort import (
+    RowWindow,
+    external_sort,
+    hidden_sort_columns,
+    resolve_column_index,
     resolve_sort_column_index,
+    row_sort_key,
+    sort_rows,
 )
 
 pytestmark = pytest.mark.tags("unit-tests")
@@ -478,6 +492,16 @@ def test_table_width_terminal_long_cell_honors_term_width_with_colors():
     assert len(_first_border(output)) == 80
 
 
+@pytest.mark.parametrize("backend", ["native", "prettytable"])
+def test_table_render_rows_plain_borders_without_colors(backend):
+    from clak.views.table_formatter import TableListFormatter
+
+    rendered = TableListFormatter.render_rows(
+        [["ada"]], ["name"], table_backend=backend, clak_colors=False
+    )
+    assert rendered == "+------+\n| name |\n+------+\n| ada  |\n+------+"
+
+
 def test_table_wrap_last_keeps_left_columns():
     data = [
         {
@@ -698,3 +722,364 @@ def test_table_wrap_min_unknown_column_raises():
             term_width=50,
             stdout_tty=True,
         )
+
+
+################## Streaming (iterator payloads)
+
+
+def _stream_rows(count=5):
+    return [{"name": f"host{idx:02d}", "note": "x" * (idx + 1)} for idx in range(count)]
+
+
+@pytest.mark.parametrize("fmt", ["view", "csv", "json", "yaml"])
+@pytest.mark.parametrize(
+    "width_opts",
+    [
+        {},
+        {"width": "fit", "term_width": 20, "stdout_tty": True},
+        {"width": "terminal", "term_width": 60, "stdout_tty": True},
+        {"width": "fit", "term_width": 20, "stdout_tty": True, "wrap": "all"},
+    ],
+)
+def test_stream_matches_list_output(fmt, width_opts):
+    rows = _stream_rows()
+    expected = TableListFormatter().render(rows, format=fmt, **width_opts)
+    output = TableListFormatter().render(iter(rows), format=fmt, **width_opts)
+    assert output == expected
+
+
+def test_stream_view_sizes_from_sample_and_wraps_later_rows():
+    rows = _stream_rows(3) + [{"name": "late", "note": "y" * 12}]
+    output = _plain_table(
+        TableListFormatter().render(iter(rows), stream_sample=3, add_index=False)
+    )
+    lines = output.splitlines()
+    assert len({len(line) for line in lines}) == 1
+    assert "| late   | yyyy |" in lines
+    assert sum("yyyy" in line for line in lines) == 3
+
+
+def test_stream_view_truncate_overflow():
+    rows = _stream_rows(3) + [{"name": "late", "note": "y" * 12}]
+    output = _plain_table(
+        TableListFormatter().render(
+            iter(rows), stream_sample=3, stream_overflow="truncate"
+        )
+    )
+    assert "| late   | yyy… |" in output.splitlines()
+
+
+def test_stream_keeps_source_order_unless_sorted():
+    rows = [{"name": "b"}, {"name": "a"}]
+    unsorted = TableListFormatter().render(iter(rows), format="csv")
+    assert unsorted.splitlines() == ["name", "b", "a"]
+    ordered = TableListFormatter().render(
+        iter(rows), format="csv", sort_columns=["name"]
+    )
+    assert ordered.splitlines() == ["name", "a", "b"]
+
+
+def test_stream_sorted_with_limit_matches_list():
+    rows = [{"name": name, "n": idx} for idx, name in enumerate("dbeca")]
+    opts = {"format": "csv", "sort_columns": ["name"], "offset": 1, "limit": 2}
+    streamed = TableListFormatter().render(iter(rows), **opts)
+    assert streamed == TableListFormatter().render(rows, **opts)
+    assert streamed.splitlines() == ["name,n", "b,1", "c,3"]
+
+
+def test_presorted_skips_default_sort_only():
+    rows = [{"name": "b"}, {"name": "a"}]
+    kept = TableListFormatter().render(rows, format="csv", presorted=True)
+    assert kept.splitlines() == ["name", "b", "a"]
+    ordered = TableListFormatter().render(
+        rows, format="csv", presorted=True, sort_columns=["name"]
+    )
+    assert ordered.splitlines() == ["name", "a", "b"]
+
+
+_WIDE_ROWS = [
+    {"name": "b", "size": 1, "note": "x"},
+    {"name": "a", "size": 2, "note": "y"},
+    {"name": "c", "size": 0, "note": "z"},
+]
+
+
+@pytest.mark.parametrize("fmt", ["csv", "json", "yaml", "ndjson"])
+@pytest.mark.parametrize(
+    "payload",
+    [
+        lambda: _WIDE_ROWS,
+        lambda: iter(_WIDE_ROWS),
+        lambda: Columns(
+            {key: [row[key] for row in _WIDE_ROWS] for key in _WIDE_ROWS[0]}
+        ),
+    ],
+    ids=["list", "stream", "columns"],
+)
+def test_sort_on_column_not_displayed(fmt, payload):
+    expected = ListView(_WIDE_ROWS, columns=["name"], sort_columns=["name"])
+    expected = expected.render(format=fmt, stdout=False, sort_mode="desc")
+    for opts in ({}, {"limit": 2}, {"offset": 1, "sort_mode": "desc"}):
+        view = ListView(payload(), columns=["name"], sort_columns=["size"], **opts)
+        rendered = view.render(format=fmt, stdout=False)
+        if not opts:
+            # size order is c, b, a: the reverse of names
+            assert rendered == expected
+        assert "size" not in rendered
+
+
+def test_sort_on_hidden_column_table_and_index():
+    rendered = TableListFormatter().render(
+        _WIDE_ROWS,
+        format="csv",
+        columns=["name", -1],
+        sort_columns=["size", 1],
+        add_index=True,
+    )
+    assert rendered.splitlines() == ["Index,name,note", "2,c,z", "0,b,x", "1,a,y"]
+
+
+def test_sort_on_unknown_column_still_raises():
+    with pytest.raises(KeyError, match="missing"):
+        ListView(_WIDE_ROWS, columns=["name"], sort_columns=["missing"]).render(
+            format="json", stdout=False
+        )
+
+
+def test_hidden_sort_columns():
+    assert hidden_sort_columns(["size", 1, "name", "size"], ["name", 2]) == ["size"]
+    assert hidden_sort_columns(["size"], None) == []
+    assert hidden_sort_columns(None, ["name"]) == []
+
+
+################## Sort helpers
+
+
+def test_sort_rows_top_k_matches_sorted():
+    rows = [[value % 7, f"r{value}"] for value in range(50)]
+    key_fn = row_sort_key([0, 1])
+    for reverse in (False, True):
+        expected = sorted(rows, key=key_fn, reverse=reverse)[:5]
+        assert sort_rows(rows, key_fn, reverse=reverse, limit=5) == expected
+
+
+def test_external_sort_spills_and_cleans_up(tmp_path):
+    rows = [[value % 5, value] for value in range(23)]
+    key_fn = row_sort_key([0])
+    merged = external_sort(iter(rows), key_fn, buffer_rows=4, spill_dir=tmp_path)
+    assert not isinstance(merged, list)
+    assert list(merged) == sorted(rows, key=key_fn)
+    assert not list(tmp_path.iterdir())
+
+
+def test_external_sort_in_memory_when_buffer_fits(tmp_path):
+    rows = [["b"], ["a"]]
+    result = external_sort(rows, row_sort_key([0]), buffer_rows=2, spill_dir=tmp_path)
+    assert result == [["a"], ["b"]]
+    assert not list(tmp_path.iterdir())
+
+
+def test_cell_cache_keys_values_by_type():
+    cache = CellCache()
+    assert [cache.measure(value) for value in (1, 1.0, True, 1)] == [
+        "1",
+        "1.0",
+        "True",
+        "1",
+    ]
+    assert len(cache) == 2
+    assert cache.widest == 4
+    assert cache.sort_key("10") == (0, 10)
+    assert cache.text(["a", "b"]) == "['a', 'b']"
+    assert len(cache) == 3
+
+
+def test_cell_cache_skips_equal_values_printed_differently():
+    values = [Decimal("1.10"), Decimal("1.1"), 0.0, -0.0]
+    cache = CellCache()
+    assert [cache.measure(value) for value in values] == ["1.10", "1.1", "0.0", "-0.0"]
+    assert len(cache) == 0
+    assert cache.widest == 4
+
+    rows = [{"p": value} for value in values]
+    out = TableListFormatter().render(
+        rows, table_backend="native", presorted=True, clak_colors=False
+    )
+    cells = [line.strip("| ") for line in out.splitlines()[3:-1]]
+    assert cells == ["1.10", "1.1", "0.0", "-0.0"]
+
+
+def test_cell_cache_is_bounded_and_stops_on_distinct_values():
+    repeated = CellCache(maxsize=2)
+    for value in ["up", "down", "up", "down", "gone", "up"]:
+        repeated.text(value)
+    assert len(repeated) == 2
+    assert repeated.enabled
+
+    distinct = CellCache(maxsize=2)
+    for value in range(5):
+        assert distinct.sort_key(value) == (0, value)
+    assert not distinct.enabled
+    assert distinct.width(12345) == 5
+
+
+def test_stream_rejected_by_show_formatter():
+    with pytest.raises(ValueError, match="list or dict"):
+        TableShowFormatter().render(iter([{"a": 1}]))
+
+
+################## Table backends
+
+
+@pytest.mark.parametrize(
+    "width_opts",
+    [
+        {"width": "content"},
+        {"width": "fit", "term_width": 22, "stdout_tty": True},
+        {"width": "fit", "term_width": 22, "stdout_tty": True, "wrap": "first"},
+        {"width": "terminal", "term_width": 70, "stdout_tty": True, "wrap": "all"},
+        {"width": "terminal", "term_width": 30, "stdout_tty": True, "wrap_min": 6},
+    ],
+)
+def test_native_backend_matches_prettytable(width_opts):
+    data = _wrap_data(last="some long text " * 4) + [
+        {"name": "café", "role": "tab\there", "note": "multi\nline"}
+    ]
+    native = TableListFormatter().render(data, table_backend="native", **width_opts)
+    pretty = TableListFormatter().render(
+        data, table_backend="prettytable", **width_opts
+    )
+    assert native == pretty
+
+
+def test_native_backend_matches_prettytable_with_wide_characters():
+    data = [{"name": "中文", "role": "\x1b[1mbold\x1b[0m", "note": "café"}]
+    native = TableListFormatter().render(data, table_backend="native")
+    assert native == TableListFormatter().render(data, table_backend="prettytable")
+
+
+def test_native_backend_wraps_wide_characters_on_display_cells():
+    # PrettyTable releases disagree here: older ones wrap on characters
+    data = [{"name": "中文字", "note": "日本語のテキスト です"}]
+    output = TableListFormatter().render(
+        data,
+        table_backend="native",
+        clak_colors=False,
+        width="terminal",
+        term_width=20,
+        stdout_tty=True,
+        wrap="all",
+    )
+    lines = output.splitlines()
+    assert len({line_width(line) for line in lines}) == 1
+    assert "| 中  |" in output and "| です       |" in output
+
+
+def test_native_backend_matches_prettytable_with_repeated_cells():
+    data = [
+        {"status": status, "ok": idx % 2 == 0, "note": "a\nb" if idx == 3 else idx % 2}
+        for idx, status in enumerate(["up", "down", "up", "up", "down", "up"])
+    ]
+    native = TableListFormatter().render(data, table_backend="native")
+    pretty = TableListFormatter().render(data, table_backend="prettytable")
+    assert native == pretty
+
+
+def test_show_native_backend_matches_prettytable():
+    native = TableShowFormatter().render(data_item_dict1, table_backend="native")
+    pretty = TableShowFormatter().render(data_item_dict1, table_backend="prettytable")
+    assert native == pretty
+
+
+def test_resolve_table_backend(monkeypatch):
+    monkeypatch.delenv(CLAK_TABLE_BACKEND_ENV, raising=False)
+    assert resolve_table_backend() == "prettytable"
+    monkeypatch.setenv(CLAK_TABLE_BACKEND_ENV, "Native")
+    assert resolve_table_backend() == "native"
+    assert resolve_table_backend("prettytable") == "prettytable"
+    with pytest.raises(ValueError, match="table_backend"):
+        resolve_table_backend("rich")
+
+
+def test_row_window_and_marker():
+    rows = [[idx] for idx in range(5)]
+    window = RowWindow.of(offset=1, limit=2)
+    assert window.stop == 3
+    assert window.take(rows) == [[1], [2]]
+    assert list(window.iter_take(iter(rows))) == [[1], [2]]
+    assert window.remaining(len(rows), 2) == 2
+    assert RowWindow.of(offset=9).take(rows) == []
+    assert RowWindow.of(offset=9).remaining(len(rows), 0) == 0
+    assert RowWindow.of().take(rows) == rows
+    assert not RowWindow.of().active
+    assert more_rows_marker(1) == "... 1 more row"
+    assert more_rows_marker(3) == "... 3 more rows"
+    assert more_rows_marker() == "... more rows"
+    with pytest.raises(ValueError, match="limit"):
+        RowWindow.of(limit=-1)
+    with pytest.raises(ValueError, match="offset"):
+        RowWindow.of(offset=True)
+
+
+def test_limit_renders_window_with_marker_for_both_backends():
+    data = [{"id": idx} for idx in range(6)]
+    for backend in ("native", "prettytable"):
+        out = TableListFormatter().render(
+            data, offset=2, limit=3, table_backend=backend
+        )
+        body, marker = out.rsplit("\n", 1)
+        assert marker == "... 1 more row"
+        assert body == TableListFormatter().render(data[2:5], table_backend=backend)
+    csv_out = TableListFormatter().render(data, limit=2, format="csv")
+    assert csv_out.splitlines() == ["id", "0", "1"]
+
+
+################## Columnar payloads
+
+_COLUMNAR = {
+    "name": ["b", "A", "10", "9", "a\tb"],
+    "size": [3, -1, 3, 0, 2],
+    "ok": [True, False, True, True, False],
+}
+_COLUMNAR_ROWS = [dict(zip(_COLUMNAR, values)) for values in zip(*_COLUMNAR.values())]
+
+
+@pytest.mark.parametrize(
+    "opts",
+    [
+        {},
+        {"format": "csv", "sort_columns": ["size", "name"], "sort_mode": "desc"},
+        {"sort_columns": ["ok"], "add_index": True},
+        {"columns": ["size", "missing"], "offset": 1, "limit": 2},
+        {"format": "csv", "presorted": True, "limit": 3},
+    ],
+)
+def test_columnar_matches_row_payload(opts):
+    expected = TableListFormatter().render(_COLUMNAR_ROWS, **opts)
+    assert TableListFormatter().render(Columns(_COLUMNAR), **opts) == expected
+
+
+def test_columnar_numpy_matches_row_payload():
+    np = pytest.importorskip("numpy")
+    array = np.array(
+        list(zip(*_COLUMNAR.values())),
+        dtype=[("name", "U8"), ("size", "i8"), ("ok", "?")],
+    )
+    for opts in ({}, {"sort_columns": ["size"], "sort_mode": "desc", "limit": 3}):
+        expected = TableListFormatter().render(_COLUMNAR_ROWS, **opts)
+        assert TableListFormatter().render(array, **opts) == expected
+
+
+def test_columnar_natural_width_matches_row_payload():
+    for opts in ({}, {"add_index": True}, {"columns": ["ok", "missing"]}):
+        expected = TableListFormatter().natural_width(_COLUMNAR_ROWS, **opts)
+        assert TableListFormatter().natural_width(Columns(_COLUMNAR), **opts) == (
+            expected
+        )
+
+
+def test_columnar_rejects_uneven_columns():
+    with pytest.raises(ValueError, match="same length"):
+        Columns({"a": [1, 2], "b": [1]})
+    with pytest.raises(TypeError, match="must be a sequence"):
+        Columns({"a": "text"})
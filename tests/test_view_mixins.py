@@ -1,12 +1,18 @@
 """Tests for table view mixins and CLI options."""
 
+import gzip
 import json
 import logging
 
 import pytest
 
 from clak import Argument, Command, Parser
-from clak.comp.views import ListViewMixin, PprintViewMixin, ShowViewMixin
+from clak.comp.views import (
+    DataViewMixin,
+    ListViewMixin,
+    PprintViewMixin,
+    ShowViewMixin,
+)
 from clak.views import ListView
 from tests.view_fixtures import USERS, USERS_UNSORTED, _option_flags
 
@@ -748,3 +754,88 @@ def test_view_logging_xdg_mixin_composition():
     assert "DEMO_LOG_COLORS" in help_text
     conf = next(a.default for a in app.parser._actions if a.dest == "xdg_config")
     assert "demo-app" in str(conf)
+
+
+def test_list_view_mixin_limit_offset_cli(capsys):
+    class App(ListViewMixin, Parser):
+        def cli_run(self, **_):
+            return USERS_UNSORTED
+
+    App(parse=False, add_help=False).dispatch(
+        ["--format", "json", "--columns", "name", "--offset", "1", "--limit", "1"]
+    )
+    assert json.loads(capsys.readouterr().out) == [{"name": "grace"}]
+
+
+def test_list_view_mixin_meta_view_limit_and_pager_needs_tty(capsys):
+    class App(ListViewMixin, Parser):
+        class Meta:
+            view_limit = 2
+            view_pager = True
+
+        def cli_run(self, **_):
+            return USERS_UNSORTED
+
+    app = App(parse=False, add_help=False)
+    assert "--limit" in _option_flags(app)
+    app.dispatch(["--width", "content"])
+
+    out = capsys.readouterr().out
+    assert "linus" not in out
+    assert out.endswith("... 1 more row\n")
+
+    class _Runtime:
+        stdout_tty = True
+        pager = None
+
+    assert app._view_pager_command(_Runtime) == "less"
+    _Runtime.stdout_tty = False
+    assert app._view_pager_command(_Runtime) is None
+
+
+def test_list_view_mixin_output_infers_format_and_compresses(tmp_path, capsys):
+    class App(ListViewMixin, Parser):
+        class Meta:
+            view_format = "yaml"
+
+        def cli_run(self, **_):
+            return USERS_UNSORTED
+
+    path = tmp_path / "users.json.gz"
+    App(parse=False, add_help=False).dispatch(
+        ["--output", str(path), "--columns", "name"]
+    )
+
+    assert capsys.readouterr().out == ""
+    with gzip.open(path, "rt") as handle:
+        names = [row["name"] for row in json.load(handle)]
+    assert names == sorted(names)
+
+
+def test_list_view_mixin_output_explicit_format_and_plain_table(tmp_path):
+    class App(ListViewMixin, Parser):
+        def cli_run(self, **_):
+            return USERS
+
+    app = App(parse=False, add_help=False)
+    assert "--output" in _option_flags(app)
+    path = tmp_path / "users.json"
+    app.dispatch(["--output", str(path), "--format", "csv", "--columns", "name"])
+    assert path.read_bytes().startswith(b"name\r\n")
+
+    path = tmp_path / "users.txt"
+    app.dispatch(["--output", str(path)])
+    text = path.read_text()
+    assert text.startswith("+-")
+    assert "\x1b[" not in text
+
+
+def test_data_view_mixin_output_disables_color(tmp_path):
+    class App(DataViewMixin, Parser):
+        def cli_run(self, **_):
+            return {"name": "ada"}
+
+    path = tmp_path / "data.yaml"
+    App(parse=False, add_help=False).dispatch(["--output", str(path), "--color"])
+
+    assert path.read_text() == "name: ada\n\n"
@@ -1,12 +1,30 @@
 """Tests for view dispatch, example scripts, and core view classes."""
 
+import bz2
+import gzip
+import io
+import json
 import logging
+import lzma
+import os
+import shlex
+import sys
 
 import pytest
 
 from clak import Parser, ParserNode
 from clak.comp.views import ListViewMixin
-from clak.views import ListView, PprintView, ShowView
+from clak.views import Columns, ListView, PprintView, ShowView
+from clak.views.base import strip_ansi
+from clak.views.pager import paged_output
+from clak.views.sink import (
+    AtomicFileSink,
+    CaptureSink,
+    FileSink,
+    StdoutSink,
+    format_for_path,
+    output_to,
+)
 from tests.view_fixtures import USERS, _option_flags
 
 pytestmark = pytest.mark.tags("unit-tests")
@@ -131,3 +149,289 @@ def test_example_script_views_runs(capsys):
     assert "ada" in out
     assert "admin" in out
     assert "London" not in out
+
+
+# ---------------------------------------------------------------------------
+# Streaming payloads
+# ---------------------------------------------------------------------------
+
+
+def test_list_view_streams_generator_to_stdout(capsys):
+    def rows():
+        for idx in range(3):
+            yield {"id": idx, "name": f"n{idx}"}
+
+    assert ListView(rows(), format="json").render() is None
+    expected = ListView([dict(id=i, name=f"n{i}") for i in range(3)]).render(
+        format="json", stdout=False
+    )
+    assert capsys.readouterr().out == expected + "\n"
+
+
+def test_list_view_stream_projects_columns():
+    rendered = ListView(iter([{"id": 1, "name": "a"}])).render(
+        format="json", columns=["name"], stdout=False
+    )
+    assert rendered == '[\n  {\n    "name": "a"\n  }\n]\n'
+
+
+def test_list_view_closes_generator_on_broken_pipe(monkeypatch):
+    closed = []
+
+    def rows():
+        try:
+            idx = 0
+            while True:
+                yield {"id": idx}
+                idx += 1
+        finally:
+            closed.append(True)
+
+    class _BrokenStdout:
+        def write(self, _text):
+            raise BrokenPipeError
+
+        def flush(self):
+            pass
+
+    monkeypatch.setattr("sys.stdout", _BrokenStdout())
+    with pytest.raises(BrokenPipeError):
+        ListView(rows(), format="csv").render()
+    assert closed == [True]
+
+
+def test_list_view_ndjson_one_compact_record_per_line(capsys):
+    rows = [{"id": 2, "name": "b"}, {"id": 1, "name": "a"}]
+
+    assert ListView(rows, format="ndjson").render() is None
+    assert capsys.readouterr().out == ('{"id":1,"name":"a"}\n{"id":2,"name":"b"}\n')
+
+    rendered = ListView(iter(rows)).render(
+        format="ndjson", columns=["name"], stdout=False
+    )
+    assert rendered == '{"name":"b"}\n{"name":"a"}\n'
+
+
+@pytest.mark.parametrize("fmt", ["json", "yaml", "ndjson"])
+def test_list_view_columnar_structured_matches_records(fmt):
+    pytest.importorskip("yaml")
+    columns = {"id": [2, 1, 3], "name": ["b", "a", "c"]}
+    records = [{"id": 2, "name": "b"}, {"id": 1, "name": "a"}, {"id": 3, "name": "c"}]
+    opts = {"format": fmt, "columns": ["name", "other"], "limit": 2}
+
+    expected = ListView(records).render(stdout=False, **opts)
+    assert ListView(Columns(columns)).render(stdout=False, **opts) == expected
+
+
+def test_list_view_ndjson_flushes_in_batches(monkeypatch):
+    writes = []
+
+    class _Stdout:
+        def write(self, text):
+            writes.append(text)
+
+        def flush(self):
+            writes.append("<flush>")
+
+    monkeypatch.setattr("sys.stdout", _Stdout())
+    ListView(iter([{"id": idx} for idx in range(5)]), format="ndjson").render(
+        ndjson_batch=2
+    )
+    assert writes == [
+        '{"id":0}\n{"id":1}\n',
+        "<flush>",
+        '{"id":2}\n{"id":3}\n',
+        "<flush>",
+        '{"id":4}\n',
+        "<flush>",
+        "<flush>",
+    ]
+
+
+def test_show_view_ndjson_single_line():
+    rendered = ShowView({"b": 2, "a": 1}).render(format="ndjson", stdout=False)
+    assert rendered == '{"a":1,"b":2}'
+
+
+def test_list_view_limit_offset_after_sort():
+    rows = [{"id": idx} for idx in (4, 2, 0, 3, 1)]
+
+    rendered = ListView(rows).render(format="json", offset=1, limit=2, stdout=False)
+    assert [row["id"] for row in json.loads(rendered)] == [1, 2]
+
+    table = ListView(rows).render(width="min", offset=1, limit=2, stdout=False)
+    assert table.endswith("\n... 2 more rows")
+    assert " 0 " not in strip_ansi(table)
+
+
+def test_list_view_stream_limit_stops_reading_source():
+    pulled = []
+
+    def rows():
+        for idx in range(100):
+            pulled.append(idx)
+            yield {"id": idx}
+
+    rendered = ListView(rows()).render(format="ndjson", limit=2, stdout=False)
+    assert rendered == '{"id":0}\n{"id":1}\n'
+    assert pulled == [0, 1]
+
+    pulled.clear()
+    table = ListView(rows()).render(width="min", offset=1, limit=2, stdout=False)
+    assert table.endswith("\n... more rows")
+    assert pulled == [0, 1, 2, 3]
+
+
+def _python_pager(code):
+    return f"{shlex.quote(sys.executable)} -c {shlex.quote(code)}"
+
+
+def test_paged_output_streams_to_pager(tmp_path):
+    target = tmp_path / "paged.txt"
+    pager = _python_pager(
+        f"import sys; open({str(target)!r}, 'w').write(sys.stdin.read())"
+    )
+    with paged_output(pager):
+        ListView([{"name": "ada"}]).render(width="min")
+
+    assert "ada" in target.read_text()
+
+
+def test_paged_output_stops_producer_when_pager_quits():
+    closed = []
+
+    def rows():
+        try:
+            idx = 0
+            while True:
+                yield {"id": idx, "text": "x" * 60}
+                idx += 1
+        finally:
+            closed.append(True)
+
+    with paged_output(_python_pager("import sys; sys.stdin.readline()")):
+        ListView(rows()).render(width="min")
+
+    assert closed == [True]
+
+
+# ---------------------------------------------------------------------------
+# Output sinks
+# ---------------------------------------------------------------------------
+
+
+def test_output_to_capture_sink_collects_view_output(capsys):
+    with output_to(CaptureSink()) as sink:
+        returned = ListView([{"name": "b"}, {"name": "a"}], format="csv").render()
+        ListView(iter([{"name": "c"}]), format="ndjson").render()
+
+    assert returned == "name\r\na\r\nb\r\n"
+    assert sink.getvalue() == returned + '\n{"name":"c"}\n'
+    assert capsys.readouterr().out == ""
+
+
+def test_file_sink_writes_encoded_text(tmp_path):
+    path = tmp_path / "out.txt"
+    with output_to(FileSink(path, flush_bytes=4)):
+        ListView(iter([{"name": "é"}, {"name": "b"}]), format="csv").render()
+
+    assert path.read_bytes() == "name\r\né\r\nb\r\n\n".encode("utf-8")
+
+
+def test_stdout_sink_keeps_order_with_print(capsys):
+    print("before")
+    ShowView({"name": "World"}, format="json").render()
+    print("after")
+
+    out = capsys.readouterr().out
+    assert out.startswith("before\n{")
+    assert out.endswith("}\n\nafter\n")
+
+
+@pytest.mark.parametrize("write_bytes", [True, False])
+def test_stdout_sink_text_layer_when_newlines_translate(monkeypatch, write_bytes):
+    raw = io.BytesIO()
+    stream = io.TextIOWrapper(raw, encoding="utf-8", newline="\r\n")
+    monkeypatch.setattr(sys, "stdout", stream)
+    monkeypatch.setattr(StdoutSink, "write_bytes", write_bytes)
+    with output_to(StdoutSink()):
+        ShowView({"name": "é"}, format="json").render()
+    stream.flush()
+
+    newline = b"\n" if write_bytes else b"\r\n"
+    assert raw.getvalue() == newline.join(
+        [b"{", b'  "name": "\xc3\xa9"', b"}", b"", b""]
+    )
+
+
+def test_sink_rejects_invalid_flush_bytes():
+    with pytest.raises(ValueError, match="flush_bytes"):
+        CaptureSink(flush_bytes=0)
+
+
+def test_atomic_file_sink_replaces_target_on_close(tmp_path):
+    path = tmp_path / "users.csv"
+    path.write_text("old\n")
+    os.chmod(path, 0o640)
+    with output_to(AtomicFileSink(path)) as sink:
+        ListView(iter([{"name": "b"}, {"name": "a"}]), format="ndjson").render()
+        # Readers still see the old file until the block ends
+        assert path.read_text() == "old\n"
+        assert os.path.exists(sink.temp_path)
+
+    assert path.read_text() == '{"name":"b"}\n{"name":"a"}\n'
+    assert os.stat(path).st_mode & 0o777 == 0o640
+    assert os.listdir(tmp_path) == ["users.csv"]
+
+
+def test_atomic_file_sink_new_file_mode_leaves_umask_alone(tmp_path, monkeypatch):
+    umask = os.umask(0o027)
+    os.umask(umask)
+
+    def no_umask(_mask):
+        raise AssertionError("os.umask() changes process-wide state")
+
+    monkeypatch.setattr(os, "umask", no_umask)
+    path = tmp_path / "users.csv"
+    with output_to(AtomicFileSink(path)):
+        ListView([{"name": "a"}], format="csv").render()
+
+    assert os.stat(path).st_mode & 0o777 == 0o666 & ~umask
+    assert os.listdir(tmp_path) == ["users.csv"]
+
+
+def test_atomic_file_sink_keeps_target_on_error(tmp_path):
+    path = tmp_path / "users.json"
+    path.write_text("old\n")
+
+    def rows():
+        yield {"name": "a"}
+        raise RuntimeError("source failed")
+
+    with pytest.raises(RuntimeError, match="source failed"):
+        with output_to(AtomicFileSink(path)):
+            ListView(rows(), format="ndjson").render()
+
+    assert path.read_text() == "old\n"
+    assert os.listdir(tmp_path) == ["users.json"]
+
+
+@pytest.mark.parametrize(
+    "name,opener",
+    [("out.csv.gz", gzip.open), ("out.csv.bz2", bz2.open), ("out.csv.xz", lzma.open)],
+)
+def test_atomic_file_sink_compresses_by_suffix(tmp_path, name, opener):
+    path = tmp_path / name
+    with output_to(AtomicFileSink(path)):
+        ListView([{"name": "b"}, {"name": "a"}], format="csv").render()
+
+    with opener(path, "rb") as handle:
+        assert handle.read() == b"name\r\na\r\nb\r\n\n"
+
+
+def test_format_for_path_ignores_compression_suffix():
+    assert format_for_path("users.json.gz") == "json"
+    assert format_for_path("users.YML") == "yaml"
+    assert format_for_path("users.jsonl.xz") == "ndjson"
+    assert format_for_path("users.txt") is None
+    assert format_for_path("users.gz") is None